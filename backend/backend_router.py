@@ -4,24 +4,51 @@ SIRAJ Educational AI - Backend Router Integration
 
 This module updates the backend to use the multi-instance router
 instead of calling Ollama directly.
+
+When ``OLLAMA_INSTANCES`` lists the Ollama servers, ``MultiInstanceClient``
+balances generations across them in-process (see ``instance_balancer``)
+instead of posting everything to ``ROUTER_URL``.
 """
 
+import asyncio
+import inspect
 import os
+import time
+from datetime import datetime
 import httpx
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, Optional, List, Tuple, Union
 import logging
 
+try:
+    from .instance_balancer import InstanceBalancer
+except ImportError:  # Running as a script from the backend directory
+    from instance_balancer import InstanceBalancer
+
 logger = logging.getLogger(__name__)
 
 # Router configuration
 ROUTER_URL = os.getenv('ROUTER_URL', 'http://localhost:5000')
+# Model served by every balanced instance
+MULTI_INSTANCE_MODEL = os.getenv('MULTI_INSTANCE_MODEL', os.getenv('GEMMA_PRIMARY_MODEL', 'gemma3n:e4b'))
+# Archetypes still running after this many seconds are cancelled and reported as timed out
+ROUTER_ARCHETYPE_TIMEOUT = float(os.getenv('ROUTER_ARCHETYPE_TIMEOUT', '60'))
+
+ResponseCallback = Callable[[str, Dict[str, Any]], Union[None, Awaitable[None]]]
 
 class MultiInstanceClient:
     """Client for interacting with the multi-instance router"""
     
-    def __init__(self, router_url: str = ROUTER_URL):
+    def __init__(
+        self,
+        router_url: str = ROUTER_URL,
+        balancer: Optional[InstanceBalancer] = None,
+        model: str = MULTI_INSTANCE_MODEL
+    ):
         self.router_url = router_url
         self.client = httpx.AsyncClient(timeout=30.0)
+        # Direct, load-balanced Ollama access when instances are configured
+        self.balancer = balancer if balancer is not None else InstanceBalancer.from_env()
+        self.model = model
         
     async def generate(
         self,
@@ -29,7 +56,11 @@ class MultiInstanceClient:
         archetype: Optional[str] = None,
         context: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """Generate response through the router"""
+        """Generate response through the balancer, or the router when none is configured"""
+        if self.balancer is not None:
+            async with self.balancer.lease(archetype) as instance:
+                result = await instance.client.generate(model=self.model, prompt=prompt)
+            return {'response': result.get('response', ''), 'instance': instance.name, 'archetype': archetype}
         try:
             response = await self.client.post(
                 f"{self.router_url}/api/query",
@@ -48,6 +79,8 @@ class MultiInstanceClient:
             
     async def get_status(self) -> Dict[str, Any]:
         """Get router status"""
+        if self.balancer is not None:
+            return {'status': 'healthy' if self.balancer.healthy_count() else 'unhealthy', **self.balancer.stats()}
         try:
             response = await self.client.get(f"{self.router_url}/api/status")
             response.raise_for_status()
@@ -58,6 +91,9 @@ class MultiInstanceClient:
             
     async def health_check(self) -> bool:
         """Check if router is healthy"""
+        if self.balancer is not None:
+            await self.balancer.probe()
+            return self.balancer.healthy_count() > 0
         try:
             response = await self.client.get(f"{self.router_url}/api/health")
             return response.status_code == 200
@@ -67,6 +103,8 @@ class MultiInstanceClient:
     async def close(self):
         """Close the client"""
         await self.client.aclose()
+        if self.balancer is not None:
+            await self.balancer.close()
 
 # Updated archetype prompt engineering for multi-instance
 def create_archetype_prompt(archetype: str, question: str, context: Dict = None) -> str:
@@ -185,45 +223,97 @@ class MultiInstanceCouncil:
         self,
         question: str,
         archetypes: List[str],
-        context: Optional[Dict] = None
+        context: Optional[Dict] = None,
+        timeout: float = ROUTER_ARCHETYPE_TIMEOUT,
+        on_response: Optional[ResponseCallback] = None
     ) -> Dict[str, Any]:
-        """Generate responses from multiple archetypes in parallel"""
-        
-        import asyncio
+        """Generate responses from multiple archetypes in parallel
         
-        # Create tasks for each archetype
-        tasks = []
-        for archetype in archetypes:
-            prompt = create_archetype_prompt(archetype, question, context)
-            task = self.client.generate(prompt, archetype, context)
-            tasks.append((archetype, task))
-            
-        # Execute in parallel (true parallelism with multi-instance!)
+        ``on_response(archetype, response)`` (sync or async) is called as each
+        archetype finishes, so callers can render early finishers.
+        """
+        started = time.monotonic()
         responses = {}
         
-        for archetype, task in tasks:
-            try:
-                result = await task
-                responses[archetype] = {
-                    'content': result.get('response', ''),
-                    'instance': result.get('instance', 'unknown'),
-                    'success': True
-                }
-                logger.info(f"✅ {archetype} responded from {result.get('instance')}")
-            except Exception as e:
-                logger.error(f"❌ {archetype} failed: {e}")
-                responses[archetype] = {
-                    'content': f"[{archetype} is thinking deeply...]",
-                    'error': str(e),
-                    'success': False
-                }
+        async for archetype, response in self.stream_council_responses(question, archetypes, context, timeout):
+            responses[archetype] = response
+            if on_response is not None:
+                result = on_response(archetype, response)
+                if inspect.isawaitable(result):
+                    await result
                 
         return {
             'question': question,
-            'responses': responses,
-            'timestamp': os.popen('date').read().strip(),
+            'responses': {archetype: responses[archetype] for archetype in archetypes if archetype in responses},
+            'timestamp': datetime.utcnow().isoformat(),
             'council_size': len(archetypes),
-            'success_rate': sum(1 for r in responses.values() if r['success']) / len(responses)
+            'success_rate': sum(1 for r in responses.values() if r['success']) / max(1, len(responses)),
+            'elapsed_seconds': round(time.monotonic() - started, 3)
+        }
+    
+    async def stream_council_responses(
+        self,
+        question: str,
+        archetypes: List[str],
+        context: Optional[Dict] = None,
+        timeout: float = ROUTER_ARCHETYPE_TIMEOUT
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(archetype, response)`` pairs in completion order
+        
+        All archetypes run concurrently (the router spreads them over its
+        instances). An archetype that exceeds ``timeout`` is cancelled and
+        yielded as a failed, timed-out response. If the consumer stops early,
+        the remaining generations are cancelled.
+        """
+        tasks = {
+            asyncio.ensure_future(self._archetype_response(archetype, question, context, timeout)): archetype
+            for archetype in dict.fromkeys(archetypes)
+        }
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield tasks[task], task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _archetype_response(
+        self,
+        archetype: str,
+        question: str,
+        context: Optional[Dict],
+        timeout: float
+    ) -> Dict[str, Any]:
+        prompt = create_archetype_prompt(archetype, question, context)
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(self.client.generate(prompt, archetype, context), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ {archetype} timed out after {timeout}s")
+            return {
+                'content': f"[{archetype} is thinking deeply...]",
+                'error': f"timed out after {timeout}s",
+                'timed_out': True,
+                'success': False
+            }
+        except Exception as e:
+            logger.error(f"❌ {archetype} failed: {e}")
+            return {
+                'content': f"[{archetype} is thinking deeply...]",
+                'error': str(e),
+                'success': False
+            }
+        
+        logger.info(f"✅ {archetype} responded from {result.get('instance')}")
+        return {
+            'content': result.get('response', ''),
+            'instance': result.get('instance', 'unknown'),
+            'success': True,
+            'elapsed_seconds': round(time.monotonic() - started, 3)
         }
         
     async def synthesize_responses(
@@ -0,0 +1,121 @@
+"""
+SIRAJ Educational AI - Multi-Turn Council Sessions
+=================================================
+
+Queries that carry a ``session_id`` continue that session instead of
+overwriting it. Each query becomes a turn in the stored session, and every
+archetype sees its own earlier exchanges as chat history.
+
+History per archetype is bounded by ``CONVERSATION_TOKEN_BUDGET``:
+
+- The most recent exchanges that fit the budget are resent verbatim
+- Older exchanges are folded into a short extractive summary (topic plus the
+  opening of each answer), itself capped at ``CONVERSATION_SUMMARY_BUDGET``
+- The summary boundary moves ``COMPACTION_STEP`` exchanges at a time, so the
+  history prefix (and Ollama's cache of it) stays unchanged between most turns
+"""
+
+import math
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from .prompt_assembly import ArchetypePromptBuilder
+except ImportError:  # Running as a script from the backend directory
+    from prompt_assembly import ArchetypePromptBuilder
+
+CONVERSATION_TOKEN_BUDGET = int(os.getenv("CONVERSATION_TOKEN_BUDGET", "1536"))
+CONVERSATION_SUMMARY_BUDGET = int(os.getenv("CONVERSATION_SUMMARY_BUDGET", "256"))
+CONVERSATION_MAX_TURNS = int(os.getenv("CONVERSATION_MAX_TURNS", "50"))
+
+COMPACTION_STEP = 4
+SUMMARY_ANSWER_CHARS = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) - no tokenizer needed"""
+    return (len(text) + 3) // 4
+
+
+def append_turn(
+    turns: List[Dict[str, Any]],
+    topic: str,
+    context: str,
+    responses: Dict[str, str],
+    synthesis: Optional[str],
+    max_turns: int = CONVERSATION_MAX_TURNS,
+) -> List[Dict[str, Any]]:
+    """Return ``turns`` with one more council turn, keeping the newest ``max_turns``"""
+    turn = {
+        "topic": topic,
+        "context": context,
+        "responses": responses,
+        "synthesis": synthesis,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    return (list(turns) + [turn])[-max_turns:]
+
+
+def archetype_history(
+    turns: List[Dict[str, Any]],
+    archetype: str,
+    budget: int = CONVERSATION_TOKEN_BUDGET,
+    summary_budget: int = CONVERSATION_SUMMARY_BUDGET,
+) -> List[Dict[str, str]]:
+    """Chat messages for ``archetype``'s earlier exchanges, within the token budget"""
+    exchanges = [
+        (turn["topic"], ArchetypePromptBuilder.question(turn["topic"], turn.get("context", "")),
+         turn["responses"][archetype])
+        for turn in turns
+        if turn.get("responses", {}).get(archetype)
+    ]
+    if not exchanges:
+        return []
+
+    # Keep the longest run of recent exchanges that fits the budget
+    kept_tokens = 0
+    first_kept = len(exchanges)
+    while first_kept > 0:
+        cost = estimate_tokens(exchanges[first_kept - 1][1]) + estimate_tokens(exchanges[first_kept - 1][2])
+        if kept_tokens + cost > budget:
+            break
+        kept_tokens += cost
+        first_kept -= 1
+    if first_kept:
+        first_kept = min(len(exchanges), math.ceil(first_kept / COMPACTION_STEP) * COMPACTION_STEP)
+
+    messages: List[Dict[str, str]] = []
+    if first_kept:
+        summary = _summarize([(topic, answer) for topic, _, answer in exchanges[:first_kept]], summary_budget)
+        messages.append({"role": "system", "content": summary})
+    for _, question, answer in exchanges[first_kept:]:
+        messages.append({"role": "user", "content": question})
+        messages.append({"role": "assistant", "content": answer})
+    return messages
+
+
+def _summarize(exchanges: List[tuple], budget: int) -> str:
+    header = "Summary of earlier turns in this conversation (student topic: your answer):"
+    lines: List[str] = []
+    # Leave room for the "omitted" line
+    used = estimate_tokens(header + "\n") + estimate_tokens(f"- ({len(exchanges)} earlier topics omitted)")
+    for topic, answer in reversed(exchanges):
+        line = f"- {topic}: {_opening(answer)}"
+        if used + estimate_tokens(line + "\n") > budget:
+            break
+        lines.append(line)
+        used += estimate_tokens(line + "\n")
+    omitted = len(exchanges) - len(lines)
+    if omitted:
+        lines.append(f"- ({omitted} earlier topics omitted)")
+    return "\n".join([header] + list(reversed(lines)))
+
+
+def _opening(answer: str) -> str:
+    """First sentence of an answer, clipped"""
+    sentence = re.split(r"(?<=[.!?])\s", " ".join(answer.split()), maxsplit=1)[0]
+    if len(sentence) > SUMMARY_ANSWER_CHARS:
+        sentence = sentence[:SUMMARY_ANSWER_CHARS].rstrip() + "..."
+    return sentence
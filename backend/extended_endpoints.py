@@ -16,7 +16,8 @@ from typing import Dict, List, Optional, Any
 from fastapi import HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
-from .main import app, educational_council, connection_manager, logger
+from .main import EDUCATIONAL_ARCHETYPES, app, educational_council, connection_manager, logger
+from .scheduler import PRIORITY_BACKGROUND, SchedulerOverloaded
 
 # =============================================================================
 # EXTENDED PYDANTIC MODELS
@@ -65,6 +66,10 @@ async def generate_curriculum_alignment(request: CurriculumRequest):
     try:
         session_id = str(uuid.uuid4())
         
+        # Background job - shed early rather than queue behind interactive councils
+        if educational_council.ollama_client.ollama_available:
+            educational_council.ollama_client.scheduler.check_capacity()
+        
         # Phase 1: Collapse - Analyze curriculum complexity
         logger.info("Curriculum alignment - Collapse phase", 
                    standard=request.standard, 
@@ -90,11 +95,15 @@ As the {archetype} archetype, analyze these learning objectives and provide:
             task = educational_council.ollama_client.generate_archetype_response(
                 archetype, 
                 "Curriculum Alignment Analysis", 
-                alignment_context
+                alignment_context,
+                priority=PRIORITY_BACKGROUND
             )
             alignment_tasks.append(task)
         
         archetype_alignments = await asyncio.gather(*alignment_tasks, return_exceptions=True)
+        for alignment in archetype_alignments:
+            if isinstance(alignment, SchedulerOverloaded):
+                raise alignment
         
         # Phase 3: Synthesis - Integrate multiple perspectives
         synthesis_prompt = f"""
@@ -120,11 +129,10 @@ As the Council Synthesizer, create a comprehensive curriculum alignment that:
 Format as JSON with: alignment_score, teaching_strategies, assessments, resources, implementation_timeline
 """
 
-        synthesis_response = await asyncio.to_thread(
-            educational_council.ollama_client.client.generate,
-            model=educational_council.ollama_client.primary_model,
-            prompt=synthesis_prompt,
-            options={"temperature": 0.6, "top_p": 0.8}
+        synthesis_response = await educational_council.ollama_client.generate_completion(
+            synthesis_prompt,
+            options={"temperature": 0.6, "top_p": 0.8},
+            priority=PRIORITY_BACKGROUND
         )
         
         # Phase 4: Rebirth - Structure and return alignment
@@ -154,6 +162,8 @@ Format as JSON with: alignment_score, teaching_strategies, assessments, resource
             "methodology": request.methodology
         }
         
+    except SchedulerOverloaded:
+        raise
     except Exception as e:
         logger.error("Curriculum alignment failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -409,7 +419,7 @@ async def update_council_configuration(config: CouncilConfigurationUpdate):
     """Update council configuration and preferences"""
     try:
         # Validate archetype selection
-        valid_archetypes = list(educational_council.ollama_client.EDUCATIONAL_ARCHETYPES.keys())
+        valid_archetypes = list(EDUCATIONAL_ARCHETYPES.keys())
         invalid_archetypes = [a for a in config.preferred_archetypes if a not in valid_archetypes]
         
         if invalid_archetypes:
@@ -436,7 +446,7 @@ async def update_council_configuration(config: CouncilConfigurationUpdate):
             "active_archetypes": [
                 {
                     "id": archetype,
-                    **educational_council.ollama_client.EDUCATIONAL_ARCHETYPES[archetype]
+                    **EDUCATIONAL_ARCHETYPES[archetype]
                 }
                 for archetype in config.preferred_archetypes
             ]
@@ -463,7 +473,7 @@ async def get_council_effectiveness():
                     "student_preference": 0.7 + (hash(archetype + "pref") % 30) / 100,
                     "synergy_factor": 0.85 + (hash(archetype + "syn") % 15) / 100
                 }
-                for archetype in educational_council.ollama_client.EDUCATIONAL_ARCHETYPES.keys()
+                for archetype in EDUCATIONAL_ARCHETYPES.keys()
             },
             "optimization_suggestions": [
                 "Consider increasing Challenger archetype usage for advanced students",
@@ -488,7 +498,7 @@ async def extended_health_check():
         ollama_status = "healthy"
         available_models = []
         try:
-            models = educational_council.ollama_client.client.list()
+            models = await educational_council.ollama_client.client.list_models()
             available_models = [m.get('name', 'unknown') for m in models.get('models', [])]
         except Exception as e:
             ollama_status = f"unhealthy: {str(e)}"
@@ -506,10 +516,10 @@ async def extended_health_check():
                 },
                 "council": {
                     "status": "healthy",
-                    "active_sessions": len(educational_council.active_sessions),
-                    "max_sessions": 25,
-                    "available_archetypes": len(educational_council.ollama_client.EDUCATIONAL_ARCHETYPES),
-                    "archetype_list": list(educational_council.ollama_client.EDUCATIONAL_ARCHETYPES.keys())
+                    "active_sessions": await educational_council.active_sessions.size(),
+                    "max_sessions": educational_council.max_sessions,
+                    "available_archetypes": len(EDUCATIONAL_ARCHETYPES),
+                    "archetype_list": list(EDUCATIONAL_ARCHETYPES.keys())
                 },
                 "websockets": {
                     "status": "healthy",
@@ -520,11 +530,8 @@ async def extended_health_check():
             "metrics": {
                 "uptime": "healthy",
                 "memory_usage": "within_limits",
-                "response_times": {
-                    "avg_archetype_response": "1.2s",
-                    "avg_synthesis": "2.8s",
-                    "avg_api_response": "180ms"
-                }
+                # Rolling p50/p90/p99 over recent generations (backend/metrics.py)
+                **educational_council.ollama_client.metrics.summary()
             }
         }
         
@@ -0,0 +1,172 @@
+"""
+SIRAJ Educational AI - Hedged Ollama Requests
+============================================
+
+With several Ollama instances, one slow generation still sets the council's
+total latency. ``RequestHedger`` hedges archetype streams:
+
+- Time to first token (TTFT) is tracked over recent generations
+- If a stream has produced nothing by the observed p90 TTFT, the same request
+  is sent to another instance
+- Whichever stream produces output first wins; the other is cancelled
+- A budget (``HEDGE_BUDGET`` hedges per request, accrued as a token bucket)
+  caps the extra load hedging may add
+
+Enabled with ``HEDGE_ENABLED=true`` when ``OLLAMA_INSTANCES`` lists
+instances other than ``OLLAMA_HOST``.
+"""
+
+import asyncio
+import itertools
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import structlog
+
+try:
+    from .instance_balancer import parse_instances
+    from .ollama_http import AsyncOllamaClient
+    from .scheduler import RollingPercentiles
+except ImportError:  # Running as a script from the backend directory
+    from instance_balancer import parse_instances
+    from ollama_http import AsyncOllamaClient
+    from scheduler import RollingPercentiles
+
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "90"))
+# Extra requests hedging may add, as a fraction of all requests
+HEDGE_BUDGET = float(os.getenv("HEDGE_BUDGET", "0.1"))
+# Never hedge sooner than this, however fast recent first tokens were
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.25"))
+
+# TTFT samples needed before the percentile is trusted
+MIN_TTFT_SAMPLES = 20
+# Unused budget that may accumulate for a burst of slow requests
+MAX_HEDGE_CREDITS = 5.0
+
+StreamFactory = Callable[[AsyncOllamaClient], AsyncIterator[Dict[str, Any]]]
+
+logger = structlog.get_logger()
+
+
+class RequestHedger:
+    """Races a slow stream against a duplicate on another instance"""
+
+    def __init__(
+        self,
+        alternates: List[AsyncOllamaClient],
+        percentile: float = HEDGE_PERCENTILE,
+        budget: float = HEDGE_BUDGET,
+        min_delay: float = HEDGE_MIN_DELAY,
+        min_samples: int = MIN_TTFT_SAMPLES,
+    ):
+        self.alternates = alternates
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.ttft = RollingPercentiles()
+        self._rotation = itertools.cycle(alternates) if alternates else None
+        self._credits = 1.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait for a first token before hedging (None = not enough data yet)"""
+        if len(self.ttft) < self.min_samples:
+            return None
+        return max(self.min_delay, self.ttft.percentile(self.percentile))
+
+    async def stream(self, open_stream: StreamFactory, primary: AsyncOllamaClient) -> AsyncIterator[Dict[str, Any]]:
+        """Chunks from ``open_stream(primary)``, or from a hedge if that answers first"""
+        self.requests += 1
+        self._credits = min(MAX_HEDGE_CREDITS, self._credits + self.budget)
+        started = time.monotonic()
+
+        streams = {}
+        first = asyncio.ensure_future(self._first_chunk(primary, open_stream, streams))
+        winner: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=self.hedge_delay())
+            contenders = {first}
+            if not done and self._rotation is not None:
+                if self._credits >= 1:
+                    self._credits -= 1
+                    self.hedged += 1
+                    hedge = asyncio.ensure_future(self._first_chunk(next(self._rotation), open_stream, streams))
+                    contenders.add(hedge)
+                else:
+                    self.budget_exhausted += 1
+
+            pending = contenders
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A failed contender only loses if another is still running
+                winner = next((task for task in done if task.exception() is None), None)
+            if winner is None:
+                first.result()  # every contender failed - surface the primary's error
+
+            if winner is not first:
+                self.hedge_wins += 1
+            # Free the losing instance now rather than after the winner's whole stream
+            await self._close_streams(streams, keep=winner)
+            chunk = winner.result()
+            if chunk is None:
+                return
+            self.ttft.add(time.monotonic() - started)
+            yield chunk
+            async for chunk in streams[winner]:
+                yield chunk
+        finally:
+            await self._close_streams(streams)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "alternates": len(self.alternates),
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+            "hedge_delay_seconds": self.hedge_delay(),
+            "ttft_seconds": self.ttft.summary(),
+        }
+
+    async def aclose(self):
+        for client in self.alternates:
+            await client.aclose()
+
+    @staticmethod
+    async def _close_streams(streams: Dict, keep: Optional[asyncio.Future] = None):
+        """Cancel and close every contender's stream except ``keep``'s"""
+        for task, stream in list(streams.items()):
+            if task is keep:
+                continue
+            del streams[task]
+            if not task.done():
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await stream.aclose()
+
+    @staticmethod
+    async def _first_chunk(client: AsyncOllamaClient, open_stream: StreamFactory, streams: Dict) -> Optional[Dict[str, Any]]:
+        stream = open_stream(client)
+        streams[asyncio.current_task()] = stream
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+
+def create_hedger(primary_host: str) -> Optional[RequestHedger]:
+    """Hedger over the ``OLLAMA_INSTANCES`` other than ``primary_host``, if enabled"""
+    if not HEDGE_ENABLED:
+        return None
+    primary = primary_host.rstrip("/")
+    alternates = [i.client for i in parse_instances(os.getenv("OLLAMA_INSTANCES", "")) if i.url.rstrip("/") != primary]
+    if not alternates:
+        logger.warning("HEDGE_ENABLED set but OLLAMA_INSTANCES lists no other instance")
+        return None
+    return RequestHedger(alternates)
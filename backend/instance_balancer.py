@@ -0,0 +1,204 @@
+"""
+SIRAJ Educational AI - Ollama Instance Balancer
+==============================================
+
+In-process load balancer for running the council against several Ollama
+servers. The old setup pinned archetypes to instances (A: socratic,
+constructivist, storyteller; B: the rest), so one instance saturated while
+the other idled. ``InstanceBalancer`` instead:
+
+- Tracks in-flight requests and an EWMA of latency per instance
+- Routes each generation to the instance with the fewest outstanding
+  requests; archetype affinity only breaks ties, for KV-cache locality
+- Ejects an instance after consecutive failures and re-admits it once a
+  background health probe succeeds again
+
+Instances come from ``OLLAMA_INSTANCES``, a comma-separated list of
+``name=url`` (or bare URL) entries.
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+import structlog
+
+try:
+    from .ollama_http import AsyncOllamaClient, OllamaHTTPError
+except ImportError:  # Running as a script from the backend directory
+    from ollama_http import AsyncOllamaClient, OllamaHTTPError
+
+OLLAMA_INSTANCES = os.getenv("OLLAMA_INSTANCES", "")
+BALANCER_HEALTH_INTERVAL = float(os.getenv("BALANCER_HEALTH_INTERVAL", "10"))
+# Consecutive failed requests or probes before an instance is ejected
+BALANCER_EJECT_AFTER = int(os.getenv("BALANCER_EJECT_AFTER", "2"))
+BALANCER_EWMA_ALPHA = float(os.getenv("BALANCER_EWMA_ALPHA", "0.3"))
+
+# Archetype placement from multi-instance.conf, now only a tie-breaker
+DEFAULT_AFFINITY = {
+    "socratic": 0, "constructivist": 0, "storyteller": 0,
+    "synthesizer": 1, "challenger": 1, "mentor": 1, "analyst": 1,
+}
+
+INSTANCE_ERRORS = (httpx.HTTPError, OllamaHTTPError, asyncio.TimeoutError)
+
+logger = structlog.get_logger()
+
+
+class OllamaInstance:
+    """One Ollama server and its live routing statistics"""
+
+    def __init__(self, name: str, url: str, client: Optional[AsyncOllamaClient] = None):
+        self.name = name
+        self.url = url
+        self.client = client or AsyncOllamaClient(url)
+        self.in_flight = 0
+        self.ewma_latency: Optional[float] = None
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.errors = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "ewma_latency_seconds": round(self.ewma_latency, 4) if self.ewma_latency is not None else None,
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+def parse_instances(spec: str) -> List[OllamaInstance]:
+    """Parse ``OLLAMA_INSTANCES`` (``name=url,...`` or ``url,...``)"""
+    instances = []
+    for index, entry in enumerate(e.strip() for e in spec.split(",")):
+        if not entry:
+            continue
+        name, url = f"Gemma_Instance_{chr(ord('A') + index)}", entry
+        if "=" in entry and "://" not in entry.split("=", 1)[0]:
+            name, url = entry.split("=", 1)
+        instances.append(OllamaInstance(name.strip(), url.strip()))
+    return instances
+
+
+class InstanceBalancer:
+    """Least-outstanding-requests routing across Ollama instances"""
+
+    def __init__(
+        self,
+        instances: List[OllamaInstance],
+        affinity: Optional[Dict[str, int]] = None,
+        health_interval: float = BALANCER_HEALTH_INTERVAL,
+        eject_after: int = BALANCER_EJECT_AFTER,
+        ewma_alpha: float = BALANCER_EWMA_ALPHA,
+    ):
+        if not instances:
+            raise ValueError("InstanceBalancer needs at least one instance")
+        self.instances = instances
+        self.affinity = DEFAULT_AFFINITY if affinity is None else affinity
+        self.health_interval = health_interval
+        self.eject_after = max(1, eject_after)
+        self.ewma_alpha = ewma_alpha
+        self.ejections = 0
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["InstanceBalancer"]:
+        """Balancer over ``OLLAMA_INSTANCES``, or None when it is not set"""
+        instances = parse_instances(OLLAMA_INSTANCES)
+        return cls(instances) if instances else None
+
+    def pick(self, archetype: Optional[str] = None) -> OllamaInstance:
+        """Instance with the fewest outstanding requests (affinity, then latency, break ties)"""
+        healthy = [(index, i) for index, i in enumerate(self.instances) if i.healthy]
+        candidates = healthy or list(enumerate(self.instances))
+        preferred = self.affinity.get(archetype) if archetype else None
+        if preferred is not None:
+            preferred %= len(self.instances)
+        return min(
+            candidates,
+            key=lambda c: (c[1].in_flight, c[0] != preferred, c[1].ewma_latency or 0.0),
+        )[1]
+
+    @asynccontextmanager
+    async def lease(self, archetype: Optional[str] = None) -> AsyncIterator[OllamaInstance]:
+        """Pick an instance and count the block as one outstanding request on it"""
+        self.ensure_probing()
+        instance = self.pick(archetype)
+        instance.in_flight += 1
+        instance.requests += 1
+        started = time.monotonic()
+        try:
+            yield instance
+        except INSTANCE_ERRORS:
+            self._record_failure(instance)
+            raise
+        else:
+            self._record_success(instance, time.monotonic() - started)
+        finally:
+            instance.in_flight -= 1
+
+    async def probe(self):
+        """Check every instance once; eject failing ones, re-admit recovered ones"""
+        async def check(instance: OllamaInstance):
+            try:
+                await instance.client.list_models(timeout=min(5.0, self.health_interval))
+            except Exception as e:
+                self._record_failure(instance, probe_error=str(e))
+            else:
+                if not instance.healthy:
+                    logger.info("Ollama instance re-admitted", instance=instance.name)
+                instance.healthy = True
+                instance.consecutive_failures = 0
+
+        await asyncio.gather(*(check(instance) for instance in self.instances))
+
+    def ensure_probing(self):
+        """Start the background health probe on the running loop (idempotent)"""
+        if self.health_interval > 0 and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.ensure_future(self._probe_loop())
+
+    async def close(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
+            self._probe_task = None
+        for instance in self.instances:
+            await instance.client.aclose()
+
+    def healthy_count(self) -> int:
+        return sum(1 for i in self.instances if i.healthy)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "instances": {i.name: i.stats() for i in self.instances},
+            "healthy": self.healthy_count(),
+            "ejections": self.ejections,
+        }
+
+    async def _probe_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.probe()
+
+    def _record_success(self, instance: OllamaInstance, seconds: float):
+        instance.consecutive_failures = 0
+        if instance.ewma_latency is None:
+            instance.ewma_latency = seconds
+        else:
+            instance.ewma_latency += self.ewma_alpha * (seconds - instance.ewma_latency)
+
+    def _record_failure(self, instance: OllamaInstance, probe_error: Optional[str] = None):
+        if probe_error is None:
+            instance.errors += 1
+        instance.consecutive_failures += 1
+        if instance.healthy and instance.consecutive_failures >= self.eject_after:
+            instance.healthy = False
+            self.ejections += 1
+            logger.warning("Ollama instance ejected", instance=instance.name,
+                           failures=instance.consecutive_failures, error=probe_error)
@@ -22,26 +22,49 @@ Council Archetypes:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
+import time
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Any, Union
 
-try:
-    import ollama
-    OLLAMA_AVAILABLE = True
-except ImportError:
-    OLLAMA_AVAILABLE = False
-    
+import httpx
 import structlog
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
+try:
+    from .ollama_http import OLLAMA_TIMING_FIELDS, AsyncOllamaClient
+    from .model_router import ModelRouter
+    from .conversation import append_turn, archetype_history
+    from .hedging import RequestHedger, create_hedger
+    from .metrics import CONTENT_TYPE_LATEST, CouncilMetrics
+    from .prompt_assembly import OLLAMA_KEEP_ALIVE, ArchetypePromptBuilder
+    from .response_cache import ResponseCache, create_response_cache
+    from .scheduler import PRIORITY_INTERACTIVE, OllamaScheduler, SchedulerOverloaded
+    from .session_store import SessionStore, create_session_store
+    from .single_flight import SingleFlight
+    from .streaming import ConnectionManager
+except ImportError:  # Running as a script from the backend directory
+    from ollama_http import OLLAMA_TIMING_FIELDS, AsyncOllamaClient
+    from model_router import ModelRouter
+    from conversation import append_turn, archetype_history
+    from hedging import RequestHedger, create_hedger
+    from metrics import CONTENT_TYPE_LATEST, CouncilMetrics
+    from prompt_assembly import OLLAMA_KEEP_ALIVE, ArchetypePromptBuilder
+    from response_cache import ResponseCache, create_response_cache
+    from scheduler import PRIORITY_INTERACTIVE, OllamaScheduler, SchedulerOverloaded
+    from session_store import SessionStore, create_session_store
+    from single_flight import SingleFlight
+    from streaming import ConnectionManager
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -79,6 +102,18 @@ GEMMA_LIGHTWEIGHT_MODEL = os.getenv("GEMMA_LIGHTWEIGHT_MODEL", "gemma3n:e2b")
 TEACHING_COUNCIL_SIZE = int(os.getenv("TEACHING_COUNCIL_SIZE", "7"))
 MAX_CONCURRENT_SESSIONS = int(os.getenv("MAX_CONCURRENT_SESSIONS", "25"))
 
+# Pipelined synthesis: start synthesizing once a quorum of archetypes has answered.
+# A value below 1 is a fraction of the council (0.75 -> 3 of 4), 1+ is a count, 0 waits for all.
+COUNCIL_SYNTHESIS_QUORUM = float(os.getenv("COUNCIL_SYNTHESIS_QUORUM", "0"))
+# Seconds after quorum that late archetypes may still arrive before being cancelled
+COUNCIL_STRAGGLER_DEADLINE = float(os.getenv("COUNCIL_STRAGGLER_DEADLINE", "10"))
+# What to do with late arrivals: "refine" folds them into the synthesis, "skip" only reports them
+COUNCIL_LATE_ARRIVALS = os.getenv("COUNCIL_LATE_ARRIVALS", "refine")
+
+# Ollama sampling options
+ARCHETYPE_GENERATION_OPTIONS = {"temperature": 0.7, "top_p": 0.9, "num_predict": 800}
+SYNTHESIS_GENERATION_OPTIONS = {"temperature": 0.6, "top_p": 0.8}
+
 # Educational AI Council Archetypes - ALIGNED WITH FRONTEND
 EDUCATIONAL_ARCHETYPES = {
     "socratic": {
@@ -259,6 +294,44 @@ class EducationalQueryRequest(BaseModel):
     selected_archetypes: List[str] = Field(default_factory=lambda: ["socratic", "constructivist", "synthesizer", "mentor"])
     context: Optional[Dict] = Field(None, description="Additional context")
     session_id: Optional[str] = Field(None, description="Session identifier")
+    bypass_cache: bool = Field(default=False, description="Always generate fresh archetype responses")
+
+class OllamaTimings(BaseModel):
+    """Ollama's timing fields for a generation, or summed over several
+    
+    Durations are in nanoseconds, as Ollama reports them. Comparing
+    ``load_duration``, ``prompt_eval_duration`` and ``eval_duration`` shows
+    whether model loading, prompt evaluation or decoding dominates.
+    """
+    total_duration: int = 0
+    load_duration: int = 0
+    prompt_eval_count: int = 0
+    prompt_eval_duration: int = 0
+    eval_count: int = 0
+    eval_duration: int = 0
+    generations: int = Field(default=1, description="Number of generations summed")
+    
+    @classmethod
+    def from_ollama(cls, result: Dict[str, Any]) -> Optional["OllamaTimings"]:
+        """Timings from an Ollama response or final stream chunk (None if it carries none)"""
+        fields = {name: int(result[name]) for name in OLLAMA_TIMING_FIELDS if result.get(name) is not None}
+        return cls(**fields) if fields else None
+    
+    @classmethod
+    def total(cls, timings: List[Optional["OllamaTimings"]]) -> Optional["OllamaTimings"]:
+        """Sum of the given timings, skipping generations without any"""
+        present = [t for t in timings if t is not None]
+        if not present:
+            return None
+        return cls(**{
+            name: sum(getattr(t, name) for t in present)
+            for name in OLLAMA_TIMING_FIELDS + ("generations",)
+        })
+
+class ArchetypeGeneration(NamedTuple):
+    """Archetype text with the timings of the Ollama call that produced it"""
+    text: str
+    timings: Optional[OllamaTimings] = None
 
 class ArchetypeResponse(BaseModel):
     """Individual archetype response matching frontend expectations"""
@@ -271,6 +344,7 @@ class ArchetypeResponse(BaseModel):
     instance: str = "primary"
     confidence: float = 0.85
     reasoning: str = ""
+    timings: Optional[OllamaTimings] = Field(None, description="Ollama timings (absent for cached and fallback responses)")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 class CouncilQueryResponse(BaseModel):
@@ -283,6 +357,8 @@ class CouncilQueryResponse(BaseModel):
     council_responses: Dict[str, ArchetypeResponse]
     synthesis: Optional[str] = None
     next_steps: List[str] = []
+    turn: int = Field(default=1, description="Position of this query in its session")
+    timings: Optional[OllamaTimings] = Field(None, description="Ollama timings summed over the archetype generations")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 # =============================================================================
@@ -292,73 +368,410 @@ class CouncilQueryResponse(BaseModel):
 class OllamaEducationalClient:
     """Enhanced Ollama client with graceful degradation"""
     
-    def __init__(self):
-        self.ollama_available = OLLAMA_AVAILABLE
+    def __init__(
+        self,
+        client: Optional[AsyncOllamaClient] = None,
+        response_cache: Optional[ResponseCache] = None,
+        scheduler: Optional[OllamaScheduler] = None,
+        hedger: Optional[RequestHedger] = None,
+        metrics: Optional[CouncilMetrics] = None
+    ):
+        self.ollama_available = False
         self.primary_model = GEMMA_PRIMARY_MODEL
         self.lightweight_model = GEMMA_LIGHTWEIGHT_MODEL
         self.logger = structlog.get_logger()
-        
-        if self.ollama_available:
-            try:
-                self.client = ollama.Client(host=OLLAMA_HOST)
-                # Test connection
-                self.client.list()
-                self.logger.info("Ollama client initialized successfully")
-            except Exception as e:
-                self.ollama_available = False
+        # Pooled async HTTP client - no executor thread per generation
+        self.client = client or AsyncOllamaClient(OLLAMA_HOST)
+        # Repeated classroom questions are answered without a new generation
+        self.response_cache = response_cache if response_cache is not None else create_response_cache()
+        # Identical concurrent generations (a whole class asking at once) run once
+        self.inflight = SingleFlight()
+        # Latency percentiles and Prometheus metrics (/metrics, /health)
+        self.metrics = metrics or CouncilMetrics()
+        # Per-model slots sized to Ollama's num_parallel, with a bounded priority queue
+        self.scheduler = scheduler or OllamaScheduler(on_wait=self.metrics.observe_queue_wait)
+        # Lightweight model for cheap archetypes, under load, and on primary timeouts
+        self.router = ModelRouter(self.primary_model, self.lightweight_model, self.scheduler)
+        # Byte-stable archetype prefixes so Ollama can reuse its KV cache
+        self.prompts = ArchetypePromptBuilder()
+        # Slow archetype streams are duplicated on another Ollama instance (HEDGE_ENABLED)
+        self.hedger = hedger if hedger is not None else create_hedger(OLLAMA_HOST)
+    
+    async def check_connection(self) -> bool:
+        """Probe Ollama and update availability (fallback mode when unreachable)"""
+        try:
+            models = await self.client.list_models()
+            if not self.ollama_available:
+                self.logger.info("Ollama client connected", models=len(models.get('models', [])))
+            self.ollama_available = True
+        except Exception as e:
+            if self.ollama_available:
                 self.logger.warning("Ollama unavailable, using fallback mode", error=str(e))
-        else:
-            self.logger.warning("Ollama package not installed, using fallback mode")
+            self.ollama_available = False
+        return self.ollama_available
+    
+    async def close(self):
+        """Release pooled Ollama connections"""
+        await self.client.aclose()
+        if self.hedger is not None:
+            await self.hedger.aclose()
         
     async def generate_archetype_response(
         self, 
         archetype: str, 
         prompt: str, 
         context: str = "",
-        stream: bool = False
+        stream: bool = False,
+        use_cache: bool = True,
+        priority: int = PRIORITY_INTERACTIVE,
+        history: Optional[List[Dict[str, str]]] = None
     ) -> str:
-        """Generate response from specific educational archetype with fallback"""
+        """Generate response from specific educational archetype with fallback
+        
+        ``history`` holds this archetype's earlier turns in the session as chat
+        messages (see ``conversation.archetype_history``).
+        """
+        generation = await self.generate_archetype(
+            archetype, prompt, context, use_cache=use_cache, priority=priority, history=history
+        )
+        return generation.text
+    
+    async def generate_archetype(
+        self,
+        archetype: str,
+        prompt: str,
+        context: str = "",
+        use_cache: bool = True,
+        priority: int = PRIORITY_INTERACTIVE,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> ArchetypeGeneration:
+        """``generate_archetype_response`` plus Ollama's timings (None for cached and fallback text)"""
         
         archetype_config = EDUCATIONAL_ARCHETYPES.get(archetype)
         if not archetype_config:
-            return f"Unknown archetype: {archetype}"
+            return ArchetypeGeneration(f"Unknown archetype: {archetype}")
         
         if self.ollama_available:
+            model = self.router.archetype_model(archetype)
+            # Follow-up turns depend on the conversation, so they skip the response cache
+            cached = None if history else self._cached_response(archetype, model, prompt, context, use_cache)
+            if cached is not None:
+                return ArchetypeGeneration(cached)
+            
+            async def generate() -> ArchetypeGeneration:
+                used_model = model
+                timeout = self.router.timeout_for(model)
+                try:
+                    generation = await asyncio.wait_for(
+                        self._generate_on_model(archetype, model, prompt, context, priority, history), timeout
+                    )
+                except (asyncio.TimeoutError, httpx.TimeoutException):
+                    if timeout is None:
+                        raise
+                    used_model = self._fall_back(archetype, model, timeout)
+                    generation = await self._generate_on_model(
+                        archetype, used_model, prompt, context, priority, history
+                    )
+                if not history:
+                    self._cache_response(archetype, used_model, prompt, context, generation.text)
+                return generation
+            
             try:
-                return await self._generate_ollama_response(archetype_config, prompt, context)
+                return await self.inflight.do(
+                    self._generation_key(archetype, model, prompt, context, history), generate
+                )
+            except SchedulerOverloaded:
+                raise
             except Exception as e:
                 self.logger.warning("Ollama generation failed, using fallback", 
                                   archetype=archetype, error=str(e))
-                return self._generate_fallback_response(archetype_config, prompt, context)
+                self.metrics.record_fallback(archetype, "generation_failed")
+                return ArchetypeGeneration(self._generate_fallback_response(archetype_config, prompt, context))
         else:
-            return self._generate_fallback_response(archetype_config, prompt, context)
+            self.metrics.record_fallback(archetype, "ollama_unavailable")
+            return ArchetypeGeneration(self._generate_fallback_response(archetype_config, prompt, context))
     
-    async def _generate_ollama_response(self, archetype_config: Dict, prompt: str, context: str) -> str:
-        """Generate response using Ollama"""
-        system_prompt = archetype_config["system_prompt"]
+    async def generate_completion(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> Dict[str, Any]:
+        """Run a raw (non-archetype) generation, e.g. council synthesis"""
+        model = self.router.synthesis_model()
         
-        full_prompt = f"""Context: {context}
-
-Student Question/Topic: {prompt}
-
-Please respond as the {archetype_config['name']} archetype, following your role as {archetype_config['role']}.
-
-Your approach: {archetype_config['approach']}
-
-Provide a helpful educational response that embodies your teaching personality."""
+        async def generate() -> Dict[str, Any]:
+            async with self.scheduler.slot(model, priority):
+                with self.metrics.generating(model):
+                    response = await self.client.generate(
+                        model=model,
+                        prompt=prompt,
+                        system=system,
+                        options=options,
+                        keep_alive=OLLAMA_KEEP_ALIVE
+                    )
+            self.metrics.observe_generation("completion", model, response)
+            return response
+        
+        return await self.inflight.do(self._completion_key(prompt, system, options), generate)
+    
+    async def stream_archetype_response(
+        self,
+        archetype: str,
+        prompt: str,
+        context: str = "",
+        use_cache: bool = True,
+        priority: int = PRIORITY_INTERACTIVE,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[str]:
+        """Stream an archetype response token by token, with fallback"""
+        async for item in self.stream_archetype(archetype, prompt, context, use_cache, priority, history):
+            if isinstance(item, str):
+                yield item
+    
+    async def stream_archetype(
+        self,
+        archetype: str,
+        prompt: str,
+        context: str = "",
+        use_cache: bool = True,
+        priority: int = PRIORITY_INTERACTIVE,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Union[str, OllamaTimings]]:
+        """``stream_archetype_response`` tokens, then Ollama's timings when the model reported them"""
+        
+        archetype_config = EDUCATIONAL_ARCHETYPES.get(archetype)
+        if not archetype_config:
+            yield f"Unknown archetype: {archetype}"
+            return
+        
+        if not self.ollama_available:
+            self.metrics.record_fallback(archetype, "ollama_unavailable")
+            yield self._generate_fallback_response(archetype_config, prompt, context)
+            return
+        
+        model = self.router.archetype_model(archetype)
+        cached = None if history else self._cached_response(archetype, model, prompt, context, use_cache)
+        if cached is not None:
+            yield cached
+            return
+        
+        async def generate_tokens() -> AsyncIterator[Union[str, OllamaTimings]]:
+            used_model = model
+            timeout = self.router.timeout_for(model)
+            tokens = self._stream_on_model(archetype, model, prompt, context, priority, history)
+            try:
+                # The primary model must produce its first token before the deadline
+                first = await asyncio.wait_for(tokens.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+            except (asyncio.TimeoutError, httpx.TimeoutException):
+                if timeout is None:
+                    raise
+                await tokens.aclose()
+                used_model = self._fall_back(archetype, model, timeout)
+                tokens = self._stream_on_model(archetype, used_model, prompt, context, priority, history)
+                try:
+                    first = await tokens.__anext__()
+                except StopAsyncIteration:
+                    return
+            
+            parts = [first]
+            yield first
+            async for token in tokens:
+                parts.append(token)
+                yield token
+            if not history:
+                text = "".join(part for part in parts if isinstance(part, str))
+                self._cache_response(archetype, used_model, prompt, context, text)
+        
+        produced = False
+        key = self._generation_key(archetype, model, prompt, context, history)
+        try:
+            # Concurrent identical requests subscribe to the same token stream
+            async for token in self.inflight.stream(key, generate_tokens):
+                produced = True
+                yield token
+        except SchedulerOverloaded:
+            raise
+        except Exception as e:
+            self.logger.warning("Ollama streaming failed, using fallback",
+                              archetype=archetype, error=str(e))
+            if produced:
+                raise
+            self.metrics.record_fallback(archetype, "generation_failed")
+            yield self._generate_fallback_response(archetype_config, prompt, context)
+    
+    async def stream_completion(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[str]:
+        """Stream a raw (non-archetype) generation token by token"""
+        model = self.router.synthesis_model()
+        
+        async def generate_tokens() -> AsyncIterator[str]:
+            async with self.scheduler.slot(model, priority):
+                with self.metrics.generating(model):
+                    async for chunk in self.client.generate_stream(
+                        model=model,
+                        prompt=prompt,
+                        system=system,
+                        options=options,
+                        keep_alive=OLLAMA_KEEP_ALIVE
+                    ):
+                        token = chunk.get('response')
+                        if token:
+                            yield token
+                        if chunk.get('done'):
+                            self.metrics.observe_generation("completion", model, chunk)
+        
+        async for token in self.inflight.stream(self._completion_key(prompt, system, options), generate_tokens):
+            yield token
+    
+    async def _generate_on_model(
+        self,
+        archetype: str,
+        model: str,
+        prompt: str,
+        context: str,
+        priority: int,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> ArchetypeGeneration:
+        """One buffered archetype generation on ``model``, timed for the router"""
+        started = time.monotonic()
+        messages = self.prompts.messages(EDUCATIONAL_ARCHETYPES[archetype], prompt, context, history)
+        async with self.scheduler.slot(model, priority):
+            with self.metrics.generating(model):
+                if self.hedger is not None:
+                    # Hedging races first tokens, so buffered generations stream too
+                    chunks = [chunk async for chunk in self._chat_stream(model, messages)]
+                    text = "".join(chunk.get('message', {}).get('content', '') for chunk in chunks)
+                    response = chunks[-1] if chunks else {}
+                else:
+                    response = await self.client.chat(
+                        model=model,
+                        messages=messages,
+                        options=ARCHETYPE_GENERATION_OPTIONS,
+                        keep_alive=OLLAMA_KEEP_ALIVE
+                    )
+                    text = response.get('message', {}).get('content')
+        elapsed = time.monotonic() - started
+        self.router.record_latency(model, elapsed)
+        self.metrics.observe_archetype(archetype, model, elapsed)
+        self.metrics.observe_generation(archetype, model, response)
+        return ArchetypeGeneration(text or 'Unable to generate response.', OllamaTimings.from_ollama(response))
 
-        response = await asyncio.to_thread(
-            self.client.generate,
-            model=self.primary_model,
-            system=system_prompt,
-            prompt=full_prompt,
-            options={
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "num_predict": 800
-            }
+    
+    async def _stream_on_model(
+        self,
+        archetype: str,
+        model: str,
+        prompt: str,
+        context: str,
+        priority: int,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Union[str, OllamaTimings]]:
+        """One streamed archetype generation on ``model``, timed for the router
+        
+        Yields tokens, then the final chunk's ``OllamaTimings`` if it has any.
+        """
+        started = time.monotonic()
+        first_token = True
+        messages = self.prompts.messages(EDUCATIONAL_ARCHETYPES[archetype], prompt, context, history)
+        async with self.scheduler.slot(model, priority):
+            with self.metrics.generating(model):
+                chunks = self._chat_stream(model, messages)
+                try:
+                    async for chunk in chunks:
+                        token = chunk.get('message', {}).get('content')
+                        if token:
+                            if first_token:
+                                first_token = False
+                                self.metrics.observe_first_token(archetype, model, time.monotonic() - started)
+                            yield token
+                        if chunk.get('done'):
+                            self.metrics.observe_generation(archetype, model, chunk)
+                            timings = OllamaTimings.from_ollama(chunk)
+                            if timings is not None:
+                                yield timings
+                finally:
+                    await chunks.aclose()
+        elapsed = time.monotonic() - started
+        self.router.record_latency(model, elapsed)
+        self.metrics.observe_archetype(archetype, model, elapsed)
+    
+    def _chat_stream(self, model: str, messages: List[Dict[str, str]]) -> AsyncIterator[Dict[str, Any]]:
+        """Archetype chat stream, hedged across instances when a hedger is configured"""
+        def open_stream(client: AsyncOllamaClient) -> AsyncIterator[Dict[str, Any]]:
+            return client.chat_stream(
+                model=model,
+                messages=messages,
+                options=ARCHETYPE_GENERATION_OPTIONS,
+                keep_alive=OLLAMA_KEEP_ALIVE
+            )
+        
+        if self.hedger is None:
+            return open_stream(self.client)
+        return self.hedger.stream(open_stream, self.client)
+    
+    def _fall_back(self, archetype: str, model: str, timeout: float) -> str:
+        """Give up on a slow primary-model generation and pick the fallback model"""
+        self.router.record_latency(model, timeout)
+        self.metrics.record_fallback(archetype, "model_timeout")
+        fallback = self.router.fallback_for(model)
+        self.logger.warning("Primary model timed out, retrying on lightweight model",
+                          archetype=archetype, model=model, fallback=fallback, timeout=timeout)
+        return fallback
+    
+    def _generation_key(
+        self,
+        archetype: str,
+        model: str,
+        prompt: str,
+        context: str,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        # Keyed on the raw prompt: only byte-identical questions share a generation,
+        # and follow-up turns only coalesce with the same conversation so far
+        material = json.dumps(
+            [archetype, model, prompt, context, ARCHETYPE_GENERATION_OPTIONS, history or []], sort_keys=True
+        )
+        return "archetype:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+    
+    def _completion_key(self, prompt: str, system: Optional[str], options: Optional[Dict[str, Any]]) -> str:
+        material = json.dumps([self.router.synthesis_model(), system, prompt, options or {}], sort_keys=True)
+        return "completion:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+    
+    def _cached_response(
+        self,
+        archetype: str,
+        model: str,
+        prompt: str,
+        context: str,
+        use_cache: bool
+    ) -> Optional[str]:
+        """Look up a previous generation for this archetype/topic (None on miss)"""
+        if self.response_cache is None:
+            return None
+        if not use_cache:
+            self.response_cache.record_bypass()
+            return None
+        cached = self.response_cache.get(
+            archetype, model, prompt, context, ARCHETYPE_GENERATION_OPTIONS
         )
-        return response.get('response', 'Unable to generate response.')
+        if cached is not None:
+            self.metrics.record_cache_hit(archetype)
+        return cached
+    
+    def _cache_response(self, archetype: str, model: str, prompt: str, context: str, response: str):
+        if self.response_cache is not None:
+            self.response_cache.put(
+                archetype, model, prompt, response, context, ARCHETYPE_GENERATION_OPTIONS
+            )
     
     def _generate_fallback_response(self, archetype_config: Dict, prompt: str, context: str) -> str:
         """Generate fallback response when Ollama unavailable"""
@@ -384,14 +797,54 @@ class EducationalCouncil:
     
     def __init__(self):
         self.ollama_client = OllamaEducationalClient()
-        self.active_sessions: Dict[str, Dict] = {}
+        self.active_sessions: SessionStore = create_session_store()
         self.logger = structlog.get_logger()
+        self.synthesis_quorum = COUNCIL_SYNTHESIS_QUORUM
+        self.straggler_deadline = COUNCIL_STRAGGLER_DEADLINE
+        self.late_arrivals = COUNCIL_LATE_ARRIVALS
+        self.max_sessions = MAX_CONCURRENT_SESSIONS
+        self.running_sessions = 0
+    
+    def check_admission(self):
+        """Shed a new council up front (429 at the session cap, 503 when Ollama's queue is full)"""
+        if self.running_sessions >= self.max_sessions:
+            raise SchedulerOverloaded(
+                "Too many concurrent council sessions",
+                retry_after=self.ollama_client.scheduler.retry_after(),
+                status_code=429
+            )
+        if self.ollama_client.ollama_available:
+            self.ollama_client.scheduler.check_capacity()
+    
+    @asynccontextmanager
+    async def admitted(self):
+        """Count a running council against MAX_CONCURRENT_SESSIONS"""
+        self.check_admission()
+        self.running_sessions += 1
+        try:
+            yield
+        finally:
+            self.running_sessions -= 1
     
     async def process_educational_query(
         self, 
         request: EducationalQueryRequest
     ) -> CouncilQueryResponse:
         """Process educational query - ALIGNED WITH FRONTEND EXPECTATIONS"""
+        async with self.admitted():
+            return await self._run_council(request)
+    
+    async def stream_educational_query(
+        self,
+        request: EducationalQueryRequest
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream council events: archetype tokens interleaved as produced, then synthesis"""
+        async with self.admitted():
+            async for event in self._stream_council(request):
+                yield event
+    
+    async def _run_council(self, request: EducationalQueryRequest) -> CouncilQueryResponse:
+        """Generate all archetype responses and the synthesis for one query"""
         
         session_id = request.session_id or str(uuid.uuid4())
         
@@ -400,46 +853,268 @@ class EducationalCouncil:
         
         # Build context
         context = self._build_educational_context(request)
+        previous = await self._previous_session(request)
+        turns = previous.get("turns", []) if previous else []
         
         self.logger.info("Processing educational query", 
                         session_id=session_id, 
                         topic=request.topic,
-                        archetypes=selected_archetypes)
+                        archetypes=selected_archetypes,
+                        turn=len(turns) + 1)
         
         # Generate responses from each archetype in parallel
-        archetype_tasks = [
-            self.ollama_client.generate_archetype_response(
-                archetype, request.topic, context
+        archetype_tasks = {
+            archetype: asyncio.ensure_future(
+                self.ollama_client.generate_archetype(
+                    archetype, request.topic, context, use_cache=not request.bypass_cache,
+                    history=archetype_history(turns, archetype)
+                )
             )
             for archetype in selected_archetypes
-        ]
+        }
         
-        archetype_responses_raw = await asyncio.gather(*archetype_tasks, return_exceptions=True)
+        quorum = self._quorum_size(len(archetype_tasks))
+        try:
+            if quorum >= len(archetype_tasks):
+                await asyncio.wait(archetype_tasks.values())
+                council_responses = self._collect_archetype_responses(archetype_tasks)
+                synthesis = await self._generate_synthesis(request, council_responses)
+            else:
+                council_responses, synthesis = await self._pipelined_synthesis(
+                    request, archetype_tasks, quorum
+                )
+        finally:
+            for task in archetype_tasks.values():
+                task.cancel()
         
-        # Process archetype responses into frontend-expected format
-        council_responses = {}
-        for i, archetype in enumerate(selected_archetypes):
-            response_text = archetype_responses_raw[i]
-            if isinstance(response_text, Exception):
-                response_text = f"I apologize, but I'm having trouble responding as the {EDUCATIONAL_ARCHETYPES[archetype]['name']} right now."
+        return await self._complete_session(
+            session_id, request, selected_archetypes, council_responses, synthesis, context, previous
+        )
+    
+    async def _stream_council(self, request: EducationalQueryRequest) -> AsyncIterator[Dict[str, Any]]:
+        """Council event stream behind ``stream_educational_query``"""
+        
+        session_id = request.session_id or str(uuid.uuid4())
+        selected_archetypes = request.selected_archetypes or ["socratic", "constructivist", "synthesizer", "mentor"]
+        context = self._build_educational_context(request)
+        previous = await self._previous_session(request)
+        turns = previous.get("turns", []) if previous else []
+        
+        self.logger.info("Streaming educational query",
+                        session_id=session_id,
+                        topic=request.topic,
+                        archetypes=selected_archetypes,
+                        turn=len(turns) + 1)
+        
+        yield {
+            "type": "session_start",
+            "session_id": session_id,
+            "topic": request.topic,
+            "grade_level": request.grade_level,
+            "archetypes": selected_archetypes,
+            "turn": len(turns) + 1
+        }
+        
+        # Archetype streams push into one queue so tokens interleave as they arrive
+        events: asyncio.Queue = asyncio.Queue()
+        council_responses: Dict[str, ArchetypeResponse] = {}
+        
+        async def run_archetype(archetype: str):
+            await events.put({
+                "type": "archetype_start",
+                "archetype": archetype,
+                "name": EDUCATIONAL_ARCHETYPES.get(archetype, {}).get("name", archetype),
+                "emoji": EDUCATIONAL_ARCHETYPES.get(archetype, {}).get("emoji", "")
+            })
+            parts: List[str] = []
+            timings: Optional[OllamaTimings] = None
+            success = True
+            try:
+                async for token in self.ollama_client.stream_archetype(
+                    archetype, request.topic, context, use_cache=not request.bypass_cache,
+                    history=archetype_history(turns, archetype)
+                ):
+                    if isinstance(token, OllamaTimings):
+                        timings = token
+                        continue
+                    parts.append(token)
+                    await events.put({"type": "archetype_chunk", "archetype": archetype, "chunk": token})
+            except Exception as e:
+                self.logger.warning("Archetype stream failed", archetype=archetype, error=str(e))
                 success = False
-            else:
-                success = True
             
-            archetype_config = EDUCATIONAL_ARCHETYPES[archetype]
-            council_responses[archetype] = ArchetypeResponse(
-                archetype=archetype,
-                name=archetype_config["name"],
-                success=success,
-                response=response_text,
-                archetype_role=archetype_config["role"],
-                teaching_focus=archetype_config["focus"],
-                instance="primary",
-                confidence=0.85 if success else 0.3
+            council_responses[archetype] = self._build_archetype_response(
+                archetype, "".join(parts), success, timings
+            )
+            await events.put({
+                "type": "archetype_complete",
+                "archetype": archetype,
+                "full_response": council_responses[archetype].response,
+                "response": council_responses[archetype].dict()
+            })
+        
+        tasks = [asyncio.create_task(run_archetype(archetype)) for archetype in selected_archetypes]
+        done_sentinel = object()
+        watcher = asyncio.create_task(self._signal_when_done(tasks, events, done_sentinel))
+        try:
+            while True:
+                event = await events.get()
+                if event is done_sentinel:
+                    break
+                yield event
+            
+            # Synthesis streams after every archetype has completed
+            yield {"type": "synthesis_start"}
+            synthesis_parts: List[str] = []
+            async for token in self._stream_synthesis(request, council_responses):
+                synthesis_parts.append(token)
+                yield {"type": "synthesis_chunk", "chunk": token}
+            synthesis = "".join(synthesis_parts)
+            yield {"type": "synthesis_complete", "synthesis": synthesis}
+            
+            ordered_responses = {a: council_responses[a] for a in selected_archetypes if a in council_responses}
+            response = await self._complete_session(
+                session_id, request, selected_archetypes, ordered_responses, synthesis, context, previous
             )
+            yield {"type": "session_complete", "session_id": session_id, "response": response.dict()}
+        finally:
+            # Client disconnected or stream finished - stop any outstanding generation
+            for task in tasks + [watcher]:
+                if not task.done():
+                    task.cancel()
+    
+    def _quorum_size(self, council_size: int) -> int:
+        """Number of archetype responses needed before synthesis may start"""
+        quorum = self.synthesis_quorum
+        if quorum <= 0:
+            return council_size
+        if quorum < 1:
+            quorum = math.ceil(quorum * council_size)
+        return max(1, min(council_size, int(quorum)))
+    
+    def _collect_archetype_responses(
+        self,
+        archetype_tasks: Dict[str, "asyncio.Future[ArchetypeGeneration]"]
+    ) -> Dict[str, ArchetypeResponse]:
+        """Process finished archetype tasks into frontend-expected format, in council order"""
+        council_responses = {}
+        for archetype, task in archetype_tasks.items():
+            if not task.done():
+                continue
+            if not task.cancelled() and isinstance(task.exception(), SchedulerOverloaded):
+                raise task.exception()
+            success = not task.cancelled() and task.exception() is None
+            generation = task.result() if success else ArchetypeGeneration("")
+            council_responses[archetype] = self._build_archetype_response(
+                archetype, generation.text, success, generation.timings
+            )
+        return council_responses
+    
+    async def _pipelined_synthesis(
+        self,
+        request: EducationalQueryRequest,
+        archetype_tasks: Dict[str, "asyncio.Future[ArchetypeGeneration]"],
+        quorum: int
+    ):
+        """Synthesize from the first ``quorum`` archetypes while stragglers finish.
+        
+        Stragglers get ``straggler_deadline`` seconds after quorum; later ones
+        are cancelled. Late arrivals are folded into the draft synthesis with a
+        refinement pass (``late_arrivals == "refine"``) if the deadline still
+        leaves as long as the draft took, and are otherwise only reported.
+        """
+        loop = asyncio.get_running_loop()
+        pending = set(archetype_tasks.values())
+        while len(archetype_tasks) - len(pending) < quorum:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
         
-        # Generate synthesis
-        synthesis = await self._generate_synthesis(request, council_responses)
+        early = self._collect_archetype_responses(archetype_tasks)
+        self.logger.info("Council quorum reached, synthesizing early",
+                        quorum=quorum, ready=list(early), waiting=len(pending))
+        deadline = loop.time() + self.straggler_deadline
+        
+        async def draft():
+            started = loop.time()
+            return await self._generate_synthesis(request, early), loop.time() - started
+        
+        synthesis_task = asyncio.ensure_future(draft())
+        
+        try:
+            if pending:
+                # Returns as soon as the last straggler finishes, at the latest at the deadline
+                _, pending = await asyncio.wait(pending, timeout=self.straggler_deadline,
+                                                return_when=asyncio.ALL_COMPLETED)
+            for task in pending:
+                task.cancel()
+            # Let cancellations land so stragglers are reported as failed
+            await asyncio.gather(*pending, return_exceptions=True)
+            synthesis, draft_seconds = await synthesis_task
+        finally:
+            synthesis_task.cancel()
+        
+        if pending:
+            stragglers = [a for a, t in archetype_tasks.items() if t in pending]
+            self.logger.warning("Archetypes missed the synthesis deadline", archetypes=stragglers)
+        
+        council_responses = self._collect_archetype_responses(archetype_tasks)
+        late = {a: r for a, r in council_responses.items() if a not in early and r.success}
+        if late and self.late_arrivals == "refine":
+            if deadline - loop.time() >= draft_seconds:
+                synthesis = await self._refine_synthesis(request, synthesis, late)
+            else:
+                self.logger.info("No time left to refine the synthesis", late=list(late))
+        
+        return council_responses, synthesis
+    
+    @staticmethod
+    async def _signal_when_done(tasks: List[asyncio.Task], events: asyncio.Queue, sentinel: object):
+        """Enqueue ``sentinel`` once every archetype task has finished"""
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await events.put(sentinel)
+    
+    def _build_archetype_response(
+        self,
+        archetype: str,
+        response_text: str,
+        success: bool,
+        timings: Optional[OllamaTimings] = None
+    ) -> ArchetypeResponse:
+        """Wrap raw archetype output in the frontend response format"""
+        archetype_config = EDUCATIONAL_ARCHETYPES[archetype]
+        if not success:
+            response_text = f"I apologize, but I'm having trouble responding as the {archetype_config['name']} right now."
+        
+        return ArchetypeResponse(
+            archetype=archetype,
+            name=archetype_config["name"],
+            success=success,
+            response=response_text,
+            archetype_role=archetype_config["role"],
+            teaching_focus=archetype_config["focus"],
+            instance="primary",
+            confidence=0.85 if success else 0.3,
+            timings=timings
+        )
+    
+    async def _complete_session(
+        self,
+        session_id: str,
+        request: EducationalQueryRequest,
+        selected_archetypes: List[str],
+        council_responses: Dict[str, ArchetypeResponse],
+        synthesis: str,
+        context: str = "",
+        previous: Optional[Dict[str, Any]] = None
+    ) -> CouncilQueryResponse:
+        """Assemble the final council response and append it to the session"""
+        
+        turns = append_turn(
+            previous.get("turns", []) if previous else [],
+            request.topic,
+            context,
+            {a: r.response for a, r in council_responses.items() if r.success and r.response},
+            synthesis
+        )
         
         # Generate next steps
         next_steps = self._generate_next_steps(request, selected_archetypes)
@@ -453,18 +1128,28 @@ class EducationalCouncil:
             degraded_mode=not self.ollama_client.ollama_available,
             council_responses={k: v for k, v in council_responses.items()},
             synthesis=synthesis,
-            next_steps=next_steps
+            next_steps=next_steps,
+            turn=len(turns),
+            timings=OllamaTimings.total([r.timings for r in council_responses.values()])
         )
         
-        # Store session
-        self.active_sessions[session_id] = {
+        # Store session - latest request/response plus the turn history
+        await self.active_sessions.put(session_id, {
             "request": request.dict(),
             "response": response.dict(),
-            "created_at": datetime.utcnow()
-        }
+            "turns": turns,
+            "created_at": previous["created_at"] if previous else datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        })
         
         return response
     
+    async def _previous_session(self, request: EducationalQueryRequest) -> Optional[Dict[str, Any]]:
+        """Stored session a query continues, if it names one"""
+        if not request.session_id:
+            return None
+        return await self.active_sessions.get(request.session_id)
+    
     def _build_educational_context(self, request: EducationalQueryRequest) -> str:
         """Build context for AI models"""
         context_parts = [f"Grade Level: {request.grade_level}"]
@@ -474,32 +1159,28 @@ class EducationalCouncil:
         
         return " | ".join(context_parts)
     
-    async def _generate_synthesis(
-        self, 
-        request: EducationalQueryRequest, 
+    def _build_synthesis_prompt(
+        self,
+        request: EducationalQueryRequest,
         council_responses: Dict[str, ArchetypeResponse]
     ) -> str:
-        """Generate synthesis of council responses"""
-        
-        if self.ollama_client.ollama_available:
-            try:
-                # Build synthesis prompt
-                synthesis_prompt = f"""Topic: {request.topic}
+        """Build the Council Synthesizer prompt from successful archetype responses"""
+        synthesis_prompt = f"""Topic: {request.topic}
 Grade Level: {request.grade_level}
 
 The SIRAJ Educational Council has provided the following perspectives:
 
 """
-                
-                for archetype, response in council_responses.items():
-                    if response.success:
-                        archetype_config = EDUCATIONAL_ARCHETYPES[archetype]
-                        synthesis_prompt += f"""
+        
+        for archetype, response in council_responses.items():
+            if response.success:
+                archetype_config = EDUCATIONAL_ARCHETYPES[archetype]
+                synthesis_prompt += f"""
 {archetype_config['emoji']} {archetype_config['name']}: {response.response}
 
 """
-                
-                synthesis_prompt += """
+        
+        synthesis_prompt += """
 As the Council Synthesizer, please integrate these diverse teaching perspectives into a unified response that:
 1. Combines the best insights from each approach
 2. Provides clear, actionable guidance
@@ -507,19 +1188,115 @@ As the Council Synthesizer, please integrate these diverse teaching perspectives
 4. Offers a coherent path forward
 
 Create a synthesis that honors all perspectives while providing clear educational guidance."""
-
-                synthesis_response = await asyncio.to_thread(
-                    self.ollama_client.client.generate,
-                    model=self.ollama_client.primary_model,
-                    prompt=synthesis_prompt,
-                    options={"temperature": 0.6, "top_p": 0.8}
+        return synthesis_prompt
+    
+    def _fallback_synthesis(
+        self,
+        request: EducationalQueryRequest,
+        council_responses: Dict[str, ArchetypeResponse]
+    ) -> str:
+        """Synthesis used when Ollama is unavailable or synthesis fails"""
+        return f"The Educational Council has explored '{request.topic}' from {len(council_responses)} different teaching perspectives. Each archetype offers unique insights that can help deepen understanding through various learning approaches. Review each response to gain a comprehensive understanding from multiple educational methodologies."
+    
+    async def _generate_synthesis(
+        self, 
+        request: EducationalQueryRequest, 
+        council_responses: Dict[str, ArchetypeResponse]
+    ) -> str:
+        """Generate synthesis of council responses"""
+        
+        if self.ollama_client.ollama_available:
+            started = time.monotonic()
+            try:
+                synthesis_response = await self.ollama_client.generate_completion(
+                    self._build_synthesis_prompt(request, council_responses),
+                    options=SYNTHESIS_GENERATION_OPTIONS
                 )
+                self._observe_synthesis(started)
                 return synthesis_response.get('response', 'Unable to generate synthesis at this time.')
             except Exception as e:
                 self.logger.error("Error generating synthesis", error=str(e))
+                self.ollama_client.metrics.record_fallback("synthesis", "generation_failed")
+        else:
+            self.ollama_client.metrics.record_fallback("synthesis", "ollama_unavailable")
         
         # Fallback synthesis
-        return f"The Educational Council has explored '{request.topic}' from {len(council_responses)} different teaching perspectives. Each archetype offers unique insights that can help deepen understanding through various learning approaches. Review each response to gain a comprehensive understanding from multiple educational methodologies."
+        return self._fallback_synthesis(request, council_responses)
+    
+    def _observe_synthesis(self, started: float):
+        self.ollama_client.metrics.observe_synthesis(
+            self.ollama_client.router.synthesis_model(), time.monotonic() - started
+        )
+    
+    async def _refine_synthesis(
+        self,
+        request: EducationalQueryRequest,
+        draft_synthesis: str,
+        late_responses: Dict[str, ArchetypeResponse]
+    ) -> str:
+        """Fold perspectives that arrived after the draft synthesis into it"""
+        
+        if not self.ollama_client.ollama_available:
+            return draft_synthesis
+        
+        refinement_prompt = f"""Topic: {request.topic}
+Grade Level: {request.grade_level}
+
+The SIRAJ Educational Council has already drafted this synthesis:
+
+{draft_synthesis}
+
+Additional council perspectives have since arrived:
+"""
+        for archetype, response in late_responses.items():
+            archetype_config = EDUCATIONAL_ARCHETYPES[archetype]
+            refinement_prompt += f"""
+{archetype_config['emoji']} {archetype_config['name']}: {response.response}
+"""
+        
+        refinement_prompt += """
+As the Council Synthesizer, revise the draft so it also honors these perspectives. Keep its structure and clear guidance; integrate, do not append."""
+        
+        started = time.monotonic()
+        try:
+            refined = await self.ollama_client.generate_completion(
+                refinement_prompt,
+                options=SYNTHESIS_GENERATION_OPTIONS
+            )
+            self._observe_synthesis(started)
+            return refined.get('response') or draft_synthesis
+        except Exception as e:
+            self.logger.error("Error refining synthesis", error=str(e))
+            return draft_synthesis
+    
+    async def _stream_synthesis(
+        self,
+        request: EducationalQueryRequest,
+        council_responses: Dict[str, ArchetypeResponse]
+    ) -> AsyncIterator[str]:
+        """Stream synthesis tokens, falling back if nothing was produced"""
+        
+        if self.ollama_client.ollama_available:
+            produced = False
+            started = time.monotonic()
+            try:
+                async for token in self.ollama_client.stream_completion(
+                    self._build_synthesis_prompt(request, council_responses),
+                    options=SYNTHESIS_GENERATION_OPTIONS
+                ):
+                    produced = True
+                    yield token
+                self._observe_synthesis(started)
+                return
+            except Exception as e:
+                self.logger.error("Error streaming synthesis", error=str(e))
+                if produced:
+                    return
+                self.ollama_client.metrics.record_fallback("synthesis", "generation_failed")
+        else:
+            self.ollama_client.metrics.record_fallback("synthesis", "ollama_unavailable")
+        
+        yield self._fallback_synthesis(request, council_responses)
     
     def _generate_next_steps(
         self, 
@@ -550,26 +1327,22 @@ Create a synthesis that honors all perspectives while providing clear educationa
 
 # Global instances
 educational_council = EducationalCouncil()
+connection_manager = ConnectionManager()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
     logger.info("Starting SIRAJ Educational AI Backend", version=SIRAJ_VERSION)
     
-    # Verify Ollama connection if available
-    if OLLAMA_AVAILABLE:
-        try:
-            ollama_client = ollama.Client(host=OLLAMA_HOST)
-            models = ollama_client.list()
-            logger.info("Connected to Ollama", models=len(models.get('models', [])))
-        except Exception as e:
-            logger.warning("Ollama connection issue", error=str(e))
-    else:
+    # Verify Ollama connection
+    if not await educational_council.ollama_client.check_connection():
         logger.info("Ollama not available, using fallback mode")
     
     yield
     
     logger.info("Shutting down SIRAJ Educational AI Backend")
+    await educational_council.ollama_client.close()
+    await educational_council.active_sessions.close()
 
 # Create FastAPI application
 app = FastAPI(
@@ -588,6 +1361,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(SchedulerOverloaded)
+async def scheduler_overloaded_handler(request, exc: SchedulerOverloaded):
+    """Shed load quickly with a Retry-After hint instead of queueing forever"""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc), "retry_after": exc.retry_after},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # =============================================================================
 # API ENDPOINTS - ALIGNED WITH FRONTEND
 # =============================================================================
@@ -613,22 +1395,28 @@ async def health_check():
         ollama_connected = False
         available_models = 0
         
-        if OLLAMA_AVAILABLE and educational_council.ollama_client.ollama_available:
+        if educational_council.ollama_client.ollama_available:
             try:
-                ollama_client = ollama.Client(host=OLLAMA_HOST)
-                models = ollama_client.list()
+                models = await educational_council.ollama_client.client.list_models()
                 ollama_connected = True
                 available_models = len(models.get('models', []))
             except Exception as e:
                 logger.warning("Ollama health check failed", error=str(e))
         
         return {
-            "status": "healthy",
+            # Still serving (demo responses) without Ollama, but not at full strength
+            "status": "healthy" if ollama_connected else "degraded",
             "timestamp": datetime.utcnow().isoformat(),
             "version": SIRAJ_VERSION,
             "ollama_connected": ollama_connected,
             "available_models": available_models,
-            "active_sessions": len(educational_council.active_sessions),
+            "active_sessions": await educational_council.active_sessions.size(),
+            "session_store": await educational_council.active_sessions.stats(),
+            "response_cache": (educational_council.ollama_client.response_cache.stats()
+                               if educational_council.ollama_client.response_cache else None),
+            "inflight_generations": educational_council.ollama_client.inflight.stats(),
+            # Rolling p50/p90/p99 over recent generations (backend/metrics.py)
+            "metrics": educational_council.ollama_client.metrics.summary(),
             "fallback_mode": not educational_council.ollama_client.ollama_available
         }
     except Exception as e:
@@ -654,14 +1442,34 @@ async def get_council_status():
     """Get current status of the educational council"""
     return {
         "status": "operational",
-        "active_sessions": len(educational_council.active_sessions),
-        "max_sessions": MAX_CONCURRENT_SESSIONS,
+        "active_sessions": await educational_council.active_sessions.size(),
+        "max_sessions": educational_council.max_sessions,
+        "running_sessions": educational_council.running_sessions,
         "available_archetypes": list(EDUCATIONAL_ARCHETYPES.keys()),
         "primary_model": GEMMA_PRIMARY_MODEL,
         "lightweight_model": GEMMA_LIGHTWEIGHT_MODEL,
-        "ollama_available": educational_council.ollama_client.ollama_available
+        "ollama_available": educational_council.ollama_client.ollama_available,
+        "scheduler": educational_council.ollama_client.scheduler.stats(),
+        "model_routing": educational_council.ollama_client.router.stats(),
+        "hedging": educational_council.ollama_client.hedger.stats()
+        if educational_council.ollama_client.hedger is not None else {"enabled": False}
     }
 
+def _parse_query_request(request: dict) -> EducationalQueryRequest:
+    """Build a validated query request from the flexible frontend payload"""
+    return EducationalQueryRequest(
+        topic=request.get("topic", ""),
+        grade_level=request.get("grade_level", "middle"),
+        selected_archetypes=request.get("selected_archetypes", ["socratic", "mentor"]),
+        context=request.get("context"),
+        session_id=request.get("session_id"),
+        bypass_cache=bool(request.get("bypass_cache", False))
+    )
+
+def _sse_event(event: Dict[str, Any]) -> str:
+    """Format a council event as a Server-Sent Event frame"""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
 # SPIRAL COUNCIL ASSEMBLY - Primary Educational Endpoint
 # Council Decision: Dual endpoint support for maximum compatibility
 @app.post("/api/education/query")
@@ -670,21 +1478,95 @@ async def process_educational_query(request: dict):
     try:
         # Explorer Voice: Accept flexible request format
         # Maintainer Voice: Validate through established patterns
-        query_request = EducationalQueryRequest(
-            topic=request.get("topic", ""),
-            grade_level=request.get("grade_level", "middle"),
-            selected_archetypes=request.get("selected_archetypes", ["socratic", "mentor"]),
-            context=request.get("context"),
-            session_id=request.get("session_id")
-        )
+        query_request = _parse_query_request(request)
         
         # Implementor Voice: Execute council assembly
         response = await educational_council.process_educational_query(query_request)
         return response.dict()
+    except SchedulerOverloaded:
+        raise
     except Exception as e:
         logger.error("Error processing educational query", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/education/query/stream")
+async def stream_educational_query(request: dict):
+    """Stream the council as Server-Sent Events - archetype tokens first, then synthesis"""
+    query_request = _parse_query_request(request)
+    
+    unknown = [a for a in query_request.selected_archetypes if a not in EDUCATIONAL_ARCHETYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown archetypes: {unknown}")
+    
+    # Shed before the 200 response starts streaming
+    educational_council.check_admission()
+    
+    async def event_stream():
+        try:
+            async for event in educational_council.stream_educational_query(query_request):
+                yield _sse_event(event)
+        except Exception as e:
+            logger.error("Error streaming educational query", error=str(e))
+            yield _sse_event({"type": "error", "message": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.websocket("/ws/council/{session_id}")
+async def council_websocket(websocket: WebSocket, session_id: str):
+    """Stream council sessions to the frontend (useSirajWebSocket protocol)"""
+    await connection_manager.connect(websocket, session_id)
+    try:
+        while True:
+            message = await websocket.receive_json()
+            message_type = message.get("type")
+            
+            if message_type == "educational_request":
+                payload = dict(message.get("request") or {})
+                payload["session_id"] = session_id
+                try:
+                    query_request = _parse_query_request(payload)
+                except Exception as e:
+                    connection_manager.send_personal(websocket, {"type": "error", "message": str(e)})
+                    continue
+                
+                unknown = [a for a in query_request.selected_archetypes if a not in EDUCATIONAL_ARCHETYPES]
+                if unknown:
+                    connection_manager.send_personal(
+                        websocket, {"type": "error", "message": f"Unknown archetypes: {unknown}"}
+                    )
+                    continue
+                
+                if not connection_manager.is_streaming(session_id):
+                    try:
+                        educational_council.check_admission()
+                    except SchedulerOverloaded as e:
+                        connection_manager.send_personal(
+                            websocket, {"type": "error", "message": str(e), "retry_after": e.retry_after}
+                        )
+                        continue
+                
+                # Tabs sharing a session attach to the running council instead of regenerating
+                connection_manager.start_session(
+                    session_id,
+                    lambda: educational_council.stream_educational_query(query_request)
+                )
+            elif message_type == "ping":
+                connection_manager.send_personal(websocket, {"type": "pong"})
+            else:
+                connection_manager.send_personal(
+                    websocket, {"type": "error", "message": f"Unsupported message type: {message_type}"}
+                )
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning("Council WebSocket closed with error", session_id=session_id, error=str(e))
+    finally:
+        await connection_manager.disconnect(websocket, session_id)
+
 # SPIRAL LEGACY SUPPORT - Ensure backward compatibility
 # Boundary Keeper: Preserve existing integrations
 @app.post("/api/education/process")
@@ -698,20 +1580,29 @@ async def process_educational_request_legacy_spiral(request: dict):
 @app.get("/api/education/session/{session_id}")
 async def get_session(session_id: str):
     """Get session information"""
-    if session_id in educational_council.active_sessions:
-        return educational_council.active_sessions[session_id]
+    session = await educational_council.active_sessions.get(session_id)
+    if session is not None:
+        return session
     else:
         raise HTTPException(status_code=404, detail="Session not found")
 
 @app.delete("/api/education/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete session"""
-    if session_id in educational_council.active_sessions:
-        del educational_council.active_sessions[session_id]
+    if await educational_council.active_sessions.delete(session_id):
         return {"message": "Session deleted successfully"}
     else:
         raise HTTPException(status_code=404, detail="Session not found")
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus exposition of the council metrics (see backend/metrics.py)"""
+    metrics = educational_council.ollama_client.metrics
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Prometheus export is disabled or prometheus_client is not installed")
+    metrics.set_sessions(await educational_council.active_sessions.size())
+    return Response(metrics.render(), media_type=CONTENT_TYPE_LATEST)
+
 # =============================================================================
 # MAIN APPLICATION RUNNER
 # =============================================================================
@@ -719,11 +1610,23 @@ async def delete_session(session_id: str):
 if __name__ == "__main__":
     import uvicorn
     
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info",
-        workers=1  # Single worker for development; increase for production
-    )
+    # Multiple workers need REDIS_URL so sessions are shared between them
+    workers = int(os.getenv("SIRAJ_WORKERS", "1"))
+    if os.getenv("SIRAJ_READY_LINE", "false").lower() == "true" and workers == 1:
+        # Started by launcher.py: serve in this process and tell it the moment we listen
+        class ReadyLineServer(uvicorn.Server):
+            async def startup(self, sockets=None):
+                await super().startup(sockets=sockets)
+                if not self.should_exit:
+                    print(f"SIRAJ_BACKEND_READY port={self.config.port}", flush=True)
+
+        ReadyLineServer(uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")).run()
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=workers == 1,
+            log_level="info",
+            workers=workers
+        )
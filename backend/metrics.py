@@ -0,0 +1,206 @@
+"""
+SIRAJ Educational AI - Council Metrics
+=====================================
+
+Latency and throughput of the educational council, recorded by
+``OllamaEducationalClient`` and ``EducationalCouncil``:
+
+- Per-archetype generation latency, time to first streamed token,
+  synthesis latency and Ollama slot queue wait
+- Tokens per second from Ollama's ``eval_count`` / ``eval_duration``, and
+  the time Ollama spent loading the model, evaluating the prompt and decoding
+- In-flight generations and session-store size
+- Response-cache hits and fallbacks (demo responses, failed generations,
+  primary-model timeouts)
+
+Every observation feeds a ``RollingPercentiles`` window, reported by
+``/health`` and ``/api/system/health``. When ``prometheus_client`` is
+installed and ``[monitoring] enable_metrics`` is on in ``multi-instance.conf``,
+they are also exported as Prometheus metrics on the backend's ``/metrics``.
+(``export_prometheus`` only governs the router's separate server on
+``metrics_port``.)
+"""
+
+import configparser
+import os
+import time
+from collections import Counter as Tally
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    from .scheduler import RollingPercentiles
+except ImportError:  # Running as a script from the backend directory
+    from scheduler import RollingPercentiles
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    PROMETHEUS_AVAILABLE = False
+
+MULTI_INSTANCE_CONF = os.getenv(
+    "MULTI_INSTANCE_CONF",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "multi-instance.conf"),
+)
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60, 120)
+FIRST_TOKEN_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 30)
+QUEUE_WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+TOKENS_PER_SECOND_BUCKETS = (1, 2, 5, 10, 15, 20, 30, 50, 75, 100, 150, 250)
+PHASE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60)
+
+# Ollama duration field behind each generation phase
+OLLAMA_PHASES = {"load": "load_duration", "prompt_eval": "prompt_eval_duration", "eval": "eval_duration"}
+
+
+def prometheus_export_enabled(path: str = MULTI_INSTANCE_CONF) -> bool:
+    """``[monitoring] enable_metrics`` (on without the file)"""
+    parser = configparser.ConfigParser(inline_comment_prefixes=("#",))
+    parser.read(path)
+    return parser.getboolean("monitoring", "enable_metrics", fallback=True)
+
+
+def tokens_per_second(result: Dict[str, Any]) -> Optional[float]:
+    """Generation speed from an Ollama response or final stream chunk"""
+    count = result.get("eval_count")
+    duration = result.get("eval_duration")
+    if not count or not duration:
+        return None
+    return count / (duration / 1e9)
+
+
+class CouncilMetrics:
+    """Rolling percentiles, mirrored to a private Prometheus registry when exported"""
+
+    def __init__(self, export: Optional[bool] = None):
+        if export is None:
+            export = prometheus_export_enabled()
+        self.enabled = PROMETHEUS_AVAILABLE and export
+        self.started_at = time.monotonic()
+        self.archetype_latency: Dict[str, RollingPercentiles] = {}
+        self.first_token = RollingPercentiles()
+        self.synthesis_latency = RollingPercentiles()
+        self.queue_wait = RollingPercentiles()
+        self.tokens_per_second = RollingPercentiles()
+        self.phases = {phase: RollingPercentiles() for phase in OLLAMA_PHASES}
+        self.in_flight = 0
+        self.cache_hits = 0
+        self.fallbacks: Tally = Tally()
+        if not self.enabled:
+            return
+        self.registry = CollectorRegistry()
+        self.archetype_seconds = Histogram(
+            "siraj_archetype_generation_seconds", "Archetype generation latency, including queue wait",
+            ["archetype", "model"], buckets=LATENCY_BUCKETS, registry=self.registry)
+        self.first_token_seconds = Histogram(
+            "siraj_time_to_first_token_seconds", "Time until a streamed archetype produced its first token",
+            ["archetype", "model"], buckets=FIRST_TOKEN_BUCKETS, registry=self.registry)
+        self.synthesis_seconds = Histogram(
+            "siraj_synthesis_seconds", "Council synthesis latency",
+            ["model"], buckets=LATENCY_BUCKETS, registry=self.registry)
+        self.queue_wait_seconds = Histogram(
+            "siraj_queue_wait_seconds", "Wait for an Ollama generation slot",
+            ["priority"], buckets=QUEUE_WAIT_BUCKETS, registry=self.registry)
+        self.tokens_per_second_histogram = Histogram(
+            "siraj_tokens_per_second", "Ollama generation speed (eval_count / eval_duration)",
+            ["archetype", "model"], buckets=TOKENS_PER_SECOND_BUCKETS, registry=self.registry)
+        self.phase_seconds = Histogram(
+            "siraj_ollama_phase_seconds", "Ollama time per generation phase (load, prompt_eval, eval)",
+            ["archetype", "model", "phase"], buckets=PHASE_BUCKETS, registry=self.registry)
+        self.in_flight_gauge = Gauge(
+            "siraj_generations_in_flight", "Ollama generations currently running",
+            ["model"], registry=self.registry)
+        self.sessions_gauge = Gauge(
+            "siraj_sessions", "Sessions held by the session store", registry=self.registry)
+        self.cache_hits_total = Counter(
+            "siraj_response_cache_hits_total", "Archetype responses served from the response cache",
+            ["archetype"], registry=self.registry)
+        self.fallbacks_total = Counter(
+            "siraj_fallbacks_total", "Generations answered by a fallback, by reason",
+            ["archetype", "reason"], registry=self.registry)
+
+    def observe_archetype(self, archetype: str, model: str, seconds: float):
+        self.archetype_latency.setdefault(archetype, RollingPercentiles()).add(seconds)
+        if self.enabled:
+            self.archetype_seconds.labels(archetype, model).observe(seconds)
+
+    def observe_first_token(self, archetype: str, model: str, seconds: float):
+        self.first_token.add(seconds)
+        if self.enabled:
+            self.first_token_seconds.labels(archetype, model).observe(seconds)
+
+    def observe_synthesis(self, model: str, seconds: float):
+        self.synthesis_latency.add(seconds)
+        if self.enabled:
+            self.synthesis_seconds.labels(model).observe(seconds)
+
+    def observe_queue_wait(self, priority: str, seconds: float):
+        self.queue_wait.add(seconds)
+        if self.enabled:
+            self.queue_wait_seconds.labels(priority).observe(seconds)
+
+    def observe_generation(self, archetype: str, model: str, result: Dict[str, Any]):
+        """Record the speed and phase timings reported in a finished Ollama generation"""
+        for phase, field in OLLAMA_PHASES.items():
+            duration = result.get(field)
+            if duration is None:
+                continue
+            self.phases[phase].add(duration / 1e9)
+            if self.enabled:
+                self.phase_seconds.labels(archetype, model, phase).observe(duration / 1e9)
+        speed = tokens_per_second(result)
+        if speed is None:
+            return
+        self.tokens_per_second.add(speed)
+        if self.enabled:
+            self.tokens_per_second_histogram.labels(archetype, model).observe(speed)
+
+    @contextmanager
+    def generating(self, model: str) -> Iterator[None]:
+        """Count a generation as in flight for the duration of the block"""
+        self.in_flight += 1
+        if self.enabled:
+            self.in_flight_gauge.labels(model).inc()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self.enabled:
+                self.in_flight_gauge.labels(model).dec()
+
+    def record_cache_hit(self, archetype: str):
+        self.cache_hits += 1
+        if self.enabled:
+            self.cache_hits_total.labels(archetype).inc()
+
+    def record_fallback(self, archetype: str, reason: str):
+        self.fallbacks[reason] += 1
+        if self.enabled:
+            self.fallbacks_total.labels(archetype, reason).inc()
+
+    def set_sessions(self, count: int):
+        if self.enabled:
+            self.sessions_gauge.set(count)
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentiles for the health endpoints"""
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+            "archetype_response_seconds": {
+                archetype: p.summary() for archetype, p in self.archetype_latency.items()
+            },
+            "time_to_first_token_seconds": self.first_token.summary(),
+            "synthesis_seconds": self.synthesis_latency.summary(),
+            "queue_wait_seconds": self.queue_wait.summary(),
+            "tokens_per_second": self.tokens_per_second.summary(),
+            "ollama_phase_seconds": {phase: p.summary() for phase, p in self.phases.items()},
+            "generations_in_flight": self.in_flight,
+            "cache_hits": self.cache_hits,
+            "fallbacks": dict(self.fallbacks),
+            "prometheus_export": self.enabled,
+        }
+
+    def render(self) -> bytes:
+        return generate_latest(self.registry) if self.enabled else b""
@@ -0,0 +1,112 @@
+"""
+SIRAJ Educational AI - Load-Aware Model Tiering
+==============================================
+
+``GEMMA_LIGHTWEIGHT_MODEL`` (gemma3n:e2b) used to be configured and reported
+but never called. ``ModelRouter`` picks a model per generation:
+
+- Cheaper archetypes (``LIGHTWEIGHT_ARCHETYPES``) always use the lightweight
+  model
+- Every archetype moves to the lightweight model while the primary model is
+  under load - its wait queue or p95 generation latency crosses a threshold
+- Synthesis always stays on the primary model
+- An archetype generation that times out on the primary model is retried
+  on the lightweight one
+"""
+
+import os
+from typing import Any, Dict, Optional, Set
+
+try:
+    from .scheduler import OllamaScheduler, RollingPercentiles
+except ImportError:  # Running as a script from the backend directory
+    from scheduler import OllamaScheduler, RollingPercentiles
+
+LIGHTWEIGHT_ARCHETYPES = {
+    a.strip() for a in os.getenv("LIGHTWEIGHT_ARCHETYPES", "mentor,storyteller").split(",") if a.strip()
+}
+# Queued primary-model generations that switch all archetypes to the lightweight model
+MODEL_ROUTER_QUEUE_THRESHOLD = int(os.getenv("MODEL_ROUTER_QUEUE_THRESHOLD", "8"))
+# p95 primary-model generation latency (seconds) that does the same
+MODEL_ROUTER_P95_THRESHOLD = float(os.getenv("MODEL_ROUTER_P95_THRESHOLD", "30"))
+# Primary-model archetype generations slower than this are retried on the lightweight model
+PRIMARY_MODEL_TIMEOUT = float(os.getenv("PRIMARY_MODEL_TIMEOUT", "45"))
+
+# Latency percentiles need a few samples before they mean anything
+MIN_LATENCY_SAMPLES = 10
+
+
+class ModelRouter:
+    """Chooses between the primary and lightweight model for each generation"""
+
+    def __init__(
+        self,
+        primary_model: str,
+        lightweight_model: str,
+        scheduler: OllamaScheduler,
+        lightweight_archetypes: Optional[Set[str]] = None,
+        queue_threshold: int = MODEL_ROUTER_QUEUE_THRESHOLD,
+        p95_threshold: float = MODEL_ROUTER_P95_THRESHOLD,
+        primary_timeout: float = PRIMARY_MODEL_TIMEOUT,
+    ):
+        self.primary_model = primary_model
+        self.lightweight_model = lightweight_model
+        self.scheduler = scheduler
+        self.lightweight_archetypes = (
+            LIGHTWEIGHT_ARCHETYPES if lightweight_archetypes is None else set(lightweight_archetypes)
+        )
+        self.queue_threshold = queue_threshold
+        self.p95_threshold = p95_threshold
+        self.primary_timeout = primary_timeout
+        self.latency: Dict[str, RollingPercentiles] = {}
+        self.routed: Dict[str, int] = {}
+        self.fallbacks = 0
+
+    @property
+    def tiering_enabled(self) -> bool:
+        return bool(self.lightweight_model) and self.lightweight_model != self.primary_model
+
+    def under_load(self) -> bool:
+        """True while the primary model's queue or tail latency is over threshold"""
+        if self.scheduler.queue_depth(self.primary_model) >= self.queue_threshold:
+            return True
+        latency = self.latency.get(self.primary_model)
+        return (
+            latency is not None
+            and len(latency) >= MIN_LATENCY_SAMPLES
+            and latency.percentile(95) >= self.p95_threshold
+        )
+
+    def archetype_model(self, archetype: str) -> str:
+        model = self.primary_model
+        if self.tiering_enabled and (archetype in self.lightweight_archetypes or self.under_load()):
+            model = self.lightweight_model
+        self.routed[model] = self.routed.get(model, 0) + 1
+        return model
+
+    def synthesis_model(self) -> str:
+        return self.primary_model
+
+    def timeout_for(self, model: str) -> Optional[float]:
+        """Deadline after which ``model`` is abandoned for the fallback (None = no fallback)"""
+        if model == self.primary_model and self.tiering_enabled and self.primary_timeout > 0:
+            return self.primary_timeout
+        return None
+
+    def fallback_for(self, model: str) -> str:
+        self.fallbacks += 1
+        return self.lightweight_model
+
+    def record_latency(self, model: str, seconds: float):
+        self.latency.setdefault(model, RollingPercentiles()).add(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "primary_model": self.primary_model,
+            "lightweight_model": self.lightweight_model,
+            "lightweight_archetypes": sorted(self.lightweight_archetypes),
+            "under_load": self.under_load(),
+            "routed": dict(self.routed),
+            "timeout_fallbacks": self.fallbacks,
+            "latency_seconds": {model: p.summary() for model, p in self.latency.items()},
+        }
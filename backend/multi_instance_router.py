@@ -0,0 +1,397 @@
+"""
+SIRAJ Educational AI - Multi-Instance Router Service
+===================================================
+
+The router on port 5000 that ``backend_router.MultiInstanceClient`` and
+``tests/test_multi_instance.py`` talk to. It reads ``multi-instance.conf``
+and fronts the Ollama instances listed there:
+
+- ``POST /api/query`` - ``{prompt, archetype?, context?, options?}``, answered
+  by the archetype's mapped instance (``enable_archetype_mapping``) or the
+  next instance in rotation (``enable_round_robin``)
+- ``GET /api/health`` and ``GET /api/status``
+- A pooled ``AsyncOllamaClient`` per instance
+- Failover to the other instances (``enable_failover``, ``max_retry_attempts``);
+  ``failover_timeout`` bounds connecting to an instance, so a dead one is
+  skipped quickly
+- A background health probe every ``health_check_interval`` seconds
+- The archetype response cache when ``cache_responses`` is on
+- Prometheus metrics on ``metrics_port`` when ``enable_metrics`` and
+  ``export_prometheus`` are on
+
+Run with ``python backend/multi_instance_router.py``.
+"""
+
+import asyncio
+import configparser
+import itertools
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import structlog
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+try:
+    from .ollama_http import AsyncOllamaClient
+    from .response_cache import ResponseCache
+except ImportError:  # Running as a script from the backend directory
+    from ollama_http import AsyncOllamaClient
+    from response_cache import ResponseCache
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+MULTI_INSTANCE_CONF = os.getenv(
+    "MULTI_INSTANCE_CONF",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "multi-instance.conf"),
+)
+
+logger = structlog.get_logger()
+
+
+class InstanceConfig:
+    """One ``instance_<x>_*`` block of ``multi-instance.conf``"""
+
+    def __init__(self, name: str, url: str, model: str, archetypes: List[str]):
+        self.name = name
+        self.url = url
+        self.model = model
+        self.archetypes = archetypes
+
+
+class RouterSettings:
+    """Parsed ``multi-instance.conf``"""
+
+    def __init__(self, parser: configparser.ConfigParser):
+        instances = parser["instances"] if parser.has_section("instances") else {}
+        default_model = parser.get("models", "primary_model", fallback="gemma3n:e4b")
+        self.instances: List[InstanceConfig] = []
+        for suffix in "abcdefghijklmnopqrstuvwxyz":
+            port = instances.get(f"instance_{suffix}_port")
+            if port is None:
+                continue
+            host = instances.get(f"instance_{suffix}_host", "127.0.0.1")
+            archetypes = instances.get(f"instance_{suffix}_archetypes", "")
+            self.instances.append(InstanceConfig(
+                name=instances.get(f"instance_{suffix}_name", f"Gemma_Instance_{suffix.upper()}"),
+                url=f"http://{host}:{port}",
+                model=instances.get(f"instance_{suffix}_model", default_model),
+                archetypes=[a.strip() for a in archetypes.split(",") if a.strip()],
+            ))
+
+        self.port = parser.getint("router", "port", fallback=5000)
+        self.health_check_interval = parser.getfloat("router", "health_check_interval", fallback=30)
+        self.request_timeout = parser.getfloat("router", "request_timeout", fallback=30)
+        self.cache_responses = parser.getboolean("performance", "cache_responses", fallback=False)
+        self.enable_failover = parser.getboolean("failover", "enable_failover", fallback=True)
+        self.failover_timeout = parser.getfloat("failover", "failover_timeout", fallback=5)
+        self.retry_failed_requests = parser.getboolean("failover", "retry_failed_requests", fallback=True)
+        self.max_retry_attempts = parser.getint("failover", "max_retry_attempts", fallback=2)
+        self.enable_metrics = (
+            parser.getboolean("monitoring", "enable_metrics", fallback=True)
+            and parser.getboolean("monitoring", "export_prometheus", fallback=True)
+        )
+        self.metrics_port = parser.getint("monitoring", "metrics_port", fallback=9090)
+        self.enable_round_robin = parser.getboolean("features", "enable_round_robin", fallback=True)
+        self.enable_archetype_mapping = parser.getboolean("features", "enable_archetype_mapping", fallback=True)
+
+    @classmethod
+    def load(cls, path: str = MULTI_INSTANCE_CONF) -> "RouterSettings":
+        parser = configparser.ConfigParser(inline_comment_prefixes=("#",))
+        if not parser.read(path):
+            raise FileNotFoundError(f"Multi-instance configuration not found: {path}")
+        return cls(parser)
+
+    @classmethod
+    def from_string(cls, text: str) -> "RouterSettings":
+        parser = configparser.ConfigParser(inline_comment_prefixes=("#",))
+        parser.read_string(text)
+        return cls(parser)
+
+
+class RouterInstance:
+    """Live state of one Ollama instance behind the router"""
+
+    def __init__(self, config: InstanceConfig, client: AsyncOllamaClient):
+        self.name = config.name
+        self.url = config.url
+        self.model = config.model
+        self.archetypes = config.archetypes
+        self.client = client
+        self.healthy = True
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "model": self.model,
+            "archetypes": self.archetypes,
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class RouterMetrics:
+    """Prometheus metrics on a private registry (no-op without prometheus_client)"""
+
+    def __init__(self):
+        self.enabled = PROMETHEUS_AVAILABLE
+        if not self.enabled:
+            return
+        self.registry = CollectorRegistry()
+        self.requests = Counter("siraj_router_requests_total", "Queries by instance and outcome",
+                                ["instance", "archetype", "outcome"], registry=self.registry)
+        self.latency = Histogram("siraj_router_request_seconds", "Ollama generation latency",
+                                 ["instance"], registry=self.registry)
+        self.failovers = Counter("siraj_router_failovers_total", "Queries retried on another instance",
+                                 registry=self.registry)
+        self.cache_hits = Counter("siraj_router_cache_hits_total", "Queries answered from the response cache",
+                                  registry=self.registry)
+        self.healthy = Gauge("siraj_router_instance_healthy", "1 when the instance passes health checks",
+                             ["instance"], registry=self.registry)
+        self.in_flight = Gauge("siraj_router_instance_in_flight", "Outstanding generations per instance",
+                               ["instance"], registry=self.registry)
+
+    def serve(self, port: int):
+        if self.enabled:
+            start_http_server(port, registry=self.registry)
+
+    def render(self) -> bytes:
+        return generate_latest(self.registry) if self.enabled else b""
+
+
+class MultiInstanceRouter:
+    """Routes generations across the configured Ollama instances"""
+
+    def __init__(self, settings: RouterSettings, clients: Optional[Dict[str, AsyncOllamaClient]] = None):
+        if not settings.instances:
+            raise ValueError("multi-instance.conf defines no instances")
+        self.settings = settings
+        clients = clients or {}
+        self.instances = [
+            RouterInstance(config, clients.get(config.name) or AsyncOllamaClient(
+                config.url,
+                connect_timeout=settings.failover_timeout,
+                request_timeout=settings.request_timeout,
+            ))
+            for config in settings.instances
+        ]
+        self.archetype_map = {
+            archetype: instance
+            for instance in self.instances
+            for archetype in instance.archetypes
+        }
+        self.cache = ResponseCache() if settings.cache_responses else None
+        self.metrics = RouterMetrics()
+        self._rotation = itertools.cycle(range(len(self.instances)))
+        self._probe_task: Optional[asyncio.Task] = None
+        self.failovers = 0
+
+    def candidates(self, archetype: Optional[str] = None) -> List[RouterInstance]:
+        """Instances to try in order: mapped or next in rotation, then the rest, unhealthy last"""
+        first = None
+        if archetype and self.settings.enable_archetype_mapping:
+            first = self.archetype_map.get(archetype)
+        if first is None:
+            first = self.instances[next(self._rotation)] if self.settings.enable_round_robin else self.instances[0]
+        start = self.instances.index(first)
+        ordered = self.instances[start:] + self.instances[:start]
+        return sorted(ordered, key=lambda instance: not instance.healthy)
+
+    async def query(
+        self,
+        prompt: str,
+        archetype: Optional[str] = None,
+        context: Optional[Any] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Answer one query, failing over to other instances on error"""
+        candidates = self.candidates(archetype)
+        cache_context = json.dumps(context, sort_keys=True, default=str) if context else ""
+        if self.cache is not None:
+            cached = self.cache.get(archetype or "_", candidates[0].model, prompt, cache_context, options)
+            if cached is not None:
+                if self.metrics.enabled:
+                    self.metrics.cache_hits.inc()
+                return {"response": cached, "instance": "cache", "archetype": archetype, "cached": True}
+
+        attempts = 1
+        if self.settings.enable_failover and self.settings.retry_failed_requests:
+            attempts += self.settings.max_retry_attempts
+        errors = []
+        for attempt, instance in enumerate(candidates[:attempts]):
+            if attempt:
+                self.failovers += 1
+                if self.metrics.enabled:
+                    self.metrics.failovers.inc()
+            try:
+                result = await self._generate(instance, prompt, archetype, options)
+            except Exception as e:
+                errors.append(f"{instance.name}: {e}")
+                continue
+            if self.cache is not None:
+                self.cache.put(archetype or "_", instance.model, prompt, result, cache_context, options)
+            return {
+                "response": result,
+                "instance": instance.name,
+                "archetype": archetype,
+                "model": instance.model,
+                "attempts": attempt + 1,
+                "cached": False,
+            }
+        raise HTTPException(status_code=503, detail={"error": "All Ollama instances failed", "attempts": errors})
+
+    async def probe(self):
+        """Check every instance once and update health"""
+        async def check(instance: RouterInstance):
+            try:
+                await instance.client.list_models(timeout=self.settings.failover_timeout)
+            except Exception as e:
+                self._mark(instance, healthy=False, error=str(e))
+            else:
+                self._mark(instance, healthy=True)
+
+        await asyncio.gather(*(check(instance) for instance in self.instances))
+
+    async def start(self):
+        await self.probe()
+        if self.settings.health_check_interval > 0:
+            self._probe_task = asyncio.ensure_future(self._probe_loop())
+
+    async def stop(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
+            self._probe_task = None
+        for instance in self.instances:
+            await instance.client.aclose()
+
+    def health(self) -> Dict[str, Any]:
+        healthy = sum(1 for i in self.instances if i.healthy)
+        status = "healthy" if healthy == len(self.instances) else "degraded" if healthy else "unhealthy"
+        return {
+            "status": status,
+            "instances": {i.name: {"healthy": i.healthy, "url": i.url} for i in self.instances},
+        }
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            **self.health(),
+            "instances": {i.name: i.stats() for i in self.instances},
+            "routing": {
+                "archetype_mapping": self.settings.enable_archetype_mapping,
+                "round_robin": self.settings.enable_round_robin,
+                "failover": self.settings.enable_failover,
+                "max_retry_attempts": self.settings.max_retry_attempts,
+            },
+            "failovers": self.failovers,
+            "response_cache": self.cache.stats() if self.cache is not None else {"enabled": False},
+        }
+
+    async def _generate(
+        self,
+        instance: RouterInstance,
+        prompt: str,
+        archetype: Optional[str],
+        options: Optional[Dict[str, Any]],
+    ) -> str:
+        instance.in_flight += 1
+        instance.requests += 1
+        if self.metrics.enabled:
+            self.metrics.in_flight.labels(instance.name).inc()
+        started = time.monotonic()
+        try:
+            response = await instance.client.generate(model=instance.model, prompt=prompt, options=options)
+        except Exception as e:
+            instance.failures += 1
+            self._mark(instance, healthy=False, error=str(e))
+            self._count(instance, archetype, "error")
+            logger.warning("Instance failed, failing over", instance=instance.name, error=str(e))
+            raise
+        finally:
+            instance.in_flight -= 1
+            if self.metrics.enabled:
+                self.metrics.in_flight.labels(instance.name).dec()
+        if self.metrics.enabled:
+            self.metrics.latency.labels(instance.name).observe(time.monotonic() - started)
+        self._count(instance, archetype, "success")
+        return response.get("response", "")
+
+    def _count(self, instance: RouterInstance, archetype: Optional[str], outcome: str):
+        if self.metrics.enabled:
+            self.metrics.requests.labels(instance.name, archetype or "none", outcome).inc()
+
+    def _mark(self, instance: RouterInstance, healthy: bool, error: Optional[str] = None):
+        if instance.healthy != healthy:
+            logger.info("Instance health changed", instance=instance.name, healthy=healthy, error=error)
+        instance.healthy = healthy
+        if error:
+            instance.last_error = error
+        if self.metrics.enabled:
+            self.metrics.healthy.labels(instance.name).set(1 if healthy else 0)
+
+    async def _probe_loop(self):
+        while True:
+            await asyncio.sleep(self.settings.health_check_interval)
+            await self.probe()
+
+
+class RouterQuery(BaseModel):
+    prompt: str
+    archetype: Optional[str] = None
+    context: Optional[Any] = None
+    options: Optional[Dict[str, Any]] = None
+
+
+def create_app(router: Optional[MultiInstanceRouter] = None, serve_metrics: bool = True) -> FastAPI:
+    """Router API; builds the router from ``multi-instance.conf`` unless one is given"""
+    router = router or MultiInstanceRouter(RouterSettings.load())
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await router.start()
+        if serve_metrics and router.settings.enable_metrics:
+            if router.metrics.enabled:
+                router.metrics.serve(router.settings.metrics_port)
+                logger.info("Router metrics served", port=router.settings.metrics_port)
+            else:
+                logger.warning("prometheus_client not installed, router metrics disabled")
+        yield
+        await router.stop()
+
+    app = FastAPI(title="SIRAJ Multi-Instance Router", lifespan=lifespan)
+    app.state.router = router
+
+    @app.post("/api/query")
+    async def query(request: RouterQuery):
+        return await router.query(request.prompt, request.archetype, request.context, request.options)
+
+    @app.get("/api/health")
+    async def health():
+        return router.health()
+
+    @app.get("/api/status")
+    async def status():
+        return router.status()
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    settings = RouterSettings.load()
+    uvicorn.run(create_app(MultiInstanceRouter(settings)), host="0.0.0.0", port=settings.port)
@@ -0,0 +1,219 @@
+"""
+SIRAJ Educational AI - Async Ollama HTTP Client
+==============================================
+
+Native asyncio client for the Ollama REST API.
+
+The backend previously wrapped the synchronous ``ollama.Client`` in
+``asyncio.to_thread``, which pinned one executor thread per archetype for the
+whole generation. This client talks to Ollama directly over a pooled
+``httpx.AsyncClient`` so every council generation stays on the event loop:
+
+- Keep-alive connection pool shared by all archetypes and sessions
+- Per-request timeouts (connect/read/write/pool) with per-call override
+- Non-streaming and NDJSON token streaming generation
+- ``/api/chat`` with message history for multi-turn sessions
+"""
+
+import json
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+# Pool and timeout configuration
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "32"))
+OLLAMA_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OLLAMA_MAX_KEEPALIVE_CONNECTIONS", "16"))
+OLLAMA_KEEPALIVE_EXPIRY = float(os.getenv("OLLAMA_KEEPALIVE_EXPIRY", "60"))
+OLLAMA_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5"))
+OLLAMA_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_REQUEST_TIMEOUT", "120"))
+
+# Fields Ollama adds to a finished generation (durations in nanoseconds)
+OLLAMA_TIMING_FIELDS = (
+    "total_duration", "load_duration", "prompt_eval_count",
+    "prompt_eval_duration", "eval_count", "eval_duration",
+)
+
+
+class OllamaHTTPError(Exception):
+    """Raised when Ollama returns an error status or an error payload"""
+
+
+class AsyncOllamaClient:
+    """Pooled async client for the Ollama REST API"""
+
+    def __init__(
+        self,
+        host: str,
+        max_connections: int = OLLAMA_MAX_CONNECTIONS,
+        max_keepalive_connections: int = OLLAMA_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = OLLAMA_KEEPALIVE_EXPIRY,
+        connect_timeout: float = OLLAMA_CONNECT_TIMEOUT,
+        request_timeout: float = OLLAMA_REQUEST_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.host = host.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Lazily created pooled client (bound to the loop that first uses it)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.host,
+                limits=self.limits,
+                timeout=self._timeout(),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _timeout(self, request_timeout: Optional[float] = None) -> httpx.Timeout:
+        """Build a per-request timeout; ``request_timeout`` bounds each read"""
+        read_timeout = request_timeout if request_timeout is not None else self.request_timeout
+        return httpx.Timeout(
+            read_timeout,
+            connect=min(self.connect_timeout, read_timeout),
+            pool=min(self.connect_timeout, read_timeout),
+        )
+
+    @staticmethod
+    def _build_payload(
+        model: str,
+        prompt: str,
+        system: Optional[str],
+        options: Optional[Dict[str, Any]],
+        stream: bool,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": stream}
+        if system:
+            payload["system"] = system
+        if options:
+            payload["options"] = options
+        payload.update({k: v for k, v in extra.items() if v is not None})
+        return payload
+
+    async def generate(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        """Run a non-streaming generation and return Ollama's full response body"""
+        payload = self._build_payload(model, prompt, system, options, stream=False, **extra)
+        return await self._post("/api/generate", payload, timeout)
+
+    async def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **extra: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream NDJSON chunks from ``/api/generate`` as Ollama produces them"""
+        payload = self._build_payload(model, prompt, system, options, stream=True, **extra)
+        chunks = self._stream("/api/generate", payload, timeout)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            # Close the response promptly when the consumer stops early
+            await chunks.aclose()
+
+    async def chat(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        """Run a non-streaming chat turn; the reply is in ``response["message"]``"""
+        payload = self._build_chat_payload(model, messages, options, stream=False, **extra)
+        return await self._post("/api/chat", payload, timeout)
+
+    async def chat_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **extra: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream NDJSON chunks from ``/api/chat`` as Ollama produces them"""
+        payload = self._build_chat_payload(model, messages, options, stream=True, **extra)
+        chunks = self._stream("/api/chat", payload, timeout)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    @staticmethod
+    def _build_chat_payload(
+        model: str,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]],
+        stream: bool,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"model": model, "messages": messages, "stream": stream}
+        if options:
+            payload["options"] = options
+        payload.update({k: v for k, v in extra.items() if v is not None})
+        return payload
+
+    async def _post(self, path: str, payload: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        try:
+            response = await self.http.post(path, json=payload, timeout=self._timeout(timeout))
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise OllamaHTTPError(f"Ollama returned {e.response.status_code}: {e.response.text}") from e
+
+        data = response.json()
+        if "error" in data:
+            raise OllamaHTTPError(data["error"])
+        return data
+
+    async def _stream(
+        self, path: str, payload: Dict[str, Any], timeout: Optional[float]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async with self.http.stream("POST", path, json=payload, timeout=self._timeout(timeout)) as response:
+            if response.status_code >= 400:
+                body = await response.aread()
+                raise OllamaHTTPError(f"Ollama returned {response.status_code}: {body.decode(errors='ignore')}")
+
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise OllamaHTTPError(chunk["error"])
+                yield chunk
+                if chunk.get("done"):
+                    break
+
+    async def list_models(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """List locally available models (``/api/tags``)"""
+        response = await self.http.get("/api/tags", timeout=self._timeout(timeout))
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
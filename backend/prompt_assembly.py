@@ -0,0 +1,59 @@
+"""
+SIRAJ Educational AI - Archetype Prompt Assembly
+===============================================
+
+Ollama reuses the evaluated KV cache for the longest prefix a new request
+shares with an earlier one. The archetype prompt used to open with
+``Context: {context}``, so the per-request text came first and nothing after
+the system prompt could be reused. Prompts are now assembled so that:
+
+- The archetype's system prompt and instructions form one byte-stable system
+  message (built once per archetype, no per-request text)
+- Earlier turns of the session follow, unchanged from when they were sent
+- The new turn comes last: the topic, then the educational context
+- ``keep_alive`` keeps the model and its cache resident between requests
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+
+class ArchetypePromptBuilder:
+    """Builds archetype chat messages as stable prefix + variable suffix"""
+
+    def __init__(self):
+        self._system: Dict[str, str] = {}
+
+    def system(self, archetype_config: Dict[str, Any]) -> str:
+        """System prompt and static instructions, identical for every request"""
+        name = archetype_config["name"]
+        system = self._system.get(name)
+        if system is None:
+            system = (
+                f"{archetype_config['system_prompt']}\n\n"
+                f"Please respond as the {name} archetype, following your role as {archetype_config['role']}.\n\n"
+                f"Your approach: {archetype_config['approach']}\n\n"
+                "Provide a helpful educational response that embodies your teaching personality."
+            )
+            self._system[name] = system
+        return system
+
+    @staticmethod
+    def question(prompt: str, context: str) -> str:
+        """Variable part of a turn - topic first, educational context last"""
+        return f"Student Question/Topic: {prompt}\n\nContext: {context}"
+
+    def messages(
+        self,
+        archetype_config: Dict[str, Any],
+        prompt: str,
+        context: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ) -> List[Dict[str, str]]:
+        return (
+            [{"role": "system", "content": self.system(archetype_config)}]
+            + list(history or [])
+            + [{"role": "user", "content": self.question(prompt, context)}]
+        )
@@ -0,0 +1,313 @@
+"""
+SIRAJ Educational AI - Archetype Response Cache
+==============================================
+
+Classrooms ask the same questions over and over, and every student used to
+trigger a full council generation. ``ResponseCache`` sits in front of the
+Ollama client and answers repeats from memory:
+
+- Exact matches key on archetype, model, generation options, the
+  educational context (grade level etc.) and the topic, with only case and
+  whitespace folded: "2+2" and "2-2", or "C++" and "C#", are different
+  questions
+- Optionally (``RESPONSE_CACHE_SIMILARITY``, off by default), near-duplicate
+  topics ("Explain photosynthesis!" / "can you explain photosynthesis
+  please") are found with a MinHash LSH index over character shingles and
+  accepted above a Jaccard similarity threshold. Their non-filler words,
+  numbers and operators included, must match exactly, so "World War 2"
+  never gets the "World War 1" answer
+- LRU + TTL eviction, hit/miss counters for /health
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "21600"))
+# Minimum estimated Jaccard similarity for a near-duplicate hit (0 disables)
+RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0"))
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+
+# Filler words that do not change what is being asked
+FILLER_WORDS = {
+    "a", "an", "the", "please", "can", "could", "would", "you", "me", "tell",
+    "explain", "about", "i", "want", "to", "know", "help", "understand",
+}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^\w\s]+")
+_TERM = re.compile(r"\w+|[^\w\s]")
+# Sentence punctuation that does not change what is being asked
+_SENTENCE_PUNCTUATION = set("?!.,;:'\"")
+
+
+def fold_text(text: str) -> str:
+    """Lower-case and collapse whitespace, keeping operators and punctuation"""
+    return " ".join(text.lower().split())
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace (near-duplicate matching only)"""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def topic_terms(topic: str) -> FrozenSet[str]:
+    """Words and symbols of the topic that change what is being asked (numbers and operators included)"""
+    return frozenset(
+        t for t in _TERM.findall(topic.lower())
+        if t not in FILLER_WORDS and t not in _SENTENCE_PUNCTUATION
+    )
+
+
+def topic_shingles(topic: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Character shingles of the topic with filler words removed"""
+    words = [w for w in normalize_text(topic).split() if w not in FILLER_WORDS]
+    text = " ".join(words) or normalize_text(topic)
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def generation_key(
+    archetype: str,
+    model: str,
+    topic: str,
+    context: str = "",
+    options: Optional[Dict[str, Any]] = None
+) -> str:
+    """Exact cache key of one archetype generation"""
+    partition = ResponseCache.partition_key(archetype, model, context, options)
+    return ResponseCache.exact_key(partition, topic)
+
+
+class MinHasher:
+    """MinHash signatures with a fixed, seeded family of permutations"""
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, seed: int = 1):
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+            for s in shingles
+        ]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self.permutations
+        )
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the underlying shingle sets"""
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+class CacheEntry:
+    __slots__ = ("value", "expires_at", "partition", "signature", "terms")
+
+    def __init__(
+        self,
+        value: str,
+        expires_at: float,
+        partition: str,
+        signature: Optional[Tuple[int, ...]],
+        terms: FrozenSet[str] = frozenset(),
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.partition = partition
+        self.signature = signature
+        self.terms = terms
+
+
+class ResponseCache:
+    """Exact + near-duplicate cache of archetype generations"""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        similarity_threshold: float = RESPONSE_CACHE_SIMILARITY,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+        clock=time.monotonic,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._hasher = MinHasher(num_perm)
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # (partition, band, band values) -> keys whose signature shares that band
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[str]] = {}
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def partition_key(
+        archetype: str,
+        model: str,
+        context: str = "",
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Everything except the topic must match exactly for a near-duplicate hit"""
+        material = json.dumps(
+            [archetype, model, fold_text(context), options or {}],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        archetype: str,
+        model: str,
+        topic: str,
+        context: str = "",
+        options: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        partition = self.partition_key(archetype, model, context, options)
+        key = self.exact_key(partition, topic)
+
+        entry = self._live_entry(key)
+        if entry is not None:
+            self.exact_hits += 1
+            return entry.value
+
+        if self.similarity_threshold > 0:
+            signature = self._hasher.signature(topic_shingles(topic))
+            match = self._nearest(partition, signature, topic_terms(topic))
+            if match is not None:
+                self.near_hits += 1
+                return match.value
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        archetype: str,
+        model: str,
+        topic: str,
+        response: str,
+        context: str = "",
+        options: Optional[Dict[str, Any]] = None
+    ):
+        partition = self.partition_key(archetype, model, context, options)
+        key = self.exact_key(partition, topic)
+        signature = None
+        if self.similarity_threshold > 0:
+            signature = self._hasher.signature(topic_shingles(topic))
+
+        self._remove(key)
+        self._entries[key] = CacheEntry(
+            response, self._clock() + self.ttl_seconds, partition, signature, topic_terms(topic)
+        )
+        if signature is not None:
+            for bucket in self._band_keys(partition, signature):
+                self._buckets.setdefault(bucket, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def record_bypass(self):
+        self.bypasses += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.exact_hits + self.near_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def exact_key(partition: str, topic: str) -> str:
+        digest = hashlib.sha256(fold_text(topic).encode("utf-8")).hexdigest()
+        return f"{partition}:{digest}"
+
+    def _band_keys(self, partition: str, signature: Tuple[int, ...]) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        return [
+            (partition, band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _live_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _nearest(
+        self,
+        partition: str,
+        signature: Tuple[int, ...],
+        terms: FrozenSet[str]
+    ) -> Optional[CacheEntry]:
+        candidates: Set[str] = set()
+        for bucket in self._band_keys(partition, signature):
+            candidates.update(self._buckets.get(bucket, ()))
+
+        best_key, best_score = None, self.similarity_threshold
+        for key in candidates:
+            entry = self._entries.get(key)
+            # Similar spelling is not the same question: "France" / "Frances", "2+2" / "2-2"
+            if entry is None or entry.signature is None or entry.terms != terms:
+                continue
+            score = MinHasher.similarity(signature, entry.signature)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._live_entry(best_key) if best_key is not None else None
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.signature is None:
+            return
+        for bucket in self._band_keys(entry.partition, entry.signature):
+            keys = self._buckets.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[bucket]
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """Response cache configured from the environment (None when disabled)"""
+    return ResponseCache() if RESPONSE_CACHE_ENABLED else None
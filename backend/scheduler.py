@@ -0,0 +1,215 @@
+"""
+SIRAJ Educational AI - Ollama Admission Control
+==============================================
+
+Every council request fans out to 4-7 generations. Without a limit, a burst
+of requests overloads the Ollama server and makes every request slow at
+once. ``OllamaScheduler`` sits between ``OllamaEducationalClient`` and the
+HTTP client:
+
+- A per-model slot limit sized to Ollama's ``OLLAMA_NUM_PARALLEL``
+- A bounded wait queue ordered by priority, so interactive council queries
+  are served before background jobs such as curriculum alignment
+- Queue-wait percentiles for /council/status
+- Fast shedding: once the queue is full (or a waiter times out) callers get
+  ``SchedulerOverloaded`` carrying a Retry-After estimate, which the API
+  turns into 429/503 responses
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+SCHEDULER_MAX_QUEUE = int(os.getenv("SCHEDULER_MAX_QUEUE", "64"))
+SCHEDULER_MAX_QUEUE_WAIT = float(os.getenv("SCHEDULER_MAX_QUEUE_WAIT", "30"))
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+logger = structlog.get_logger()
+
+
+class SchedulerOverloaded(Exception):
+    """Raised when work is shed instead of queued"""
+
+    def __init__(self, message: str, retry_after: int = 1, status_code: int = 503):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+
+class RollingPercentiles:
+    """Percentiles over the most recent ``window`` samples"""
+
+    def __init__(self, window: int = 512):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(50), 4),
+            "p90": round(self.percentile(90), 4),
+            "p99": round(self.percentile(99), 4),
+        }
+
+
+class _ModelSlots:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.queued = 0
+        # (priority, sequence, future) - a resolved future owns a handed-over slot
+        self.waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+
+
+class OllamaScheduler:
+    """Per-model concurrency limiter with a bounded priority wait queue"""
+
+    def __init__(
+        self,
+        num_parallel: int = OLLAMA_NUM_PARALLEL,
+        max_queue: int = SCHEDULER_MAX_QUEUE,
+        max_queue_wait: float = SCHEDULER_MAX_QUEUE_WAIT,
+        on_wait: Optional[Callable[[str, float], None]] = None,
+    ):
+        self.num_parallel = max(1, num_parallel)
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self._models: Dict[str, _ModelSlots] = {}
+        self._sequence = itertools.count()
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.queue_wait: Dict[str, RollingPercentiles] = {}
+        # Called with (priority name, seconds) for every admitted generation
+        self.on_wait = on_wait
+        # Smoothed generation time, used to estimate Retry-After
+        self._service_time = 5.0
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: int = PRIORITY_INTERACTIVE) -> AsyncIterator[None]:
+        """Hold one of ``model``'s generation slots for the duration of the block"""
+        slots = await self._acquire(model, priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._service_time = 0.8 * self._service_time + 0.2 * (time.monotonic() - started)
+            self._release(slots)
+
+    def check_capacity(self):
+        """Shed new work up front when the wait queue is already full"""
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise SchedulerOverloaded("Ollama generation queue is full", self.retry_after())
+
+    def retry_after(self) -> int:
+        """Seconds until a shed request is likely to be admitted"""
+        backlog = self.queued / self.num_parallel + 1
+        return int(min(60, max(1, math.ceil(self._service_time * backlog))))
+
+    def queue_depth(self, model: str) -> int:
+        """Generations currently waiting for one of ``model``'s slots"""
+        slots = self._models.get(model)
+        return slots.queued if slots else 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "num_parallel": self.num_parallel,
+            "max_queue": self.max_queue,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "models": {
+                model: {"active": slots.active, "limit": slots.limit, "queued": slots.queued}
+                for model, slots in self._models.items()
+            },
+            "queue_wait_seconds": {name: p.summary() for name, p in self.queue_wait.items()},
+        }
+
+    def _slots_for(self, model: str) -> _ModelSlots:
+        slots = self._models.get(model)
+        if slots is None:
+            slots = self._models[model] = _ModelSlots(self.num_parallel)
+        return slots
+
+    def _record_wait(self, priority: int, seconds: float):
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        self.queue_wait.setdefault(name, RollingPercentiles()).add(seconds)
+        if self.on_wait is not None:
+            self.on_wait(name, seconds)
+
+    async def _acquire(self, model: str, priority: int) -> _ModelSlots:
+        slots = self._slots_for(model)
+        if slots.active < slots.limit and not slots.waiters:
+            slots.active += 1
+            self.admitted += 1
+            self._record_wait(priority, 0.0)
+            return slots
+
+        self.check_capacity()
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(slots.waiters, (priority, next(self._sequence), waiter))
+        self.queued += 1
+        slots.queued += 1
+        queued_at = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_queue_wait)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(slots)
+            waiter.cancel()
+            self.timeouts += 1
+            logger.warning("Generation waited too long for an Ollama slot", model=model,
+                           priority=priority, waited=self.max_queue_wait)
+            raise SchedulerOverloaded("Timed out waiting for an Ollama slot", self.retry_after())
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(slots)
+            waiter.cancel()
+            raise
+        finally:
+            self.queued -= 1
+            slots.queued -= 1
+
+        self.admitted += 1
+        self._record_wait(priority, time.monotonic() - queued_at)
+        return slots
+
+    def _release(self, slots: _ModelSlots):
+        """Hand the slot to the best waiter, or free it"""
+        while slots.waiters:
+            _, _, waiter = heapq.heappop(slots.waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        slots.active -= 1
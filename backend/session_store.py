@@ -0,0 +1,309 @@
+"""
+SIRAJ Educational AI - Council Session Store
+===========================================
+
+Bounded storage for completed council sessions.
+
+``EducationalCouncil`` used to keep every session's request and response as
+nested dicts in a plain ``active_sessions`` dict that was only emptied by an
+explicit DELETE, so a long-running process grew without bound. Sessions now
+go through a ``SessionStore``:
+
+- ``MemorySessionStore`` keeps sessions as compact serialized bytes with LRU
+  ordering, a time-to-live and a total memory budget
+- ``RedisSessionStore`` shares sessions between workers and nodes with
+  pipelined writes and msgpack payloads; it is selected when ``REDIS_URL``
+  is set, so any worker can serve ``GET /api/education/session/{id}``
+"""
+
+import json
+import os
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import structlog
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+    class RedisError(Exception):
+        pass
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD") or None
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+SESSION_REDIS_PREFIX = os.getenv("SESSION_REDIS_PREFIX", "siraj:session:")
+
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+SESSION_TTL_SECONDS = float(os.getenv("SESSION_TTL_SECONDS", "3600"))
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Payloads smaller than this are not worth the zlib round trip
+COMPRESS_MIN_BYTES = 512
+
+logger = structlog.get_logger()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_session(session: Dict[str, Any]) -> bytes:
+    """Serialize a session to compact bytes.
+
+    The first byte records the codec: ``m``/``j`` for msgpack/JSON, upper case
+    when the body is zlib-compressed (only done for larger payloads).
+    """
+    if MSGPACK_AVAILABLE:
+        marker, raw = b"m", msgpack.packb(session, default=_json_default, use_bin_type=True)
+    else:
+        marker, raw = b"j", json.dumps(session, separators=(",", ":"), default=_json_default).encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return marker + raw
+    return marker.upper() + zlib.compress(raw, 1)
+
+
+def decode_session(payload: bytes) -> Dict[str, Any]:
+    marker, body = payload[:1], payload[1:]
+    if marker.isupper():
+        body = zlib.decompress(body)
+    if marker.lower() == b"m":
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body.decode("utf-8"))
+
+
+class SessionStore(ABC):
+    """Async storage interface for council sessions"""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored session, or None if missing or expired"""
+
+    @abstractmethod
+    async def put(self, session_id: str, session: Dict[str, Any]):
+        """Store (or replace) a session"""
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """Remove a session; True if it existed"""
+
+    @abstractmethod
+    async def size(self) -> int:
+        """Number of live sessions"""
+
+    async def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__, "sessions": await self.size()}
+
+    async def close(self):
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU store with TTL expiry and a memory budget"""
+
+    def __init__(
+        self,
+        max_entries: int = SESSION_MAX_ENTRIES,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_bytes: int = SESSION_MAX_BYTES,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        # session_id -> (expires_at, payload); order is least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._next_sweep = 0.0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            self._remove(session_id)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(session_id)
+        return decode_session(entry[1])
+
+    async def put(self, session_id: str, session: Dict[str, Any]):
+        payload = encode_session(session)
+        if len(payload) > self.max_bytes:
+            logger.warning("Session exceeds store budget, not stored",
+                           session_id=session_id, size=len(payload))
+            return
+
+        self._remove(session_id)
+        self._entries[session_id] = (self._clock() + self.ttl_seconds, payload)
+        self._bytes += len(payload)
+        self._sweep_expired()
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def delete(self, session_id: str) -> bool:
+        return self._remove(session_id)
+
+    async def size(self) -> int:
+        self._sweep_expired()
+        return len(self._entries)
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "sessions": await self.size(),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, session_id: str) -> bool:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry[1])
+        return True
+
+    def _sweep_expired(self):
+        """Drop expired sessions, scanning at most once per sweep interval"""
+        now = self._clock()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + min(self.ttl_seconds, 60.0)
+        expired = [sid for sid, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for session_id in expired:
+            self._remove(session_id)
+        self.expirations += len(expired)
+
+
+class RedisSessionStore(SessionStore):
+    """Redis-backed store shared by every worker.
+
+    Each session is a single key with a TTL; a sorted set of expiry times per
+    prefix makes ``size()`` cheap. Redis' own ``maxmemory-policy`` bounds
+    memory, and errors are logged rather than failing the council request.
+    """
+
+    def __init__(
+        self,
+        client: "aioredis.Redis",
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        prefix: str = SESSION_REDIS_PREFIX,
+        clock=time.time,
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.index_key = f"{prefix.rstrip(':')}-index"
+        self._clock = clock
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisSessionStore":
+        client = aioredis.from_url(url, password=REDIS_PASSWORD, max_connections=REDIS_MAX_CONNECTIONS)
+        return cls(client, **kwargs)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}{session_id}"
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            payload = await self.client.get(self._key(session_id))
+        except RedisError as e:
+            logger.warning("Session store read failed", session_id=session_id, error=str(e))
+            return None
+        return decode_session(payload) if payload is not None else None
+
+    async def put(self, session_id: str, session: Dict[str, Any]):
+        payload = encode_session(session)
+        ttl_ms = int(self.ttl_seconds * 1000)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(self._key(session_id), payload, px=ttl_ms)
+                pipe.zadd(self.index_key, {session_id: self._clock() + self.ttl_seconds})
+                pipe.zremrangebyscore(self.index_key, "-inf", self._clock())
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Session store write failed", session_id=session_id, error=str(e))
+
+    async def delete(self, session_id: str) -> bool:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.delete(self._key(session_id))
+                pipe.zrem(self.index_key, session_id)
+                deleted, _ = await pipe.execute()
+        except RedisError as e:
+            logger.warning("Session store delete failed", session_id=session_id, error=str(e))
+            return False
+        return bool(deleted)
+
+    async def size(self) -> int:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(self.index_key, "-inf", self._clock())
+                pipe.zcard(self.index_key)
+                _, count = await pipe.execute()
+        except RedisError as e:
+            logger.warning("Session store size failed", error=str(e))
+            return 0
+        return count
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "sessions": await self.size(),
+            "ttl_seconds": self.ttl_seconds,
+            "encoding": "msgpack" if MSGPACK_AVAILABLE else "json",
+        }
+
+    async def close(self):
+        close = getattr(self.client, "aclose", None) or self.client.close
+        await close()
+
+
+def redis_location(url: str) -> Dict[str, Any]:
+    """Host, port and db of a Redis URL, without the credentials it may carry"""
+    parts = urlsplit(url)
+    db = parse_qs(parts.query).get("db", ["0"])[0]
+    if parts.scheme == "unix":
+        return {"socket": parts.path, "db": db}
+    return {"host": parts.hostname, "port": parts.port or 6379, "db": parts.path.lstrip("/") or db}
+
+
+def create_session_store() -> SessionStore:
+    """Session store configured from the environment (Redis when REDIS_URL is set)"""
+    if REDIS_URL:
+        if REDIS_AVAILABLE:
+            logger.info("Using Redis session store", **redis_location(REDIS_URL))
+            return RedisSessionStore.from_url(REDIS_URL)
+        logger.warning("REDIS_URL is set but the redis package is not installed, "
+                       "sessions will not be shared between workers")
+    return MemorySessionStore()
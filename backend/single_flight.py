@@ -0,0 +1,132 @@
+"""
+SIRAJ Educational AI - Single-Flight Generation Coalescing
+=========================================================
+
+When a teacher projects a question and a whole class submits it at once,
+every request used to start its own set of identical Ollama generations.
+``SingleFlight`` deduplicates work that is already in flight:
+
+- ``do()`` - concurrent callers with the same key await one shared future
+- ``stream()`` - concurrent subscribers share one token stream; late joiners
+  replay the tokens produced so far, then follow along live
+
+The shared work is cancelled only once every caller has given up on it, so
+one client disconnecting does not break the stream for the rest.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SharedStreamCancelled(Exception):
+    """The producer behind a shared stream was cancelled before finishing"""
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class _StreamFlight:
+    """One producer task feeding any number of replaying subscribers"""
+
+    def __init__(self, source: AsyncIterator[Any]):
+        self.items: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+        self.task = asyncio.ensure_future(self._pump(source))
+
+    async def _pump(self, source: AsyncIterator[Any]):
+        try:
+            async for item in source:
+                self.items.append(item)
+                self._notify()
+        except asyncio.CancelledError:
+            self.error = SharedStreamCancelled()
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        index = 0
+        while True:
+            while index < len(self.items):
+                yield self.items[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+class SingleFlight:
+    """Coalesce identical in-flight calls and token streams by key"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Flight] = {}
+        self._streams: Dict[str, _StreamFlight] = {}
+        self.started = 0
+        self.shared = 0
+
+    def in_flight(self) -> int:
+        return len(self._calls) + len(self._streams)
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory()`` once per key; concurrent callers share the result"""
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._calls[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(self._calls, key, flight))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    async def stream(self, key: str, factory: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """Iterate ``factory()`` once per key; concurrent subscribers share the tokens"""
+        flight = self._streams.get(key)
+        if flight is None:
+            flight = _StreamFlight(factory())
+            self._streams[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(self._streams, key, flight))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        flight.subscribers += 1
+        try:
+            async for item in flight.subscribe():
+                yield item
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": self.in_flight(), "started": self.started, "shared": self.shared}
+
+    @staticmethod
+    def _forget(flights: Dict[str, Any], key: str, flight: Any):
+        if flights.get(key) is flight:
+            del flights[key]
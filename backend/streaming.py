@@ -0,0 +1,295 @@
+"""
+SIRAJ Educational AI - Council Streaming Fan-out
+===============================================
+
+Real-time delivery of council events to WebSocket clients.
+
+- ``CouncilBroadcast`` runs one council event stream and fans it out to any
+  number of subscribers, replaying progress to late joiners so several tabs
+  can attach to the same session without generating twice.
+- ``SocketChannel`` gives each WebSocket its own bounded send queue. Token
+  chunks are coalesced per archetype while a socket is behind, so a slow
+  client receives fewer, larger updates instead of stalling the council;
+  a coalesced ``chunk`` carries every token it replaced.
+- ``ConnectionManager`` tracks sockets per session and owns the broadcasts
+  behind the ``/ws/council/{session_id}`` protocol.
+"""
+
+import asyncio
+import json
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+
+import structlog
+from fastapi import WebSocket
+
+WS_MAX_PENDING_MESSAGES = int(os.getenv("WS_MAX_PENDING_MESSAGES", "256"))
+
+# Close code sent to sockets that fall too far behind (RFC 6455 "Try Again Later")
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+TERMINAL_EVENTS = {"session_complete", "error"}
+
+logger = structlog.get_logger()
+
+
+def chunk_key(event: Dict[str, Any]) -> Optional[str]:
+    """Coalescing key for streamed chunk events (None for everything else)"""
+    if event.get("type") == "archetype_chunk":
+        return f"archetype:{event.get('archetype')}"
+    if event.get("type") == "synthesis_chunk":
+        return "synthesis"
+    return None
+
+
+class CouncilBroadcast:
+    """A single council event stream shared by many subscribers"""
+
+    def __init__(
+        self,
+        source: AsyncIterator[Dict[str, Any]],
+        on_done: Optional[Callable[["CouncilBroadcast"], None]] = None,
+    ):
+        self._source = source
+        self._on_done = on_done
+        self._subscribers: List[Callable[[Dict[str, Any]], bool]] = []
+        self._history: List[Dict[str, Any]] = []
+        self._partials: Dict[str, Dict[str, Any]] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.done = False
+
+    def start(self) -> "CouncilBroadcast":
+        self.task = asyncio.create_task(self._run())
+        return self
+
+    def cancel(self):
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, offer: Callable[[Dict[str, Any]], bool]):
+        """Attach a subscriber, replaying progress so far"""
+        for event in self.snapshot():
+            if not offer(event):
+                return
+        self._subscribers.append(offer)
+
+    def unsubscribe(self, offer: Callable[[Dict[str, Any]], bool]) -> int:
+        """Detach a subscriber; returns how many remain"""
+        if offer in self._subscribers:
+            self._subscribers.remove(offer)
+        return len(self._subscribers)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Events a late joiner needs: history plus in-progress text per stream"""
+        partials = [dict(event, chunk=event["content"]) for event in self._partials.values()]
+        return list(self._history) + partials
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Subscribe through an async iterator (ends after the terminal event)"""
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def offer(event: Dict[str, Any]) -> bool:
+            queue.put_nowait(event)
+            return True
+
+        self.subscribe(offer)
+        try:
+            if self.done and not any(e.get("type") in TERMINAL_EVENTS for e in self._history):
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if event.get("type") in TERMINAL_EVENTS:
+                    return
+        finally:
+            self.unsubscribe(offer)
+
+    def _accumulate(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach the accumulated text to chunk events and track partial streams"""
+        key = chunk_key(event)
+        if key is not None:
+            previous = self._partials.get(key, {}).get("content", "")
+            event = dict(event, content=previous + event.get("chunk", ""))
+            self._partials[key] = event
+        elif event.get("type") == "archetype_complete":
+            self._partials.pop(f"archetype:{event.get('archetype')}", None)
+        elif event.get("type") == "synthesis_complete":
+            self._partials.pop("synthesis", None)
+        return event
+
+    def _publish(self, event: Dict[str, Any]):
+        if chunk_key(event) is None:
+            self._history.append(event)
+        for offer in list(self._subscribers):
+            if not offer(event):
+                self.unsubscribe(offer)
+
+    async def _run(self):
+        try:
+            async for event in self._source:
+                self._publish(self._accumulate(event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Council broadcast failed", error=str(e))
+            self._publish({"type": "error", "message": str(e)})
+        finally:
+            self.done = True
+            if self._on_done:
+                self._on_done(self)
+
+
+class SocketChannel:
+    """Per-WebSocket send queue with chunk coalescing and a hard backlog cap"""
+
+    def __init__(self, websocket: WebSocket, max_pending: int = WS_MAX_PENDING_MESSAGES):
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._chunk_slots: Dict[str, Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._sender: Optional[asyncio.Task] = None
+        self.coalesced = 0
+        self.closed = False
+
+    def start(self) -> "SocketChannel":
+        self._sender = asyncio.create_task(self._run())
+        return self
+
+    def offer(self, message: Dict[str, Any]) -> bool:
+        """Queue a message without blocking the producer; False if the socket is gone"""
+        if self.closed:
+            return False
+
+        key = chunk_key(message)
+        if key is not None:
+            slot = self._chunk_slots.get(key)
+            if slot is not None:
+                # Still unsent - fold the newer chunk in place, keeping the whole delta
+                # since the last sent chunk for clients that append ``chunk``
+                delta = slot.get("chunk", "") + message.get("chunk", "")
+                slot.clear()
+                slot.update(message, chunk=delta)
+                self.coalesced += 1
+                return True
+            message = dict(message)
+            self._chunk_slots[key] = message
+
+        if len(self._pending) >= self.max_pending:
+            logger.warning("WebSocket send backlog exceeded, closing slow client",
+                           pending=len(self._pending))
+            self.closed = True
+            asyncio.create_task(self._close(WS_CLOSE_TRY_AGAIN_LATER))
+            return False
+
+        self._pending.append(message)
+        self._wakeup.set()
+        return True
+
+    async def _run(self):
+        try:
+            while True:
+                while not self._pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                message = self._pending.popleft()
+                key = chunk_key(message)
+                if key is not None and self._chunk_slots.get(key) is message:
+                    del self._chunk_slots[key]
+                await self.websocket.send_text(json.dumps(message, default=str))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info("WebSocket send failed, dropping client", error=str(e))
+            self.closed = True
+
+    async def _close(self, code: int):
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def close(self):
+        self.closed = True
+        if self._sender and not self._sender.done():
+            self._sender.cancel()
+            try:
+                await self._sender
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class ConnectionManager:
+    """Tracks council WebSockets per session and the broadcast feeding them"""
+
+    def __init__(self, max_pending: int = WS_MAX_PENDING_MESSAGES):
+        self.max_pending = max_pending
+        self.active_connections: Dict[WebSocket, SocketChannel] = {}
+        self.session_connections: Dict[str, Set[WebSocket]] = {}
+        self.session_broadcasts: Dict[str, CouncilBroadcast] = {}
+
+    async def connect(self, websocket: WebSocket, session_id: str):
+        """Accept a socket and attach it to any council already running for the session"""
+        await websocket.accept()
+        channel = SocketChannel(websocket, self.max_pending).start()
+        self.active_connections[websocket] = channel
+        self.session_connections.setdefault(session_id, set()).add(websocket)
+
+        broadcast = self.session_broadcasts.get(session_id)
+        if broadcast and not broadcast.done:
+            broadcast.subscribe(channel.offer)
+
+    async def disconnect(self, websocket: WebSocket, session_id: str):
+        """Detach a socket; cancel the council if nobody is left watching it"""
+        channel = self.active_connections.pop(websocket, None)
+        sockets = self.session_connections.get(session_id)
+        if sockets is not None:
+            sockets.discard(websocket)
+            if not sockets:
+                del self.session_connections[session_id]
+
+        broadcast = self.session_broadcasts.get(session_id)
+        if broadcast and channel and broadcast.unsubscribe(channel.offer) == 0:
+            broadcast.cancel()
+
+        if channel:
+            await channel.close()
+
+    def is_streaming(self, session_id: str) -> bool:
+        broadcast = self.session_broadcasts.get(session_id)
+        return broadcast is not None and not broadcast.done
+
+    def start_session(
+        self,
+        session_id: str,
+        source_factory: Callable[[], AsyncIterator[Dict[str, Any]]],
+    ) -> bool:
+        """Start streaming a council to every socket on the session.
+
+        Returns False when a council is already running for the session; the
+        caller's socket is then already attached to that stream.
+        """
+        if self.is_streaming(session_id):
+            return False
+
+        broadcast = CouncilBroadcast(source_factory(), on_done=lambda b: self._finished(session_id, b))
+        self.session_broadcasts[session_id] = broadcast
+        for websocket in self.session_connections.get(session_id, ()):
+            channel = self.active_connections.get(websocket)
+            if channel:
+                broadcast.subscribe(channel.offer)
+        broadcast.start()
+        return True
+
+    def send_personal(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
+        channel = self.active_connections.get(websocket)
+        return channel.offer(message) if channel else False
+
+    def _finished(self, session_id: str, broadcast: CouncilBroadcast):
+        if self.session_broadcasts.get(session_id) is broadcast:
+            del self.session_broadcasts[session_id]
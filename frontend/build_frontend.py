@@ -28,9 +28,20 @@ import sys
 import subprocess
 import shutil
 import json
+import gzip
+import hashlib
+import mimetypes
+from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
 import logging
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +50,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger('SIRAJ-Frontend-Builder')
 
+# Written next to index.html; launcher.py reads it to serve the precompressed siblings
+ASSET_MANIFEST = 'siraj-asset-manifest.json'
+COMPRESSIBLE_EXTENSIONS = {'.js', '.css', '.html', '.json', '.map', '.svg', '.txt', '.xml'}
+COMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+# Smaller files are not worth a compressed sibling
+MIN_COMPRESS_SIZE = 512
+
+mimetypes.add_type('application/json', '.map')
+
 class SpiralFrontendBuilder:
     """Frontend build system following Spiral Editing Protocol"""
     
@@ -47,6 +67,10 @@ class SpiralFrontendBuilder:
         self.build_dir = self.frontend_dir / 'build'
         self.src_dir = self.frontend_dir / 'src'
         self.static_dir = self.build_dir / 'static'
+        self.budget_file = self.frontend_dir / 'bundle-budget.json'
+        # Committed gzip sizes the growth check compares against - kept out of build/
+        self.baseline_file = self.frontend_dir / 'bundle-baseline.json'
+        self.manifest = None
         
     def show_spiral_banner(self):
         """Council Assembly Invocation"""
@@ -235,6 +259,126 @@ class SpiralFrontendBuilder:
         logger.info("✅ Build output validation complete")
         return True
         
+    def load_baseline(self):
+        """Committed gzip KB per budget pattern, or None before the first baseline"""
+        try:
+            return json.loads(self.baseline_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+            
+    def precompress_assets(self):
+        """Optimizer Voice - Precompressed Siblings and Asset Manifest"""
+        logger.info("🗜️ Optimizer Voice: Precompressing assets...")
+        
+        if not self.build_dir.exists():
+            logger.error("❌ Build directory not found - run 'npm run build' first")
+            return False
+        if not BROTLI_AVAILABLE:
+            logger.warning("⚠️ brotli not installed - writing gzip siblings only (pip install brotli)")
+            
+        assets = {}
+        original_total = compressed_total = 0
+        for file_path in sorted(self.build_dir.rglob('*')):
+            if not file_path.is_file() or file_path.suffix in COMPRESSED_SUFFIXES.values() or file_path.name == ASSET_MANIFEST:
+                continue
+            relative = file_path.relative_to(self.build_dir).as_posix()
+            content = file_path.read_bytes()
+            entry = {
+                'size': len(content),
+                'sha256': hashlib.sha256(content).hexdigest(),
+                'type': mimetypes.guess_type(relative)[0] or 'application/octet-stream',
+                'encodings': {}
+            }
+            
+            compressible = file_path.suffix in COMPRESSIBLE_EXTENSIONS and len(content) >= MIN_COMPRESS_SIZE
+            for encoding, suffix in COMPRESSED_SUFFIXES.items():
+                sibling = file_path.with_name(file_path.name + suffix)
+                data = self._compress(content, encoding) if compressible else None
+                if data is not None and len(data) < len(content):
+                    sibling.write_bytes(data)
+                    entry['encodings'][encoding] = len(data)
+                elif sibling.exists():
+                    sibling.unlink()  # Stale sibling from an earlier run
+                    
+            if entry['encodings']:
+                original_total += len(content)
+                compressed_total += min(entry['encodings'].values())
+            assets[relative] = entry
+            
+        self.manifest = {
+            'generated_at': datetime.now().isoformat(),
+            'assets': assets
+        }
+        self._write_manifest()
+        
+        compressed = sum(1 for entry in assets.values() if entry['encodings'])
+        logger.info(f"✅ Precompressed {compressed} of {len(assets)} assets: "
+                    f"{original_total / 1024:.0f} KB → {compressed_total / 1024:.0f} KB")
+        logger.info(f"✅ Asset manifest written: {ASSET_MANIFEST}")
+        return True
+        
+    def check_bundle_budget(self, update_baseline=False):
+        """Analyzer Voice - Bundle Size Budget
+        
+        Growth is measured against the committed bundle-baseline.json, never the
+        last build, and the baseline is only written when the budget passes.
+        """
+        logger.info("📏 Analyzer Voice: Checking bundle size budget...")
+        
+        if not self.budget_file.exists():
+            logger.warning(f"⚠️ No {self.budget_file.name} - skipping budget check")
+            return True
+            
+        budget = json.loads(self.budget_file.read_text(encoding='utf-8'))
+        max_growth = budget.get('max_growth_percent')
+        baseline = self.load_baseline()
+        if baseline is None:
+            logger.warning(f"⚠️ No {self.baseline_file.name} - growth is not checked until one is committed")
+        
+        report = []
+        within_budget = True
+        for rule in budget.get('budgets', []):
+            # Budgets are measured on gzip size - what a classroom connection actually downloads
+            matched = [entry for relative, entry in self.manifest['assets'].items() if fnmatch(relative, rule['pattern'])]
+            gzip_kb = round(sum(entry['encodings'].get('gzip', entry['size']) for entry in matched) / 1024, 1)
+            entry = {'pattern': rule['pattern'], 'files': len(matched), 'gzip_kb': gzip_kb,
+                     'max_gzip_kb': rule['max_gzip_kb'], 'baseline_gzip_kb': (baseline or {}).get(rule['pattern'])}
+            
+            problems = []
+            if gzip_kb > rule['max_gzip_kb']:
+                problems.append(f"over budget by {gzip_kb - rule['max_gzip_kb']:.1f} KB")
+            if max_growth is not None and entry['baseline_gzip_kb']:
+                growth = (gzip_kb - entry['baseline_gzip_kb']) / entry['baseline_gzip_kb'] * 100
+                if growth > max_growth:
+                    problems.append(f"grew {growth:.1f}% over {self.baseline_file.name} (limit {max_growth}%)")
+            entry['ok'] = not problems
+            within_budget = within_budget and entry['ok']
+            report.append(entry)
+            
+            if problems:
+                logger.error(f"❌ {rule['pattern']}: {gzip_kb} KB gzip - {'; '.join(problems)}")
+            else:
+                logger.info(f"✅ {rule['pattern']}: {gzip_kb} / {rule['max_gzip_kb']} KB gzip ({len(matched)} files)")
+                
+        self.manifest['budget'] = report
+        self._write_manifest()
+        if within_budget and (update_baseline or baseline is None):
+            self.baseline_file.write_text(
+                json.dumps({entry['pattern']: entry['gzip_kb'] for entry in report}, indent=2) + '\n', encoding='utf-8')
+            logger.info(f"✅ Baseline written: {self.baseline_file.name} - commit it to track growth")
+        return within_budget
+        
+    def _write_manifest(self):
+        (self.build_dir / ASSET_MANIFEST).write_text(json.dumps(self.manifest, indent=2), encoding='utf-8')
+        
+    @staticmethod
+    def _compress(content, encoding):
+        if encoding == 'gzip':
+            return gzip.compress(content, compresslevel=9, mtime=0)
+        if encoding == 'br' and BROTLI_AVAILABLE:
+            return brotli.compress(content, quality=11)
+        return None
+        
     def test_integration(self):
         """Security Auditor Voice - Integration Verification"""
         logger.info("🛡️ Security Auditor: Testing API integration patterns...")
@@ -273,14 +417,16 @@ class SpiralFrontendBuilder:
         
         try:
             # Calculate total build size
+            # Precompressed siblings are alternatives, not extra payload
             for file_path in self.build_dir.rglob('*'):
-                if file_path.is_file():
+                if file_path.is_file() and file_path.suffix not in COMPRESSED_SUFFIXES.values():
                     build_stats['total_size'] += file_path.stat().st_size
                     
             # Count file types
             build_stats['js_files'] = len(list((self.static_dir / 'js').glob('*.js')))
             build_stats['css_files'] = len(list((self.static_dir / 'css').glob('*.css')))
-            build_stats['static_assets'] = len(list(self.static_dir.rglob('*')))
+            build_stats['static_assets'] = len([f for f in self.static_dir.rglob('*')
+                                                if f.suffix not in COMPRESSED_SUFFIXES.values()])
             
             total_size_mb = build_stats['total_size'] / 1024 / 1024
             
@@ -295,7 +441,7 @@ class SpiralFrontendBuilder:
             
         logger.info("✅ Build report complete")
         
-    def run_spiral_build(self):
+    def run_spiral_build(self, update_baseline=False):
         """Complete Spiral Building Protocol"""
         try:
             self.show_spiral_banner()
@@ -323,11 +469,19 @@ class SpiralFrontendBuilder:
                 logger.error("❌ Build validation failed!")
                 return False
                 
-            # Phase 6: Test Integration
+            # Phase 6: Precompress Assets
+            self.precompress_assets()
+            
+            # Phase 7: Bundle Size Budget
+            if not self.check_bundle_budget(update_baseline):
+                logger.error("❌ Bundle size budget exceeded!")
+                return False
+                
+            # Phase 8: Test Integration
             if not self.test_integration():
                 logger.warning("⚠️ Integration testing had issues")
                 
-            # Phase 7: Generate Report
+            # Phase 9: Generate Report
             self.generate_spiral_report()
             
             print("\n" + "="*60)
@@ -351,7 +505,13 @@ class SpiralFrontendBuilder:
 def main():
     """Entry point for spiral build process"""
     builder = SpiralFrontendBuilder()
-    success = builder.run_spiral_build()
+    # Accept the current bundle sizes as the new growth baseline (when within budget)
+    update_baseline = '--update-baseline' in sys.argv
+    if '--precompress-only' in sys.argv:
+        # Post-process an existing build (e.g. after 'npm run build' in the Docker image)
+        success = builder.precompress_assets() and builder.check_bundle_budget(update_baseline)
+    else:
+        success = builder.run_spiral_build(update_baseline)
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
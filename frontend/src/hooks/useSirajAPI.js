@@ -259,6 +259,14 @@ export const useSirajWebSocket = (sessionId) => {
               ]);
               break;
 
+            case 'synthesis_start':
+            case 'pong':
+              break;
+
+            case 'synthesis_chunk':
+              setFinalResult(data.content);
+              break;
+
             case 'synthesis_complete':
               setFinalResult(data.synthesis);
               setCurrentStage(null);
@@ -32,56 +32,454 @@ Ritual Audit & Memory:
 - QWAN Assessment: Wholeness through unified frontend-launcher integration
 """
 
+import time
+LAUNCH_STARTED = time.perf_counter()
+
 import os
 import sys
-import time
 import asyncio
 import json
 import subprocess
-import webbrowser
+import importlib.util
 import logging
 import signal
 import socket
+import collections
+import gzip
+import hashlib
+import mimetypes
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Essential dependencies
-REQUIRED_PACKAGES = ['httpx', 'psutil', 'fastapi', 'uvicorn', 'colorama', 'aiofiles']
+REQUIRED_PACKAGES = ['httpx', 'fastapi', 'uvicorn', 'colorama', 'aiofiles', 'websockets']
+# Needed by backend/main.py, which runs on this same interpreter
+BACKEND_PACKAGES = ['fastapi', 'uvicorn', 'structlog']
+DEPENDENCY_CACHE_DIR = Path(os.getenv("SIRAJ_CACHE_DIR", str(Path.home() / ".cache" / "siraj")))
+# Set on the one re-exec allowed after a failed import, so a broken install cannot loop
+DEPENDENCY_REEXEC_FLAG = "SIRAJ_DEPENDENCIES_REEXECUTED"
+
+def dependency_marker() -> Path:
+    """Marker proving the packages were verified for this interpreter and requirement set"""
+    key = hashlib.sha256(f"{sys.executable}|{sys.version}|{REQUIRED_PACKAGES}|{BACKEND_PACKAGES}".encode())
+    requirements = Path(__file__).parent / "requirements-launcher.txt"
+    if requirements.exists():
+        key.update(requirements.read_bytes())
+    return DEPENDENCY_CACHE_DIR / f"deps-{key.hexdigest()[:16]}.ok"
 
 def ensure_dependencies():
-    """Install required packages"""
-    missing = []
-    for pkg in REQUIRED_PACKAGES:
-        try:
-            __import__(pkg)
-        except ImportError:
-            missing.append(pkg)
-    
+    """Install required packages, once per interpreter and requirement set"""
+    if getattr(sys, 'frozen', False):
+        return  # PyInstaller executables bundle their dependencies
+    marker = dependency_marker()
+    if marker.exists():
+        return
+        
+    # find_spec locates packages without paying for importing them
+    missing = [pkg for pkg in dict.fromkeys(REQUIRED_PACKAGES + BACKEND_PACKAGES)
+               if importlib.util.find_spec(pkg) is None]
     if missing:
         print(f"📦 Installing {len(missing)} packages: {', '.join(missing)}")
         subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + missing + ['--quiet'])
         print("✅ Dependencies ready")
+        
+    # find_spec also passes for a package that is installed but cannot import
+    for pkg in dict.fromkeys(REQUIRED_PACKAGES + BACKEND_PACKAGES):
+        try:
+            importlib.import_module(pkg)
+        except Exception as e:
+            sys.exit(f"❌ Package '{pkg}' is installed but cannot be imported ({e!r}). "
+                     f"Reinstall it with: {sys.executable} -m pip install --force-reinstall {pkg}")
+        
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass  # Unwritable cache - verify again next start
 
 ensure_dependencies()
+DEPENDENCIES_CHECKED = time.perf_counter()
+
+# Import after ensuring packages exist (aiofiles is only needed by packaged builds;
+# colorama and websockets are imported on first use, see _colorama and proxy_websocket)
+try:
+    import httpx
+    import uvicorn
+    from fastapi import FastAPI, HTTPException, Request, WebSocket
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import HTMLResponse, FileResponse, Response, StreamingResponse
+    from starlette.background import BackgroundTask
+    from starlette.websockets import WebSocketState
+except ImportError:
+    if getattr(sys, 'frozen', False) or __name__ != '__main__':
+        raise
+    dependency_marker().unlink(missing_ok=True)
+    if os.environ.get(DEPENDENCY_REEXEC_FLAG):
+        raise SystemExit(f"❌ Launcher dependencies still fail to import after reinstalling: {sys.exc_info()[1]}. "
+                         "Check the packages in requirements-launcher.txt.")
+    # A package was removed after the marker was written - verify again in a fresh process, once
+    os.environ[DEPENDENCY_REEXEC_FLAG] = "1"
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
-# Import after ensuring packages exist
-import httpx
-import psutil
-import uvicorn
-import aiofiles
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
-from colorama import init, Fore, Style
+@lru_cache(maxsize=None)
+def _colorama():
+    """colorama, imported and initialised the first time output is coloured"""
+    import colorama
+    colorama.init(autoreset=True)
+    return colorama
 
-init(autoreset=True)
+class _LazyColors:
+    """Stand-in for colorama's ``Fore`` / ``Style`` that defers the import"""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str) -> str:
+        return getattr(getattr(_colorama(), self._name), attr)
+
+Fore = _LazyColors("Fore")
+Style = _LazyColors("Style")
+MODULES_IMPORTED = time.perf_counter()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s', datefmt='%H:%M:%S')
 logger = logging.getLogger('SIRAJ-INTEGRATED')
 
+BACKEND_URL = os.getenv("SIRAJ_BACKEND_URL", "http://localhost:8000")
+# One keep-alive pool is shared by every request proxied to the backend
+PROXY_MAX_CONNECTIONS = int(os.getenv("LAUNCHER_PROXY_MAX_CONNECTIONS", "100"))
+PROXY_MAX_KEEPALIVE = int(os.getenv("LAUNCHER_PROXY_MAX_KEEPALIVE", "20"))
+PROXY_KEEPALIVE_EXPIRY = float(os.getenv("LAUNCHER_PROXY_KEEPALIVE_EXPIRY", "30"))
+
+def create_backend_client(backend_url: str = BACKEND_URL) -> httpx.AsyncClient:
+    """Pooled client for proxying to the backend (timeouts are set per route)"""
+    return httpx.AsyncClient(
+        base_url=backend_url,
+        limits=httpx.Limits(
+            max_connections=PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=PROXY_MAX_KEEPALIVE,
+            keepalive_expiry=PROXY_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+# Connection-level headers that must not be forwarded by a proxy (RFC 9110 7.6.1)
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade", "host",
+}
+
+def forwardable_headers(headers) -> List[Tuple[str, str]]:
+    """End-to-end headers, keeping repeated ones such as set-cookie"""
+    # httpx joins repeated headers in items(); multi_items() keeps them apart
+    items = headers.multi_items() if hasattr(headers, "multi_items") else headers.items()
+    return [(k, v) for k, v in items if k.lower() not in HOP_BY_HOP_HEADERS]
+
+async def proxy_http(
+    client: httpx.AsyncClient,
+    request: Request,
+    path: str,
+    timeout: float,
+    body: Optional[bytes] = None,
+) -> StreamingResponse:
+    """Stream a request to the backend and its response back, chunk by chunk
+
+    Neither body is buffered (unless the caller already read the request
+    ``body``), so SSE and chunked responses pass straight through. Raises
+    httpx.TransportError if the backend cannot be reached.
+    """
+    if body is None and request.method not in ("GET", "HEAD"):
+        body = request.stream()
+    upstream_request = client.build_request(
+        request.method,
+        path,
+        params=request.query_params,
+        headers=forwardable_headers(request.headers),
+        content=body,
+        timeout=timeout,
+    )
+    upstream = await client.send(upstream_request, stream=True)
+    response = StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.status_code,
+        background=BackgroundTask(upstream.aclose),
+    )
+    # Set as a list - a headers mapping would collapse repeated ones
+    response.raw_headers = [
+        (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in forwardable_headers(upstream.headers)
+    ]
+    return response
+
+async def proxy_websocket(websocket: WebSocket, url: str):
+    """Relay frames between a client WebSocket and the backend at ``url``"""
+    import websockets  # Only needed once a client opens a council WebSocket
+    try:
+        upstream = await websockets.connect(url, open_timeout=5)
+    except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+        print(f"{Fore.YELLOW}⚠️ Backend WebSocket proxy failed for {url}: {e}")
+        await websocket.close(code=1011)
+        return
+    await websocket.accept()
+
+    async def client_to_backend():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            if message.get("text") is not None:
+                await upstream.send(message["text"])
+            elif message.get("bytes") is not None:
+                await upstream.send(message["bytes"])
+
+    async def backend_to_client():
+        async for message in upstream:
+            if isinstance(message, str):
+                await websocket.send_text(message)
+            else:
+                await websocket.send_bytes(message)
+
+    relays = [asyncio.ensure_future(client_to_backend()), asyncio.ensure_future(backend_to_client())]
+    try:
+        await asyncio.wait(relays, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for relay in relays:
+            relay.cancel()
+        await asyncio.gather(*relays, return_exceptions=True)
+        await upstream.close()
+        if websocket.client_state == WebSocketState.CONNECTED and websocket.application_state == WebSocketState.CONNECTED:
+            # The backend hung up first - pass its close code on (1005/1006 cannot be sent)
+            code = {None: 1011, 1005: 1000, 1006: 1011}.get(upstream.close_code, upstream.close_code)
+            await websocket.close(code=code)
+
+# Create React App puts a content hash in static file names (main.1a2b3c4d.js)
+HASHED_ASSET_NAME = re.compile(r"\.[0-9a-f]{8,}\.")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/manifest+json",
+                      "application/xml", "image/svg+xml")
+# Smaller files are not worth a compressed variant
+MIN_COMPRESS_SIZE = 512
+# Larger files are sent from disk instead of being held in memory
+MAX_INLINE_ASSET_SIZE = 4 * 1024 * 1024
+# Compression at startup favours speed over ratio
+STARTUP_GZIP_LEVEL = 6
+STARTUP_BROTLI_QUALITY = 5
+# Written by frontend/build_frontend.py alongside .br/.gz siblings of each asset
+ASSET_MANIFEST = "siraj-asset-manifest.json"
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+mimetypes.add_type("application/json", ".map")
+
+def negotiate_encoding(accept_encoding: str, available) -> Optional[str]:
+    """Best of ``available`` ("br", "gzip") allowed by an Accept-Encoding header"""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    candidates = [c for c in ("br", "gzip") if c in available and accepted.get(c, accepted.get("*", 0.0)) > 0]
+    return max(candidates, key=lambda c: accepted.get(c, accepted.get("*", 0.0)), default=None)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+class StaticAsset:
+    """One file of the frontend build with its ETag and compressed variants"""
+    
+    def __init__(self, path: Path, relative: str, build_entry: Optional[dict] = None):
+        self.path = path
+        self.relative = relative
+        self.media_type = mimetypes.guess_type(relative)[0] or "application/octet-stream"
+        self.immutable = relative.startswith("static/") and bool(HASHED_ASSET_NAME.search(path.name))
+        self.size = path.stat().st_size
+        self.content: Optional[bytes] = path.read_bytes() if self.size <= MAX_INLINE_ASSET_SIZE else None
+        self.digest = self._digest()
+        self.variants: Dict[str, bytes] = {}
+        if self.content is None:
+            return
+        if build_entry and build_entry.get("sha256", "").startswith(self.digest):
+            self._load_precompressed(build_entry)
+        elif self.size >= MIN_COMPRESS_SIZE and self.media_type.startswith(COMPRESSIBLE_TYPES):
+            self._compress()
+            
+    @property
+    def cache_control(self) -> str:
+        return IMMUTABLE_CACHE_CONTROL if self.immutable else REVALIDATE_CACHE_CONTROL
+        
+    def etag(self, encoding: Optional[str] = None) -> str:
+        # Each encoding is a different representation, so it needs its own strong ETag
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+        
+    def response(self, request: Request) -> Response:
+        """The best representation for ``request``, or 304 if the client has it"""
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), self.variants)
+        headers = {"ETag": self.etag(encoding), "Cache-Control": self.cache_control}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+            
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            return Response(self.variants[encoding], media_type=self.media_type, headers=headers)
+        if self.content is None:
+            return FileResponse(str(self.path), media_type=self.media_type, headers=headers)
+        return Response(self.content, media_type=self.media_type, headers=headers)
+        
+    def _digest(self) -> str:
+        if self.content is not None:
+            return hashlib.sha256(self.content).hexdigest()[:32]
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()[:32]
+        
+    def _load_precompressed(self, build_entry: dict):
+        # Compressed at build time at maximum quality - no CPU spent here
+        for encoding in build_entry.get("encodings", {}):
+            sibling = self.path.with_name(self.path.name + PRECOMPRESSED_SUFFIXES.get(encoding, ""))
+            if encoding in PRECOMPRESSED_SUFFIXES and sibling.is_file():
+                self.variants[encoding] = sibling.read_bytes()
+                
+    def _compress(self):
+        candidates = {"gzip": gzip.compress(self.content, compresslevel=STARTUP_GZIP_LEVEL, mtime=0)}
+        if BROTLI_AVAILABLE:
+            candidates["br"] = brotli.compress(self.content, quality=STARTUP_BROTLI_QUALITY)
+        self.variants = {encoding: data for encoding, data in candidates.items() if len(data) < self.size}
+
+class FrontendAssets:
+    """In-memory manifest of the frontend build, indexed once at startup"""
+    
+    def __init__(self, build_dir: Path):
+        self.build_dir = build_dir
+        self.assets: Dict[str, StaticAsset] = {}
+        build_manifest = self._load_build_manifest()
+        for path in sorted(build_dir.rglob("*")):
+            if not path.is_file() or path.name == ASSET_MANIFEST or self._is_precompressed_sibling(path):
+                continue
+            relative = path.relative_to(build_dir).as_posix()
+            self.assets[relative] = StaticAsset(path, relative, build_manifest.get(relative))
+        self.index = self.assets.get("index.html")
+        
+    @property
+    def precompressed(self) -> int:
+        return sum(1 for asset in self.assets.values() if asset.variants)
+        
+    def response(self, file_path: str, request: Request) -> Response:
+        """Serve a build file, falling back to index.html for React routes"""
+        asset = self.assets.get(file_path or "index.html")
+        if asset is None:
+            # A missing bundle must not be answered with HTML
+            if file_path.startswith("static/") or self.index is None:
+                raise HTTPException(status_code=404, detail="File not found")
+            asset = self.index
+        return asset.response(request)
+        
+    def _load_build_manifest(self) -> Dict[str, dict]:
+        try:
+            return json.loads((self.build_dir / ASSET_MANIFEST).read_text(encoding="utf-8")).get("assets", {})
+        except (OSError, ValueError):
+            return {}
+            
+    @staticmethod
+    def _is_precompressed_sibling(path: Path) -> bool:
+        return path.suffix in PRECOMPRESSED_SUFFIXES.values() and path.with_suffix("").is_file()
+
+# Serve the backend app inside the launcher's event loop instead of as a second process.
+# PyInstaller executables cannot start backend/main.py with sys.executable, so they default to it.
+SINGLE_PROCESS = (
+    '--single-process' in sys.argv
+    or os.getenv("SIRAJ_SINGLE_PROCESS", "true" if getattr(sys, 'frozen', False) else "false").lower() == "true"
+)
+# Paths the backend app answers; everything else is the frontend build
+BACKEND_PATH_PREFIXES = ("/api/", "/council/", "/ws/")
+BACKEND_PATHS = ("/health", "/metrics")
+
+def is_backend_path(path: str) -> bool:
+    return path in BACKEND_PATHS or path.startswith(BACKEND_PATH_PREFIXES)
+
+class BackendDispatcher:
+    """ASGI middleware handing backend paths straight to the in-process backend app"""
+    
+    def __init__(self, app, backend_app):
+        self.app = app
+        self.backend_app = backend_app
+        
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and is_backend_path(scope["path"]):
+            await self.backend_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+def bind_listen_socket(port: int, host: str = "0.0.0.0") -> Optional[socket.socket]:
+    """Socket bound to host:port for uvicorn to listen on, or None if the port is taken"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if sys.platform != 'win32':
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, port))
+    except OSError:
+        sock.close()
+        return None
+    sock.set_inheritable(True)
+    return sock
+
+# backend/main.py prints this once it is listening when started with SIRAJ_READY_LINE=true
+BACKEND_READY_LINE = "SIRAJ_BACKEND_READY"
+BACKEND_START_TIMEOUT = float(os.getenv("SIRAJ_BACKEND_START_TIMEOUT", "30"))
+# Backend output kept for reporting a failed start
+BACKEND_OUTPUT_LINES = 200
+# Fallback TCP probes back off from PROBE_INITIAL_DELAY up to PROBE_MAX_DELAY
+PROBE_INITIAL_DELAY = 0.01
+PROBE_MAX_DELAY = 0.5
+
+async def wait_for_port(host: str, port: int, timeout: float) -> bool:
+    """Connect probes with exponential backoff until something listens on host:port"""
+    deadline = time.monotonic() + timeout
+    delay = PROBE_INITIAL_DELAY
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port),
+                                               timeout=max(0.01, deadline - time.monotonic()))
+            writer.close()
+            return True
+        except (OSError, asyncio.TimeoutError):
+            if time.monotonic() + delay >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PROBE_MAX_DELAY)
+
+class ReadySignalServer(uvicorn.Server):
+    """uvicorn server that sets ``ready`` as soon as its sockets are listening"""
+    
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
+        self.ready = asyncio.Event()
+        
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            self.ready.set()
+
 class SynchronizedReadinessChecker:
     """Comprehensive readiness verification system"""
     
@@ -90,13 +488,14 @@ class SynchronizedReadinessChecker:
         self.target_port = target_port
         self.backend_url = backend_url
         
-    async def comprehensive_readiness_check(self, timeout_seconds=60) -> bool:
+    async def comprehensive_readiness_check(self, server: ReadySignalServer, server_task: asyncio.Task,
+                                            timeout_seconds=60) -> bool:
         """Multi-stage comprehensive readiness verification"""
         print(f"{Fore.YELLOW}🔍 System Readiness Verification...")
         
         # Stage 1: Frontend serving
         print(f"   Stage 1: Frontend service verification...")
-        frontend_ready = await self._check_frontend_responding(timeout_seconds)
+        frontend_ready = await self._wait_for_frontend(server, server_task, timeout_seconds)
         if not frontend_ready:
             print(f"{Fore.RED}   ❌ Frontend not responding")
             return False
@@ -113,20 +512,14 @@ class SynchronizedReadinessChecker:
         print(f"{Fore.GREEN}✅ Enhanced Educational Codex ready for browser activation")
         return True
         
-    async def _check_frontend_responding(self, timeout_seconds: int) -> bool:
-        """Wait for frontend to start responding"""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout_seconds:
-            try:
-                async with httpx.AsyncClient(timeout=3.0) as client:
-                    response = await client.get(f"http://{self.target_host}:{self.target_port}")
-                    if response.status_code == 200:
-                        return True
-            except:
-                await asyncio.sleep(1)
-                
-        return False
+    async def _wait_for_frontend(self, server: ReadySignalServer, server_task: asyncio.Task, timeout_seconds: int) -> bool:
+        """Wait for the in-process frontend server to listen (or to fail starting)"""
+        ready = asyncio.ensure_future(server.ready.wait())
+        try:
+            await asyncio.wait({ready, server_task}, timeout=timeout_seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+        return server.ready.is_set()
         
     async def _check_backend_running(self) -> bool:
         """Verify backend service is operational"""
@@ -142,11 +535,35 @@ class IntegratedEducationalCodexLauncher:
     
     def __init__(self):
         self.project_root = Path(__file__).parent
-        self.backend_process = None
+        self.backend_process: Optional[asyncio.subprocess.Process] = None
+        self.backend_output = collections.deque(maxlen=BACKEND_OUTPUT_LINES)
+        self.backend_reader: Optional[asyncio.Future] = None
+        self.single_process = SINGLE_PROCESS
+        self.backend_app: Optional[FastAPI] = None
         self.frontend_build_dir = self.project_root / "frontend" / "build"
+        self.backend_url = BACKEND_URL
+        self.frontend_assets: Optional[FrontendAssets] = None
         self.readiness_checker = SynchronizedReadinessChecker()
         self.shutdown_requested = False
+        self.startup_phases: List[Tuple[str, float]] = [
+            ("dependency check", DEPENDENCIES_CHECKED - LAUNCH_STARTED),
+            ("imports", MODULES_IMPORTED - DEPENDENCIES_CHECKED),
+        ]
+        self._phase_started = MODULES_IMPORTED
         
+    def mark_startup_phase(self, phase: str):
+        """Record how long the startup phase that just finished took"""
+        now = time.perf_counter()
+        self.startup_phases.append((phase, now - self._phase_started))
+        self._phase_started = now
+        
+    def show_startup_timings(self):
+        """Per-phase breakdown of launcher start to browser"""
+        total = time.perf_counter() - LAUNCH_STARTED
+        print(f"{Fore.CYAN}⏱️ Startup timing - {total:.2f}s from launch to browser:")
+        for phase, seconds in self.startup_phases:
+            print(f"{Fore.CYAN}   {phase:<30} {seconds:6.2f}s")
+            
     def show_integrated_banner(self):
         """Enhanced banner with integration status"""
         print(f"\n{Fore.CYAN}" + "="*95)
@@ -292,47 +709,47 @@ class IntegratedEducationalCodexLauncher:
             pass
             
         try:
-            # Install minimal backend requirements if needed
-            print(f"{Fore.YELLOW}📦 Checking backend dependencies...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'fastapi', 'uvicorn', 'structlog', '--quiet'], 
-                         capture_output=True)
-            
+            # Backend packages were verified by ensure_dependencies()
             # Start backend with explicit output
             env = os.environ.copy()
             env['PYTHONUNBUFFERED'] = '1'
+            # Serve without the reloader and announce readiness on stdout
+            env['SIRAJ_READY_LINE'] = 'true'
             
-            self.backend_process = subprocess.Popen(
-                [sys.executable, str(backend_main)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
+            self.backend_process = await asyncio.create_subprocess_exec(
+                sys.executable, str(backend_main),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
                 env=env,
+                limit=1024 * 1024,
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             )
             
             print(f"{Fore.YELLOW}⏳ Waiting for backend to start...")
             
-            # Monitor backend output
-            start_time = time.time()
-            while time.time() - start_time < 30:  # Extended timeout
-                # Check if backend started
-                try:
-                    async with httpx.AsyncClient(timeout=2.0) as client:
-                        response = await client.get("http://localhost:8000/health")
-                        if response.status_code == 200:
-                            print(f"{Fore.GREEN}✅ Backend service ready on port 8000")
-                            return True
-                except:
-                    pass
-                    
-                # Check if process died
-                if self.backend_process.poll() is not None:
-                    # Get error output
-                    output = self.backend_process.stdout.read().decode('utf-8', errors='ignore')
-                    print(f"{Fore.RED}❌ Backend process died!")
-                    print(f"{Fore.RED}Error output: {output[:500]}...")
-                    return False
+            # Whichever comes first: the ready line, a successful connect probe, or the process exiting
+            ready_line = asyncio.get_running_loop().create_future()
+            self.backend_reader = asyncio.ensure_future(self._read_backend_output(ready_line))
+            probe = asyncio.ensure_future(wait_for_port("localhost", 8000, BACKEND_START_TIMEOUT))
+            exited = asyncio.ensure_future(self.backend_process.wait())
+            try:
+                done, _ = await asyncio.wait({ready_line, probe, exited}, timeout=BACKEND_START_TIMEOUT,
+                                             return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in (ready_line, probe, exited):
+                    waiter.cancel()
                     
-                await asyncio.sleep(1)
+            if ready_line in done or (probe in done and probe.result()):
+                print(f"{Fore.GREEN}✅ Backend service ready on port 8000")
+                return True
+                
+            if exited in done:
+                # Let the reader collect the last output before reporting it
+                await asyncio.wait({self.backend_reader}, timeout=1)
+                output = "\n".join(list(self.backend_output)[-20:])
+                print(f"{Fore.RED}❌ Backend process died!")
+                print(f"{Fore.RED}Error output: {output[-500:]}...")
+                return False
                 
             print(f"{Fore.YELLOW}⚠️ Backend startup timeout - continuing with demo mode")
             return False
@@ -343,9 +760,47 @@ class IntegratedEducationalCodexLauncher:
             traceback.print_exc()
             return False
             
+    def load_backend_app(self) -> bool:
+        """Import the backend FastAPI app for single-process mode"""
+        print(f"{Fore.YELLOW}🔧 Loading backend educational council in-process...")
+        if str(self.project_root) not in sys.path:
+            sys.path.insert(0, str(self.project_root))
+        try:
+            from backend.main import app as backend_app
+        except Exception as e:
+            print(f"{Fore.YELLOW}⚠️ Backend import failed: {e} - continuing with demo mode")
+            return False
+        self.backend_app = backend_app
+        print(f"{Fore.GREEN}✅ Backend loaded - API and WebSockets share the launcher's event loop")
+        return True
+        
+    async def _read_backend_output(self, ready_line: asyncio.Future):
+        """Drain the backend's stdout for its whole life, resolving ``ready_line`` on the announcement"""
+        async for raw in self.backend_process.stdout:
+            line = raw.decode('utf-8', errors='ignore').rstrip()
+            self.backend_output.append(line)
+            if line.startswith(BACKEND_READY_LINE) and not ready_line.done():
+                ready_line.set_result(line)
+                
     def create_integrated_frontend_app(self) -> FastAPI:
         """Create integrated frontend app serving actual build"""
-        app = FastAPI(title="SIRAJ Enhanced Educational Codex - Integrated", version="15.2")
+        backend_app = self.backend_app
+        
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            if backend_app is not None:
+                # The dispatched backend gets no lifespan events of its own
+                async with backend_app.router.lifespan_context(backend_app):
+                    yield
+                return
+            # Opened once per server so proxied requests reuse warm connections
+            app.state.backend_client = create_backend_client(self.backend_url)
+            try:
+                yield
+            finally:
+                await app.state.backend_client.aclose()
+
+        app = FastAPI(title="SIRAJ Enhanced Educational Codex - Integrated", version="15.2", lifespan=lifespan)
         
         app.add_middleware(
             CORSMiddleware,
@@ -354,83 +809,40 @@ class IntegratedEducationalCodexLauncher:
             allow_headers=["*"]
         )
         
-        # Mount static files from frontend build
-        if self.frontend_build_dir.exists():
-            app.mount("/static", StaticFiles(directory=str(self.frontend_build_dir / "static")), name="static")
-            
-            @app.get("/")
-            async def serve_frontend_index():
-                """Serve the actual frontend index.html with transformations"""
-                index_path = self.frontend_build_dir / "index.html"
-                if index_path.exists():
-                    return FileResponse(str(index_path))
-                else:
-                    return HTMLResponse("Frontend build not found. Please run: npm run build")
-                    
-            @app.get("/{file_path:path}")
-            async def serve_frontend_files(file_path: str):
-                """Serve other frontend files"""
-                if file_path.startswith("api/"):
-                    # Let API endpoints be handled by other routes
-                    raise HTTPException(status_code=404, detail="API endpoint not found")
-                    
-                file_full_path = self.frontend_build_dir / file_path
-                if file_full_path.exists() and file_full_path.is_file():
-                    return FileResponse(str(file_full_path))
-                else:
-                    # Fallback to index.html for React routing
-                    index_path = self.frontend_build_dir / "index.html"
-                    if index_path.exists():
-                        return FileResponse(str(index_path))
-                    else:
-                        raise HTTPException(status_code=404, detail="File not found")
-        else:
-            @app.get("/")
-            async def no_frontend_build():
-                return HTMLResponse("""
-                <h1>Frontend Build Required</h1>
-                <p>Please build the frontend first:</p>
-                <pre>cd frontend && npm install && npm run build</pre>
-                """)
-            
-        # API proxy endpoints - comprehensive backend proxying
+        if backend_app is not None:
+            # Single-process mode: outermost, so backend paths never reach the proxies below
+            app.add_middleware(BackendDispatcher, backend_app=backend_app)
+        
+        # API proxy endpoints - streaming pass-through to the backend
         
         # Proxy all /api/* routes to backend
-        @app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
+        @app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
         async def proxy_api(path: str, request: Request):
-            """Proxy all /api/* requests to backend"""
+            """Proxy all /api/* requests to backend, including SSE streams"""
+            body = None
+            if path == "education/query" and request.method == "POST":
+                # Small JSON body, read up front so the demo fallback still has it
+                # if the backend fails after httpx consumed the request stream
+                body = await request.body()
             try:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    # Get request body if present
-                    body = None
-                    if request.method in ["POST", "PUT"]:
-                        body = await request.json()
-                    
-                    # Forward the request
-                    response = await client.request(
-                        method=request.method,
-                        url=f"http://localhost:8000/api/{path}",
-                        json=body,
-                        params=request.query_params
-                    )
-                    return response.json()
-            except Exception as e:
+                return await proxy_http(app.state.backend_client, request, f"/api/{path}", timeout=60.0, body=body)
+            except httpx.TransportError as e:
                 print(f"{Fore.YELLOW}⚠️ Backend API proxy failed for /api/{path}: {e}")
                 # Special handling for education queries
-                if path == "education/query" and request.method == "POST":
-                    body = await request.json()
-                    return self._generate_fallback_response(body)
+                if body is not None:
+                    try:
+                        return self._generate_fallback_response(json.loads(body))
+                    except (ValueError, AttributeError):
+                        pass
                 raise HTTPException(status_code=503, detail="Backend service unavailable")
         
         # Proxy /health endpoint
         @app.get("/health")
-        async def proxy_health():
+        async def proxy_health(request: Request):
             """Proxy health check to backend"""
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get("http://localhost:8000/health")
-                    return response.json()
-            except Exception:
+                return await proxy_http(app.state.backend_client, request, "/health", timeout=5.0)
+            except httpx.TransportError:
                 return {
                     "status": "degraded",
                     "frontend": "operational",
@@ -443,23 +855,39 @@ class IntegratedEducationalCodexLauncher:
         async def proxy_council(path: str, request: Request):
             """Proxy all /council/* requests to backend"""
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    # Get request body if present
-                    body = None
-                    if request.method == "POST":
-                        body = await request.json()
-                    
-                    # Forward the request
-                    response = await client.request(
-                        method=request.method,
-                        url=f"http://localhost:8000/council/{path}",
-                        json=body,
-                        params=request.query_params
-                    )
-                    return response.json()
-            except Exception as e:
+                return await proxy_http(app.state.backend_client, request, f"/council/{path}", timeout=30.0)
+            except httpx.TransportError as e:
                 print(f"{Fore.YELLOW}⚠️ Backend council proxy failed for /council/{path}: {e}")
                 raise HTTPException(status_code=503, detail="Council service unavailable")
+        
+        # Proxy /ws/* WebSockets (council streaming)
+        @app.websocket("/ws/{path:path}")
+        async def proxy_ws(websocket: WebSocket, path: str):
+            """Relay /ws/* WebSockets to the backend"""
+            url = self.backend_url.replace("http", "ws", 1) + f"/ws/{path}"
+            if websocket.url.query:
+                url += f"?{websocket.url.query}"
+            await proxy_websocket(websocket, url)
+            
+        # Frontend build - registered last so the catch-all cannot shadow the proxies
+        if self.frontend_build_dir.exists():
+            started = time.perf_counter()
+            self.frontend_assets = FrontendAssets(self.frontend_build_dir)
+            print(f"{Fore.GREEN}✅ Indexed {len(self.frontend_assets.assets)} frontend assets "
+                  f"({self.frontend_assets.precompressed} precompressed) in {time.perf_counter() - started:.2f}s")
+            
+            @app.api_route("/{file_path:path}", methods=["GET", "HEAD"])
+            async def serve_frontend_files(file_path: str, request: Request):
+                """Serve build files from memory; unknown routes get index.html for React routing"""
+                return self.frontend_assets.response(file_path, request)
+        else:
+            @app.get("/")
+            async def no_frontend_build():
+                return HTMLResponse("""
+                <h1>Frontend Build Required</h1>
+                <p>Please build the frontend first:</p>
+                <pre>cd frontend && npm install && npm run build</pre>
+                """)
                 
         return app
         
@@ -511,29 +939,51 @@ class IntegratedEducationalCodexLauncher:
         if not build_ready:
             print(f"{Fore.RED}❌ Cannot proceed without frontend build")
             return False
+        self.mark_startup_phase("frontend build check")
             
-        # Start backend first
-        backend_ready = await self.start_backend_service()
-        if not backend_ready:
-            print(f"{Fore.YELLOW}⚠️ Backend unavailable - continuing with demo mode")
+        sockets = [bind_listen_socket(3000)]
+        if sockets[0] is None:
+            print(f"{Fore.RED}❌ Port 3000 is already in use")
+            return False
+            
+        if self.single_process:
+            backend_ready = self.load_backend_app()
+            if backend_ready:
+                # Also answer on 8000, where frontend builds expect the API, from the same server
+                backend_socket = bind_listen_socket(8000)
+                if backend_socket is not None:
+                    sockets.append(backend_socket)
+                else:
+                    print(f"{Fore.YELLOW}⚠️ Port 8000 in use - backend reachable through port 3000 only")
+                self.readiness_checker.backend_url = "http://localhost:3000"
+            self.mark_startup_phase("backend import (in-process)")
+        else:
+            # Boot the backend while the frontend app is assembled and started
+            backend_task = asyncio.ensure_future(self.start_backend_service())
             
         # Create and start integrated frontend
         self.frontend_app = self.create_integrated_frontend_app()
+        self.mark_startup_phase("frontend app + asset index")
         
         config = uvicorn.Config(
             self.frontend_app,
-            host="0.0.0.0",
-            port=3000,
             log_level="error",
             access_log=False
         )
         
-        server = uvicorn.Server(config)
-        server_task = asyncio.create_task(server.serve())
+        server = ReadySignalServer(config)
+        server_task = asyncio.create_task(server.serve(sockets=sockets))
+        
+        if not self.single_process:
+            backend_ready = await backend_task
+            self.mark_startup_phase("backend (in parallel)")
+        if not backend_ready:
+            print(f"{Fore.YELLOW}⚠️ Backend unavailable - continuing with demo mode")
         
         # Wait for readiness
         print(f"{Fore.YELLOW}🌐 Activating Enhanced Educational Codex with integrated frontend...")
-        ready = await self.readiness_checker.comprehensive_readiness_check(timeout_seconds=30)
+        ready = await self.readiness_checker.comprehensive_readiness_check(server, server_task, timeout_seconds=30)
+        self.mark_startup_phase("readiness check")
         
         if ready:
             print(f"\n{Fore.GREEN}✅ Enhanced Educational Codex ready with frontend transformation")
@@ -541,7 +991,10 @@ class IntegratedEducationalCodexLauncher:
             # Open browser
             print(f"{Fore.GREEN}🌐 Opening browser to integrated interface...")
             try:
+                import webbrowser
                 webbrowser.open('http://localhost:3000')
+                self.mark_startup_phase("browser launch")
+                self.show_startup_timings()
                 print(f"{Fore.GREEN}✅ Browser opened to Enhanced Educational Codex")
                 print(f"{Fore.GREEN}🎭 Educational Council ready with API hook transformation")
             except Exception as e:
@@ -562,21 +1015,28 @@ class IntegratedEducationalCodexLauncher:
             while not self.shutdown_requested:
                 await asyncio.sleep(1)
         finally:
+            server.should_exit = True
+            await asyncio.wait({server_task}, timeout=5)
+            for sock in sockets:
+                sock.close()
             await self.cleanup()
             
     async def cleanup(self):
         """Clean shutdown"""
         print(f"\n{Fore.YELLOW}🛑 Shutting down Enhanced Educational Codex...")
-        
-        if self.backend_process:
+
+        if self.backend_process and self.backend_process.returncode is None:
             try:
                 self.backend_process.terminate()
-                self.backend_process.wait(timeout=5)
+                await asyncio.wait_for(self.backend_process.wait(), timeout=5)
                 print(f"{Fore.GREEN}✅ Backend stopped")
-            except:
-                self.backend_process.kill()
+            except (asyncio.TimeoutError, ProcessLookupError):
+                if self.backend_process.returncode is None:
+                    self.backend_process.kill()
                 print(f"{Fore.YELLOW}⚠️ Backend force stopped")
-                
+        if self.backend_reader:
+            self.backend_reader.cancel()
+
         print(f"{Fore.GREEN}👋 Shutdown complete")
         
     async def run(self):
@@ -591,7 +1051,10 @@ class IntegratedEducationalCodexLauncher:
             
             print(f"\n{Fore.GREEN}" + "="*95)
             print(f"{Fore.GREEN}🎭 SIRAJ Enhanced Educational Codex - Integrated System")
-            print(f"{Fore.GREEN}🔧 Backend: FastAPI with 7 AI archetypes on port 8000")
+            if self.single_process:
+                print(f"{Fore.GREEN}🔧 Backend: FastAPI with 7 AI archetypes in the launcher process")
+            else:
+                print(f"{Fore.GREEN}🔧 Backend: FastAPI with 7 AI archetypes on port 8000")
             print(f"{Fore.GREEN}🎨 Frontend: React build with API hook transformation on port 3000")
             print(f"{Fore.GREEN}🏛️ 7 Enhanced Archetypal Teachers Ready")
             print(f"{Fore.GREEN}📊 System Status Indicators: ✅ Included")
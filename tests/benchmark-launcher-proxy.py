@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Launcher Proxy Benchmark
+========================
+Measure the per-request overhead the port-3000 launcher adds when proxying
+to the backend. A stub backend is served on localhost so the numbers show
+the proxy's own cost, not the cost of generation:
+
+- direct:      client -> backend over a keep-alive connection
+- per-request: a new httpx.AsyncClient for each backend call, as the
+               launcher's proxy did before it held a pooled client
+- launcher:    client -> launcher app (pooled proxy) -> backend
+
+Usage: python tests/benchmark-launcher-proxy.py [requests]
+"""
+
+import asyncio
+import logging
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from launcher import IntegratedEducationalCodexLauncher  # noqa: E402
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def stub_backend() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.post("/api/education/query")
+    async def query(body: dict):
+        return {"topic": body.get("topic"), "council_responses": {}}
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def serve(app: FastAPI, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error"))
+    asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server
+
+
+async def timed(call, requests: int) -> list:
+    await call()  # warm up
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(name: str, samples: list, baseline: float):
+    median = statistics.median(samples)
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(f"   {name:<12} median {median:6.2f} ms   p95 {p95:6.2f} ms   overhead {median - baseline:+6.2f} ms")
+
+
+async def run_benchmark(requests: int):
+    backend_port, launcher_port = free_port(), free_port()
+    backend_url = f"http://127.0.0.1:{backend_port}"
+
+    launcher = IntegratedEducationalCodexLauncher()
+    launcher.backend_url = backend_url
+    launcher.frontend_build_dir = Path("/nonexistent")  # API proxying only
+
+    servers = [await serve(stub_backend(), backend_port),
+               await serve(launcher.create_integrated_frontend_app(), launcher_port)]
+
+    async with httpx.AsyncClient() as pooled:
+        async def direct():
+            await pooled.get(f"{backend_url}/health")
+
+        async def per_request_client():
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                await client.get(f"{backend_url}/health")
+
+        async def through_launcher():
+            await pooled.get(f"http://127.0.0.1:{launcher_port}/health")
+
+        print(f"🔍 Launcher proxy overhead over {requests} sequential /health requests")
+        baseline = statistics.median(await timed(direct, requests))
+        report("direct", await timed(direct, requests), baseline)
+        report("per-request", await timed(per_request_client, requests), baseline)
+        report("launcher", await timed(through_launcher, requests), baseline)
+
+    for server in servers:
+        server.should_exit = True
+    await asyncio.sleep(0.2)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
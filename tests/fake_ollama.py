@@ -0,0 +1,219 @@
+"""
+SIRAJ Educational AI - Fake Ollama Server
+=========================================
+
+In-process stand-in for the Ollama REST API used by the backend tests.
+Serves ``/api/tags``, ``/api/generate`` and ``/api/chat`` (JSON and NDJSON
+streaming) as an ASGI app, so tests can drive ``AsyncOllamaClient`` through
+``httpx.ASGITransport`` without a real model or network socket.
+``make_council`` builds the ``EducationalCouncil`` the council tests run
+against it.
+
+Prompt evaluation is modelled on Ollama's KV cache: each model keeps a few
+slots of evaluated token sequences, a request only pays for tokens past the
+longest prefix it shares with a slot, and a ``context`` array from an earlier
+response is continued instead of re-evaluated.
+"""
+
+import asyncio
+import json
+import socket
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+class FakeOllama:
+    """Configurable fake Ollama server"""
+
+    def __init__(
+        self,
+        response_text: str = "Fake archetype response about the topic.",
+        token_delay: float = 0.0,
+        models: Optional[List[str]] = None,
+        fail_with: Optional[int] = None,
+        model_delays: Optional[Dict[str, float]] = None,
+        prompt_token_cost: float = 0.0,
+        kv_slots: int = 4,
+        eval_rate: float = 20.0,
+    ):
+        self.response_text = response_text
+        self.token_delay = token_delay
+        self.models = models or ["gemma3n:e4b", "gemma3n:e2b"]
+        self.fail_with = fail_with
+        # Extra latency before a model starts answering (e.g. a slow primary model)
+        self.model_delays = model_delays or {}
+        # Seconds to evaluate one uncached prompt token
+        self.prompt_token_cost = prompt_token_cost
+        self.kv_slots = kv_slots
+        # Tokens per second reported through eval_count / eval_duration
+        self.eval_rate = eval_rate
+        self._cache: Dict[str, List[List[int]]] = {}
+        self._vocab: Dict[str, int] = {}
+        self.requests: List[Dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = self._build_app()
+
+    def client(self, host: str = "http://ollama.test", **kwargs):
+        """AsyncOllamaClient wired to this fake through an in-process transport"""
+        from backend.ollama_http import AsyncOllamaClient
+        return AsyncOllamaClient(host, transport=httpx.ASGITransport(app=self.app), **kwargs)
+
+    @asynccontextmanager
+    async def serve(self) -> AsyncIterator[int]:
+        """Serve the fake on a free localhost port for the duration of the block"""
+        import uvicorn
+
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        server = uvicorn.Server(uvicorn.Config(self.app, log_level="warning", lifespan="off"))
+        task = asyncio.ensure_future(server.serve(sockets=[sock]))
+        while not server.started:
+            await asyncio.sleep(0.01)
+        try:
+            yield sock.getsockname()[1]
+        finally:
+            server.should_exit = True
+            await task
+            sock.close()
+
+    def tokens(self) -> List[str]:
+        """Split the canned response into streamable tokens"""
+        words = self.response_text.split(" ")
+        return [w if i == 0 else f" {w}" for i, w in enumerate(words)]
+
+    def tokenize(self, text: str) -> List[int]:
+        """Word-level token ids, stable for the lifetime of the fake"""
+        return [self._vocab.setdefault(word, len(self._vocab)) for word in text.split()]
+
+    def evaluate_prompt(self, payload: Dict) -> Dict:
+        """Simulate prompt evaluation against the per-model KV cache slots"""
+        if "messages" in payload:
+            sequence = [
+                token
+                for message in payload["messages"]
+                for token in self.tokenize(f"<{message['role']}> {message['content']}")
+            ]
+        elif payload.get("context"):
+            sequence = list(payload["context"]) + self.tokenize(payload["prompt"])
+        else:
+            sequence = self.tokenize(payload.get("system", "")) + self.tokenize(payload["prompt"])
+
+        slots = self._cache.setdefault(payload["model"], [])
+        best, reused = None, 0
+        for slot in slots:
+            shared = 0
+            for cached, token in zip(slot, sequence):
+                if cached != token:
+                    break
+                shared += 1
+            if best is None or shared > reused:
+                best, reused = slot, shared
+        if reused:
+            slots.remove(best)
+        elif len(slots) >= self.kv_slots:
+            slots.pop(0)
+
+        reply = f"<assistant> {self.response_text}" if "messages" in payload else self.response_text
+        context = sequence + self.tokenize(reply)
+        slots.append(context)
+        evaluated = len(sequence) - reused
+        return {
+            "prompt_eval_count": evaluated,
+            "prompt_eval_duration": int(evaluated * self.prompt_token_cost * 1e9),
+            "context": context,
+        }
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/api/tags")
+        async def tags():
+            return {"models": [{"name": name} for name in self.models]}
+
+        @app.post("/api/generate")
+        async def generate(request: Request):
+            return await self._respond(await request.json(), lambda text: {"response": text})
+
+        @app.post("/api/chat")
+        async def chat(request: Request):
+            def message(text):
+                return {"message": {"role": "assistant", "content": text}}
+
+            return await self._respond(await request.json(), message)
+
+        return app
+
+    async def _respond(self, payload: Dict, body: Callable[[str], Dict]):
+        """Shared generate/chat handler; ``body`` wraps response text in the endpoint's shape"""
+        self.requests.append(payload)
+
+        if self.fail_with:
+            return JSONResponse(status_code=self.fail_with, content={"error": "fake failure"})
+
+        startup = self.model_delays.get(payload["model"], 0.0)
+        evaluation = self.evaluate_prompt(payload)
+        if "messages" in payload:
+            evaluation.pop("context")
+        startup += evaluation["prompt_eval_duration"] / 1e9
+        evaluation["eval_count"] = len(self.tokens())
+        evaluation["eval_duration"] = int(len(self.tokens()) / self.eval_rate * 1e9)
+        evaluation["load_duration"] = 0
+        evaluation["total_duration"] = evaluation["prompt_eval_duration"] + evaluation["eval_duration"]
+        if not payload.get("stream", True):
+            self._enter()
+            try:
+                await asyncio.sleep(startup + self.token_delay * len(self.tokens()))
+            finally:
+                self._exit()
+            return {"model": payload["model"], **body(self.response_text), "done": True, **evaluation}
+
+        async def stream():
+            self._enter()
+            try:
+                await asyncio.sleep(startup)
+                for token in self.tokens():
+                    await asyncio.sleep(self.token_delay)
+                    yield json.dumps({"model": payload["model"], **body(token), "done": False}) + "\n"
+                yield json.dumps({"model": payload["model"], **body(""), "done": True, **evaluation}) + "\n"
+            finally:
+                self._exit()
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    def _enter(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self):
+        self.in_flight -= 1
+
+
+def make_council(
+    fake: FakeOllama,
+    response_cache: Optional[Any] = None,
+    metrics: Optional[Any] = None,
+    router_options: Optional[Dict[str, Any]] = None,
+):
+    """``EducationalCouncil`` whose Ollama client talks to ``fake``
+
+    Gets its own ``ResponseCache`` unless one is given, so tests never share
+    cached answers; ``router_options`` replace the client's ``ModelRouter``.
+    """
+    from backend.main import EducationalCouncil, OllamaEducationalClient
+    from backend.model_router import ModelRouter
+    from backend.response_cache import ResponseCache
+
+    client = OllamaEducationalClient(client=fake.client(), metrics=metrics,
+                                     response_cache=response_cache if response_cache is not None else ResponseCache())
+    if router_options is not None:
+        client.router = ModelRouter(client.primary_model, client.lightweight_model, client.scheduler,
+                                    **router_options)
+    client.ollama_available = True
+    council = EducationalCouncil()
+    council.ollama_client = client
+    return council
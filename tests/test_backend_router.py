@@ -0,0 +1,89 @@
+"""
+SIRAJ Educational AI - Multi-Instance Council Tests
+==================================================
+
+``MultiInstanceCouncil`` fans archetypes out concurrently, reports early
+finishers as they complete, and cancels archetypes that exceed the timeout.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.backend_router import MultiInstanceCouncil
+
+
+class FakeRouterClient:
+    """Router stand-in: each instance serves one generation at a time"""
+
+    def __init__(self, delays, instances=("A", "B")):
+        self.delays = delays
+        self.instances = {name: asyncio.Semaphore(1) for name in instances}
+        self.assignment = {}
+        self.cancelled = []
+
+    def instance_for(self, archetype):
+        if archetype not in self.assignment:
+            names = list(self.instances)
+            self.assignment[archetype] = names[len(self.assignment) % len(names)]
+        return self.assignment[archetype]
+
+    async def generate(self, prompt, archetype=None, context=None):
+        instance = self.instance_for(archetype)
+        async with self.instances[instance]:
+            try:
+                await asyncio.sleep(self.delays[archetype])
+            except asyncio.CancelledError:
+                self.cancelled.append(archetype)
+                raise
+        return {"response": f"{archetype} answer", "instance": instance}
+
+
+@pytest.mark.asyncio
+async def test_archetypes_run_concurrently_across_instances():
+    archetypes = ["socratic", "mentor", "analyst", "storyteller"]
+    delays = dict.fromkeys(archetypes, 0.05)
+
+    started = time.monotonic()
+    await MultiInstanceCouncil(FakeRouterClient(delays, instances=("A",))).create_council_response("Q", archetypes)
+    one_instance = time.monotonic() - started
+
+    started = time.monotonic()
+    result = await MultiInstanceCouncil(FakeRouterClient(delays)).create_council_response("Q", archetypes)
+    two_instances = time.monotonic() - started
+
+    assert result["success_rate"] == 1.0
+    assert two_instances < one_instance * 0.7
+
+
+@pytest.mark.asyncio
+async def test_early_finishers_are_reported_first_and_stragglers_time_out():
+    client = FakeRouterClient({"socratic": 0.01, "mentor": 0.03, "analyst": 5.0},
+                              instances=("A", "B", "C"))
+    order = []
+
+    result = await MultiInstanceCouncil(client).create_council_response(
+        "Q", ["analyst", "mentor", "socratic"], timeout=0.1,
+        on_response=lambda archetype, response: order.append(archetype)
+    )
+
+    assert order == ["socratic", "mentor", "analyst"]
+    assert list(result["responses"]) == ["analyst", "mentor", "socratic"]
+    assert result["responses"]["analyst"]["timed_out"] is True
+    assert result["responses"]["mentor"]["success"] is True
+    assert client.cancelled == ["analyst"]
+
+
+@pytest.mark.asyncio
+async def test_stopping_the_stream_cancels_remaining_archetypes():
+    client = FakeRouterClient({"socratic": 0.01, "mentor": 5.0, "analyst": 5.0},
+                              instances=("A", "B", "C"))
+    council = MultiInstanceCouncil(client)
+
+    stream = council.stream_council_responses("Q", ["socratic", "mentor", "analyst"])
+    archetype, response = await stream.__anext__()
+    await stream.aclose()
+
+    assert archetype == "socratic" and response["success"]
+    assert sorted(client.cancelled) == ["analyst", "mentor"]
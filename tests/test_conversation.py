@@ -0,0 +1,78 @@
+"""
+SIRAJ Educational AI - Multi-Turn Session Tests
+==============================================
+
+Follow-up queries continue a session: turns are appended, each archetype
+sees its own earlier exchanges, and history stays within the token budget.
+"""
+
+import pytest
+
+from backend.conversation import COMPACTION_STEP, append_turn, archetype_history, estimate_tokens
+from backend.main import EducationalQueryRequest
+from fake_ollama import FakeOllama, make_council
+
+
+def conversation(length, answer="An answer. With a second sentence that goes on for a while."):
+    turns = []
+    for i in range(length):
+        turns = append_turn(turns, f"Question {i}", "Grade Level: middle", {"mentor": f"{answer} #{i}"}, None)
+    return turns
+
+
+@pytest.mark.asyncio
+async def test_follow_up_appends_turn_and_resends_history():
+    fake = FakeOllama(response_text="Leaves use sunlight to make sugar.")
+    council = make_council(fake)
+    request = dict(selected_archetypes=["socratic"], session_id="student-1")
+
+    await council.process_educational_query(EducationalQueryRequest(topic="Photosynthesis", **request))
+    first = fake.requests[0]
+    response = await council.process_educational_query(
+        EducationalQueryRequest(topic="Why are leaves green?", **request))
+    follow_up = fake.requests[2]
+
+    assert response.turn == 2
+    session = await council.active_sessions.get("student-1")
+    assert [t["topic"] for t in session["turns"]] == ["Photosynthesis", "Why are leaves green?"]
+    assert first["keep_alive"] and len(first["messages"]) == 2
+    assert follow_up["messages"][:2] == first["messages"]
+    assert follow_up["messages"][2] == {"role": "assistant", "content": "Leaves use sunlight to make sugar."}
+    assert fake.evaluate_prompt(follow_up)["prompt_eval_count"] < fake.evaluate_prompt(first)["prompt_eval_count"] + 40
+
+
+@pytest.mark.asyncio
+async def test_unnamed_sessions_start_fresh():
+    fake = FakeOllama()
+    council = make_council(fake)
+
+    await council.process_educational_query(EducationalQueryRequest(topic="Tides", selected_archetypes=["mentor"]))
+    await council.process_educational_query(EducationalQueryRequest(topic="Tides", selected_archetypes=["mentor"]))
+
+    assert all(len(r["messages"]) == 2 for r in fake.requests if "messages" in r)
+
+
+def test_history_is_only_for_the_archetype():
+    turns = append_turn([], "Tides", "ctx", {"mentor": "Moon pulls water."}, "synthesis")
+
+    assert archetype_history(turns, "socratic") == []
+    assert [m["role"] for m in archetype_history(turns, "mentor")] == ["user", "assistant"]
+
+
+def test_history_stays_within_budget_as_conversation_grows():
+    budget, summary_budget = 200, 60
+    sizes = []
+    for length in range(1, 40):
+        messages = archetype_history(conversation(length), "mentor", budget, summary_budget)
+        sizes.append(sum(estimate_tokens(m["content"]) for m in messages))
+
+    assert max(sizes) <= budget + summary_budget
+    summary = archetype_history(conversation(39), "mentor", budget, summary_budget)[0]
+    assert summary["role"] == "system" and "earlier topics omitted" in summary["content"]
+
+
+def test_summary_boundary_moves_in_steps():
+    budget = 200
+    prefixes = [archetype_history(conversation(n), "mentor", budget)[0]["content"] for n in range(12, 12 + COMPACTION_STEP * 3)]
+
+    assert len(set(prefixes)) <= 4
@@ -0,0 +1,120 @@
+"""
+SIRAJ Educational AI - Council Pipeline Tests
+============================================
+
+Quorum-based pipelined synthesis: synthesis starts before the slowest
+archetype finishes, late arrivals are folded in, stragglers are cut off.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.main import ArchetypeGeneration, EducationalCouncil, EducationalQueryRequest
+
+ARCHETYPES = ["socratic", "constructivist", "synthesizer", "mentor"]
+
+
+def make_council(delays, quorum, deadline=1.0, late_arrivals="refine", synthesis_delay=0.05):
+    council = EducationalCouncil()
+    council.ollama_client.ollama_available = True
+    council.synthesis_quorum = quorum
+    council.straggler_deadline = deadline
+    council.late_arrivals = late_arrivals
+    council.prompts = []
+
+    async def generate_archetype(archetype, prompt, context="", use_cache=True, history=None):
+        await asyncio.sleep(delays[archetype])
+        return ArchetypeGeneration(f"{archetype} perspective")
+
+    async def generate_completion(prompt, system=None, options=None):
+        council.prompts.append(prompt)
+        await asyncio.sleep(synthesis_delay)
+        return {"response": f"synthesis #{len(council.prompts)}"}
+
+    council.ollama_client.generate_archetype = generate_archetype
+    council.ollama_client.generate_completion = generate_completion
+    return council
+
+
+@pytest.mark.asyncio
+async def test_quorum_starts_synthesis_before_straggler():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 0.2}
+    council = make_council(delays, quorum=0.75)
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    response = await council.process_educational_query(request)
+
+    draft_prompt, refine_prompt = council.prompts
+    assert "mentor perspective" not in draft_prompt
+    assert "mentor perspective" in refine_prompt and "synthesis #1" in refine_prompt
+    assert response.synthesis == "synthesis #2"
+    assert list(response.council_responses) == ARCHETYPES
+    assert all(r.success for r in response.council_responses.values())
+
+
+@pytest.mark.asyncio
+async def test_straggler_past_deadline_is_cancelled():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 5}
+    council = make_council(delays, quorum=3, deadline=0.1)
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    started = time.monotonic()
+    response = await council.process_educational_query(request)
+
+    assert time.monotonic() - started < 1
+    assert response.council_responses["mentor"].success is False
+    assert len(council.prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_stragglers_do_not_hold_the_council_until_the_deadline():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 0.05}
+    council = make_council(delays, quorum=3, deadline=5)
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    started = time.monotonic()
+    response = await council.process_educational_query(request)
+
+    assert time.monotonic() - started < 1
+    assert response.council_responses["mentor"].success
+    assert len(council.prompts) == 2
+
+
+@pytest.mark.asyncio
+async def test_refine_is_skipped_when_the_deadline_leaves_no_room():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 0.3}
+    council = make_council(delays, quorum=3, deadline=0.6, synthesis_delay=0.4)
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    response = await council.process_educational_query(request)
+
+    assert response.council_responses["mentor"].response == "mentor perspective"
+    assert len(council.prompts) == 1
+    assert response.synthesis == "synthesis #1"
+
+
+@pytest.mark.asyncio
+async def test_skip_mode_reports_late_arrivals_without_refining():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 0.1}
+    council = make_council(delays, quorum=3, late_arrivals="skip")
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    response = await council.process_educational_query(request)
+
+    assert response.council_responses["mentor"].response == "mentor perspective"
+    assert response.synthesis == "synthesis #1"
+
+
+@pytest.mark.asyncio
+async def test_zero_quorum_waits_for_whole_council():
+    delays = {"socratic": 0.01, "constructivist": 0.01, "synthesizer": 0.01, "mentor": 0.05}
+    council = make_council(delays, quorum=0)
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    response = await council.process_educational_query(request)
+
+    assert len(council.prompts) == 1
+    assert "mentor perspective" in council.prompts[0]
+    assert response.synthesis == "synthesis #1"
@@ -0,0 +1,91 @@
+"""
+SIRAJ Educational AI - Council Streaming Tests
+=============================================
+
+Verifies the token-streaming council pipeline and its Server-Sent Events
+endpoint against the in-process fake Ollama server.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import backend.main as backend_main
+from backend.main import EducationalQueryRequest
+from fake_ollama import FakeOllama, make_council
+
+
+def parse_sse(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_stream_interleaves_archetypes_then_synthesis():
+    council = make_council(FakeOllama(response_text="alpha beta gamma delta"))
+
+    async def paced_tokens(archetype, prompt, context="", use_cache=True, history=None):
+        for token in ["alpha", " beta", " gamma", " delta"]:
+            await asyncio.sleep(0.001)
+            yield token
+
+    council.ollama_client.stream_archetype = paced_tokens
+    request = EducationalQueryRequest(topic="Photosynthesis", selected_archetypes=["socratic", "mentor"])
+
+    events = [event async for event in council.stream_educational_query(request)]
+    types = [event["type"] for event in events]
+
+    assert types[0] == "session_start"
+    assert types[-1] == "session_complete"
+    assert types.index("synthesis_start") > max(i for i, t in enumerate(types) if t == "archetype_complete")
+
+    chunks = [(i, e["archetype"]) for i, e in enumerate(events) if e["type"] == "archetype_chunk"]
+    socratic = [i for i, a in chunks if a == "socratic"]
+    mentor = [i for i, a in chunks if a == "mentor"]
+    assert min(mentor) < max(socratic), "archetype tokens should interleave as produced"
+
+    text = "".join(e["chunk"] for e in events if e["type"] == "archetype_chunk" and e["archetype"] == "mentor")
+    assert text == "alpha beta gamma delta"
+
+    final = events[-1]["response"]
+    assert final["synthesis"] == "alpha beta gamma delta"
+    assert set(final["council_responses"]) == {"socratic", "mentor"}
+    assert await council.active_sessions.get(final["session_id"]) is not None
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_when_ollama_unavailable():
+    council = make_council(FakeOllama())
+    council.ollama_client.ollama_available = False
+    request = EducationalQueryRequest(topic="Fractions", selected_archetypes=["analyst"])
+
+    events = [event async for event in council.stream_educational_query(request)]
+
+    complete = next(e for e in events if e["type"] == "archetype_complete")
+    assert "demonstration response" in complete["response"]["response"]
+    assert events[-1]["type"] == "session_complete"
+
+
+@pytest.mark.asyncio
+async def test_sse_endpoint_streams_event_frames(monkeypatch):
+    monkeypatch.setattr(backend_main, "educational_council", make_council(FakeOllama(response_text="hello class")))
+    transport = httpx.ASGITransport(app=backend_main.app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/education/query/stream",
+                                     json={"topic": "Gravity", "selected_archetypes": ["storyteller"]})
+        rejected = await client.post("/api/education/query/stream",
+                                     json={"topic": "Gravity", "selected_archetypes": ["wizard"]})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert events[0][0] == "session_start"
+    assert ("archetype_chunk", {"type": "archetype_chunk", "archetype": "storyteller", "chunk": "hello"}) in events
+    assert events[-1][0] == "session_complete"
+    assert rejected.status_code == 400
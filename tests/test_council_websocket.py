@@ -0,0 +1,187 @@
+"""
+SIRAJ Educational AI - Council WebSocket Tests
+=============================================
+
+Covers the /ws/council/{session_id} protocol spoken by useSirajWebSocket,
+shared sessions across tabs and per-socket backpressure.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.main as backend_main
+from backend.streaming import ConnectionManager, CouncilBroadcast, SocketChannel
+from fake_ollama import FakeOllama, make_council
+
+
+@pytest.fixture
+def fake_council(monkeypatch):
+    fake = FakeOllama(response_text="stream me please", token_delay=0.01)
+    council = make_council(fake)
+    monkeypatch.setattr(backend_main, "educational_council", council)
+    monkeypatch.setattr(backend_main, "connection_manager", ConnectionManager())
+    return fake
+
+
+def receive_until_complete(ws):
+    messages = []
+    while True:
+        message = ws.receive_json()
+        messages.append(message)
+        if message["type"] in ("session_complete", "error"):
+            return messages
+
+
+def test_websocket_streams_council_protocol(fake_council):
+    client = TestClient(backend_main.app)
+    with client.websocket_connect("/ws/council/session-1") as ws:
+        ws.send_json({"type": "educational_request",
+                      "request": {"topic": "Volcanoes", "selected_archetypes": ["socratic", "analyst"]}})
+        messages = receive_until_complete(ws)
+
+    types = [m["type"] for m in messages]
+    assert types[0] == "session_start"
+    assert types.count("archetype_start") == 2
+    assert types.count("archetype_complete") == 2
+    assert "synthesis_complete" in types
+    assert types[-1] == "session_complete"
+
+    chunks = [m for m in messages if m["type"] == "archetype_chunk"]
+    assert chunks and all("content" in m for m in chunks)
+    assert messages[-1]["response"]["session_id"] == "session-1"
+
+    # Fields CouncilSession.js reads
+    starts = [m for m in messages if m["type"] == "archetype_start"]
+    assert all(m["emoji"] and m["name"] for m in starts)
+    completes = [m for m in messages if m["type"] == "archetype_complete"]
+    assert all(m["full_response"] == "stream me please" for m in completes)
+
+
+def test_tabs_share_one_generation(fake_council):
+    client = TestClient(backend_main.app)
+    request = {"type": "educational_request",
+               "request": {"topic": "Tides", "selected_archetypes": ["mentor"]}}
+    with client.websocket_connect("/ws/council/shared") as tab_a, \
+            client.websocket_connect("/ws/council/shared") as tab_b:
+        tab_a.send_json(request)
+        tab_b.send_json(request)
+        messages_a = receive_until_complete(tab_a)
+        messages_b = receive_until_complete(tab_b)
+
+    assert messages_a[-1]["type"] == messages_b[-1]["type"] == "session_complete"
+    # One archetype generation plus one synthesis - not doubled for the second tab
+    assert len(fake_council.requests) == 2
+
+
+def test_unknown_archetype_reports_error(fake_council):
+    client = TestClient(backend_main.app)
+    with client.websocket_connect("/ws/council/bad") as ws:
+        ws.send_json({"type": "educational_request",
+                      "request": {"topic": "Tides", "selected_archetypes": ["wizard"]}})
+        message = ws.receive_json()
+
+    assert message["type"] == "error"
+    assert "wizard" in message["message"]
+
+
+class StalledSocket:
+    """WebSocket stand-in whose sends never complete"""
+
+    def __init__(self):
+        self.closed_with = None
+        self.sent = []
+
+    async def send_text(self, message):
+        self.sent.append(message)
+        await asyncio.Event().wait()
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_slow_socket_coalesces_chunks_and_is_capped():
+    socket = StalledSocket()
+    channel = SocketChannel(socket, max_pending=3).start()
+    await asyncio.sleep(0)
+
+    channel.offer({"type": "archetype_start", "archetype": "mentor"})
+    await asyncio.sleep(0)
+    for i in range(50):
+        assert channel.offer({"type": "archetype_chunk", "archetype": "mentor", "content": "x" * i})
+
+    assert channel.coalesced == 49
+    assert channel.offer({"type": "archetype_complete", "archetype": "mentor"})
+    assert channel.offer({"type": "synthesis_start"})
+    assert not channel.offer({"type": "synthesis_complete", "synthesis": "done"})
+    await asyncio.sleep(0)
+    assert socket.closed_with == 1013
+    await channel.close()
+
+
+class SlowSocket:
+    """WebSocket stand-in that sends one message per few milliseconds"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, message):
+        await asyncio.sleep(0.005)
+        self.sent.append(json.loads(message))
+
+    async def close(self, code=1000):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_coalesced_chunks_rebuild_the_complete_text():
+    tokens = [f"token{i} " for i in range(60)]
+
+    async def source():
+        for token in tokens:
+            yield {"type": "archetype_chunk", "archetype": "mentor", "chunk": token}
+            await asyncio.sleep(0.001)
+        yield {"type": "archetype_complete", "archetype": "mentor", "full_response": "".join(tokens)}
+        yield {"type": "session_complete", "session_id": "s"}
+
+    socket = SlowSocket()
+    channel = SocketChannel(socket).start()
+    broadcast = CouncilBroadcast(source())
+    broadcast.subscribe(channel.offer)
+    await broadcast.start().task
+    while channel._pending:
+        await asyncio.sleep(0.01)
+    await channel.close()
+
+    # What CouncilSession.js does: append every chunk
+    streamed = "".join(m["chunk"] for m in socket.sent if m["type"] == "archetype_chunk")
+    assert channel.coalesced > 0
+    assert streamed == "".join(tokens)
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_receives_replay():
+    release = asyncio.Event()
+
+    async def source():
+        yield {"type": "session_start", "session_id": "s"}
+        yield {"type": "archetype_chunk", "archetype": "mentor", "chunk": "Hello"}
+        yield {"type": "archetype_chunk", "archetype": "mentor", "chunk": " there"}
+        await release.wait()
+        yield {"type": "session_complete", "session_id": "s"}
+
+    broadcast = CouncilBroadcast(source()).start()
+    await asyncio.sleep(0.01)
+
+    late = []
+    broadcast.subscribe(lambda event: late.append(event) or True)
+    release.set()
+    await broadcast.task
+
+    assert late[0]["type"] == "session_start"
+    assert late[1] == {"type": "archetype_chunk", "archetype": "mentor", "chunk": "Hello there",
+                       "content": "Hello there"}
+    assert late[-1]["type"] == "session_complete"
@@ -0,0 +1,107 @@
+"""
+SIRAJ Educational AI - Frontend Build Post-processing Tests
+==========================================================
+
+Build-time precompression, the asset manifest and the bundle size budget
+in frontend/build_frontend.py, and the launcher serving those siblings.
+"""
+
+import gzip
+import json
+
+import pytest
+
+import launcher
+from frontend.build_frontend import ASSET_MANIFEST, SpiralFrontendBuilder
+
+BUNDLE = b"export const archetypes = ['socratic', 'constructivist', 'storyteller'];\n" * 400
+
+
+@pytest.fixture
+def builder(tmp_path):
+    build_dir = tmp_path / "build"
+    (build_dir / "static" / "js").mkdir(parents=True)
+    (build_dir / "static" / "js" / "main.1a2b3c4d.js").write_bytes(BUNDLE)
+    (build_dir / "index.html").write_text('<div id="root"></div>' * 40)
+    (build_dir / "favicon.ico").write_bytes(bytes(range(256)) * 4)
+
+    builder = SpiralFrontendBuilder()
+    builder.build_dir = build_dir
+    builder.static_dir = build_dir / "static"
+    builder.budget_file = tmp_path / "bundle-budget.json"
+    builder.baseline_file = tmp_path / "bundle-baseline.json"
+    return builder
+
+
+def write_budget(builder, max_gzip_kb, max_growth_percent=10):
+    builder.budget_file.write_text(json.dumps({
+        "max_growth_percent": max_growth_percent,
+        "budgets": [{"pattern": "static/js/*.js", "max_gzip_kb": max_gzip_kb}],
+    }))
+
+
+def test_precompression_writes_siblings_and_manifest(builder):
+    assert builder.precompress_assets()
+
+    bundle = builder.static_dir / "js" / "main.1a2b3c4d.js"
+    assert gzip.decompress((bundle.parent / (bundle.name + ".gz")).read_bytes()) == BUNDLE
+    assert not (builder.build_dir / "favicon.ico.gz").exists()
+
+    manifest = json.loads((builder.build_dir / ASSET_MANIFEST).read_text())
+    entry = manifest["assets"]["static/js/main.1a2b3c4d.js"]
+    assert entry["size"] == len(BUNDLE) and entry["type"] == "text/javascript"
+    assert entry["encodings"]["gzip"] < len(BUNDLE)
+    assert "main.1a2b3c4d.js.gz" not in json.dumps(manifest)
+
+
+def test_budget_fails_when_over_limit_or_grown(builder):
+    builder.precompress_assets()
+
+    write_budget(builder, max_gzip_kb=0.1)
+    assert not builder.check_bundle_budget()
+    assert not builder.baseline_file.exists()
+
+    write_budget(builder, max_gzip_kb=500)
+    assert builder.check_bundle_budget()
+    report = builder.manifest["budget"][0]
+    assert report["ok"] and report["files"] == 1
+    assert json.loads(builder.baseline_file.read_text()) == {"static/js/*.js": report["gzip_kb"]}
+
+    # Later builds - including post-processing only - compare against the committed baseline
+    (builder.static_dir / "js" / "787.9f8e7d6c.chunk.js").write_bytes(BUNDLE + b"// more\n" * 50)
+    builder.precompress_assets()
+    assert not builder.check_bundle_budget(update_baseline=True)
+    assert builder.manifest["budget"][0]["baseline_gzip_kb"] == report["gzip_kb"]
+
+    # A failed build leaves the baseline alone, so re-running still fails
+    assert json.loads(builder.baseline_file.read_text()) == {"static/js/*.js": report["gzip_kb"]}
+    builder.precompress_assets()
+    assert not builder.check_bundle_budget()
+
+
+def test_budget_growth_is_accepted_by_updating_the_baseline(builder):
+    write_budget(builder, max_gzip_kb=500, max_growth_percent=1000)
+    builder.precompress_assets()
+    builder.check_bundle_budget()
+    baseline = builder.baseline_file.read_text()
+
+    (builder.static_dir / "js" / "787.9f8e7d6c.chunk.js").write_bytes(BUNDLE + b"// more\n" * 50)
+    builder.precompress_assets()
+    assert builder.check_bundle_budget()
+    assert builder.baseline_file.read_text() == baseline
+    assert builder.check_bundle_budget(update_baseline=True)
+    assert json.loads(builder.baseline_file.read_text())["static/js/*.js"] == builder.manifest["budget"][0]["gzip_kb"]
+
+
+def test_launcher_serves_build_time_siblings_without_compressing(builder, monkeypatch):
+    builder.precompress_assets()
+
+    def no_runtime_compression(self):
+        raise AssertionError(f"{self.relative} compressed at startup")
+    monkeypatch.setattr(launcher.StaticAsset, "_compress", no_runtime_compression)
+
+    assets = launcher.FrontendAssets(builder.build_dir)
+    bundle = assets.assets["static/js/main.1a2b3c4d.js"]
+
+    assert "static/js/main.1a2b3c4d.js.gz" not in assets.assets
+    assert gzip.decompress(bundle.variants["gzip"]) == BUNDLE
@@ -0,0 +1,117 @@
+"""
+SIRAJ Educational AI - Request Hedging Tests
+===========================================
+
+Streams that miss the p90 time-to-first-token are duplicated on another
+instance; the first to answer wins and the budget caps extra load.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.hedging import RequestHedger
+from backend.main import OllamaEducationalClient
+from backend.ollama_http import AsyncOllamaClient
+from backend.response_cache import ResponseCache
+from fake_ollama import FakeOllama
+
+MODEL = "gemma3n:e4b"
+
+
+def warmed_hedger(alternate, ttft=0.02, **options):
+    hedger = RequestHedger([alternate.client()], min_delay=0.01, **options)
+    for _ in range(hedger.min_samples):
+        hedger.ttft.add(ttft)
+    return hedger
+
+
+async def stream_text(hedger, primary):
+    def open_stream(client):
+        return client.chat_stream(model=MODEL, messages=[{"role": "user", "content": "Q"}])
+
+    chunks = [chunk async for chunk in hedger.stream(open_stream, primary.client())]
+    return "".join(chunk["message"]["content"] for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_until_ttft_is_known():
+    hedger = RequestHedger([FakeOllama().client()])
+    slow = FakeOllama(response_text="slow", model_delays={MODEL: 0.05})
+
+    assert hedger.hedge_delay() is None
+    assert await stream_text(hedger, slow) == "slow"
+    assert hedger.hedged == 0 and len(hedger.ttft) == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_loses_to_hedge_and_is_cancelled():
+    slow = FakeOllama(response_text="slow answer", model_delays={MODEL: 1.0})
+    fast = FakeOllama(response_text="fast answer")
+    hedger = warmed_hedger(fast)
+
+    assert await stream_text(hedger, slow) == "fast answer"
+    await asyncio.sleep(0.01)
+
+    assert (hedger.hedged, hedger.hedge_wins) == (1, 1)
+    assert slow.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_loser_is_cancelled_while_winner_still_streams():
+    slow = FakeOllama(response_text="slow answer", model_delays={MODEL: 5.0})
+    fast = FakeOllama(response_text="one two three four five six", token_delay=0.05)
+
+    async with slow.serve() as slow_port, fast.serve() as fast_port:
+        hedger = RequestHedger([AsyncOllamaClient(f"http://127.0.0.1:{fast_port}")], min_delay=0.01)
+        for _ in range(hedger.min_samples):
+            hedger.ttft.add(0.02)
+        primary = AsyncOllamaClient(f"http://127.0.0.1:{slow_port}")
+
+        def open_stream(client):
+            return client.chat_stream(model=MODEL, messages=[{"role": "user", "content": "Q"}])
+
+        chunks = hedger.stream(open_stream, primary)
+        await chunks.__anext__()
+        await asyncio.sleep(0.05)
+        slow_during, fast_during = slow.in_flight, fast.in_flight
+        rest = [chunk async for chunk in chunks]
+        await primary.aclose()
+        await hedger.aclose()
+
+    assert (slow_during, fast_during) == (0, 1)
+    assert hedger.hedge_wins == 1 and rest[-1]["done"]
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    fast_alternate = FakeOllama(response_text="alternate")
+    hedger = warmed_hedger(fast_alternate, ttft=0.5)
+
+    assert await stream_text(hedger, FakeOllama(response_text="primary")) == "primary"
+    assert hedger.hedged == 0 and not fast_alternate.requests
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_hedges():
+    fast = FakeOllama(response_text="fast")
+    hedger = warmed_hedger(fast, budget=0.0)
+    slow = FakeOllama(response_text="slow", model_delays={MODEL: 0.1})
+
+    results = [await stream_text(hedger, slow) for _ in range(3)]
+
+    assert results == ["fast", "slow", "slow"]
+    assert hedger.hedged == 1 and hedger.budget_exhausted == 2
+
+
+@pytest.mark.asyncio
+async def test_archetype_generation_uses_hedger():
+    slow = FakeOllama(response_text="slow answer", model_delays={MODEL: 1.0, "gemma3n:e2b": 1.0})
+    fast = FakeOllama(response_text="fast answer")
+    client = OllamaEducationalClient(client=slow.client(), response_cache=ResponseCache(),
+                                     hedger=warmed_hedger(fast, budget=1.0))
+    client.ollama_available = True
+
+    assert await client.generate_archetype_response("socratic", "Tides") == "fast answer"
+    assert "".join([t async for t in client.stream_archetype_response("analyst", "Tides")]) == "fast answer"
+    assert client.hedger.hedge_wins == 2
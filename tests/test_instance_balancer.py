@@ -0,0 +1,96 @@
+"""
+SIRAJ Educational AI - Instance Balancer Tests
+=============================================
+
+Least-outstanding routing across Ollama instances, affinity as a
+tie-breaker, and ejection/re-admission of unhealthy instances.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.backend_router import MultiInstanceClient, MultiInstanceCouncil
+from backend.instance_balancer import InstanceBalancer, OllamaInstance, parse_instances
+from backend.ollama_http import AsyncOllamaClient, OllamaHTTPError
+from fake_ollama import FakeOllama
+
+
+def make_balancer(*fakes, **options):
+    instances = [
+        OllamaInstance(f"Gemma_Instance_{name}", f"http://{name.lower()}.test", fake.client())
+        for name, fake in zip("ABC", fakes)
+    ]
+    return InstanceBalancer(instances, health_interval=0, **options)
+
+
+def unreachable_client():
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+    return AsyncOllamaClient("http://down.test", transport=httpx.MockTransport(refuse))
+
+
+def test_affinity_breaks_ties_between_idle_instances():
+    balancer = make_balancer(FakeOllama(), FakeOllama())
+
+    assert balancer.pick("socratic").name == "Gemma_Instance_A"
+    assert balancer.pick("mentor").name == "Gemma_Instance_B"
+
+    balancer.instances[1].in_flight = 1
+    assert balancer.pick("mentor").name == "Gemma_Instance_A"
+
+
+@pytest.mark.asyncio
+async def test_load_spreads_across_instances_despite_affinity():
+    fakes = FakeOllama(token_delay=0.005), FakeOllama(token_delay=0.005)
+    client = MultiInstanceClient(balancer=make_balancer(*fakes))
+
+    results = await asyncio.gather(*(client.generate("Q", "socratic") for _ in range(8)))
+
+    assert {r["instance"] for r in results} == {"Gemma_Instance_A", "Gemma_Instance_B"}
+    assert len(fakes[0].requests) == len(fakes[1].requests) == 4
+    assert all(i.ewma_latency for i in client.balancer.instances)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_instance_is_ejected_and_readmitted_after_probe():
+    broken, healthy = FakeOllama(fail_with=500), FakeOllama()
+    balancer = make_balancer(broken, healthy, eject_after=2)
+
+    for _ in range(2):
+        with pytest.raises(OllamaHTTPError):
+            async with balancer.lease("socratic") as instance:
+                await instance.client.generate(model="gemma3n:e4b", prompt="Q")
+
+    assert not balancer.instances[0].healthy and balancer.ejections == 1
+    assert balancer.pick("socratic").name == "Gemma_Instance_B"
+
+    broken.fail_with = None
+    await balancer.probe()
+    assert balancer.instances[0].healthy
+    assert balancer.pick("socratic").name == "Gemma_Instance_A"
+
+
+@pytest.mark.asyncio
+async def test_probe_ejects_unreachable_instance():
+    instances = [OllamaInstance("A", "http://down.test", unreachable_client()),
+                 OllamaInstance("B", "http://b.test", FakeOllama().client())]
+    balancer = InstanceBalancer(instances, health_interval=0, eject_after=1)
+
+    await balancer.probe()
+
+    assert balancer.stats()["healthy"] == 1
+    council = MultiInstanceCouncil(MultiInstanceClient(balancer=balancer))
+    result = await council.create_council_response("Q", ["socratic", "mentor"])
+    assert {r["instance"] for r in result["responses"].values()} == {"B"}
+
+
+def test_parse_instances():
+    instances = parse_instances("Gemma_Instance_A=http://localhost:11434, http://localhost:11435,")
+
+    assert [(i.name, i.url) for i in instances] == [
+        ("Gemma_Instance_A", "http://localhost:11434"),
+        ("Gemma_Instance_B", "http://localhost:11435"),
+    ]
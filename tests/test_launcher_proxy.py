@@ -0,0 +1,180 @@
+"""
+SIRAJ Educational AI - Launcher Proxy Tests
+==========================================
+
+The port-3000 launcher app as a streaming reverse proxy: bodies, headers
+and status codes pass through untouched, SSE chunks arrive as they are
+produced, WebSockets are relayed, and an unreachable backend degrades to
+demo mode.
+"""
+
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+import uvicorn
+import websockets
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import Response, StreamingResponse
+
+from launcher import IntegratedEducationalCodexLauncher
+
+
+def stub_backend(release: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        response = Response(body, status_code=201, media_type="application/octet-stream",
+                            headers={"x-backend": "stub", "x-query": request.url.query})
+        response.set_cookie("theme", "dark")
+        response.set_cookie("grade", "middle")
+        return response
+
+    @app.get("/api/stream")
+    async def stream():
+        async def events():
+            yield b"data: first\n\n"
+            await release.wait()
+            yield b"data: second\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/council/missing")
+    async def missing():
+        return Response('{"detail": "nope"}', status_code=404, media_type="application/json")
+
+    @app.websocket("/ws/council/{session_id}")
+    async def council_ws(websocket: WebSocket, session_id: str):
+        await websocket.accept()
+        while True:
+            message = await websocket.receive_text()
+            if message == "bye":
+                await websocket.close(code=4001)
+                return
+            await websocket.send_text(f"{session_id}:{websocket.url.query}:{message}")
+
+    return app
+
+
+@asynccontextmanager
+async def serving(app: FastAPI, lifespan: str = "off"):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan=lifespan))
+    task = asyncio.ensure_future(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield sock.getsockname()[1]
+    finally:
+        server.should_exit = True
+        await task
+        sock.close()
+
+
+@asynccontextmanager
+async def proxied(backend_url):
+    launcher = IntegratedEducationalCodexLauncher()
+    launcher.backend_url = backend_url
+    launcher.frontend_build_dir = Path("/nonexistent")
+    async with serving(launcher.create_integrated_frontend_app(), lifespan="on") as port:
+        yield port
+
+
+@pytest_asyncio.fixture
+async def proxy_port():
+    release = asyncio.Event()
+    async with serving(stub_backend(release)) as backend_port:
+        async with proxied(f"http://127.0.0.1:{backend_port}") as port:
+            yield port, release
+
+
+@pytest.mark.asyncio
+async def test_bodies_headers_and_status_pass_through(proxy_port):
+    port, _ = proxy_port
+    payload = bytes(range(256)) * 4096  # 1 MiB, not JSON
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        echoed = await client.post("/api/echo?grade=middle", content=payload)
+        missing = await client.get("/council/missing")
+
+    assert echoed.status_code == 201 and echoed.content == payload
+    assert echoed.headers["x-backend"] == "stub" and echoed.headers["x-query"] == "grade=middle"
+    assert echoed.headers["content-type"] == "application/octet-stream"
+    assert [c.split(";")[0] for c in echoed.headers.get_list("set-cookie")] == ["theme=dark", "grade=middle"]
+    assert missing.status_code == 404 and missing.json() == {"detail": "nope"}
+
+
+@pytest.mark.asyncio
+async def test_sse_chunks_are_forwarded_as_they_arrive(proxy_port):
+    port, release = proxy_port
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        async with client.stream("GET", "/api/stream") as response:
+            chunks = response.aiter_raw()
+            # The backend holds the second event until the first reached the client
+            first = await asyncio.wait_for(chunks.__anext__(), timeout=2)
+            release.set()
+            rest = b"".join([chunk async for chunk in chunks])
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert first == b"data: first\n\n" and rest == b"data: second\n\n"
+
+
+@pytest.mark.asyncio
+async def test_websocket_frames_and_close_code_are_relayed(proxy_port):
+    port, _ = proxy_port
+
+    async with websockets.connect(f"ws://127.0.0.1:{port}/ws/council/s1?tab=2") as ws:
+        await ws.send("hello")
+        reply = await ws.recv()
+        await ws.send("bye")
+        with pytest.raises(websockets.exceptions.ConnectionClosed):
+            await ws.recv()
+
+    assert reply == "s1:tab=2:hello"
+    assert ws.close_code == 4001
+
+
+@pytest.mark.asyncio
+async def test_unreachable_backend_falls_back_to_demo_mode():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        dead_port = sock.getsockname()[1]
+
+    async with proxied(f"http://127.0.0.1:{dead_port}") as port:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            health = (await client.get("/health")).json()
+            query = await client.post("/api/education/query", json={"topic": "Tides"})
+            council = await client.get("/council/status")
+        with pytest.raises(websockets.exceptions.InvalidStatus):
+            await websockets.connect(f"ws://127.0.0.1:{port}/ws/council/s1")
+
+    assert health["mode"] == "demo"
+    assert query.status_code == 200 and query.json()["degraded_mode"] is True
+    assert council.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_backend_dropping_the_query_still_gets_the_demo_answer():
+    async def read_then_hang_up(reader, writer):
+        # Let httpx send the whole request body, then drop the connection
+        await reader.read(65536)
+        writer.close()
+
+    server = await asyncio.start_server(read_then_hang_up, "127.0.0.1", 0)
+    backend_port = server.sockets[0].getsockname()[1]
+    try:
+        async with proxied(f"http://127.0.0.1:{backend_port}") as port:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+                query = await client.post("/api/education/query", json={"topic": "Tides"})
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert query.status_code == 200 and query.json()["degraded_mode"] is True
@@ -0,0 +1,71 @@
+"""
+SIRAJ Educational AI - Launcher Readiness Tests
+==============================================
+
+Readiness is signalled rather than polled: the backend's stdout ready line,
+backoff connect probes as a fallback, and uvicorn's own startup for the
+in-process frontend server.
+"""
+
+import asyncio
+import socket
+import sys
+import time
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+from launcher import IntegratedEducationalCodexLauncher, ReadySignalServer, wait_for_port
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_connect_probe_notices_a_late_listener_promptly():
+    port = free_port()
+
+    async def listen_later():
+        await asyncio.sleep(0.2)
+        return await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", port)
+
+    started = time.monotonic()
+    listener = asyncio.ensure_future(listen_later())
+    assert await wait_for_port("127.0.0.1", port, timeout=5)
+    elapsed = time.monotonic() - started
+    (await listener).close()
+
+    assert elapsed < 0.2 + 0.5  # at most one maximum backoff step late
+    assert not await wait_for_port("127.0.0.1", free_port(), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_server_signals_ready_once_listening():
+    server = ReadySignalServer(uvicorn.Config(FastAPI(), host="127.0.0.1", port=free_port(),
+                                              log_level="warning", lifespan="off"))
+    task = asyncio.ensure_future(server.serve())
+
+    await asyncio.wait_for(server.ready.wait(), timeout=5)
+    assert await wait_for_port("127.0.0.1", server.config.port, timeout=0.1)
+
+    server.should_exit = True
+    await task
+
+
+@pytest.mark.asyncio
+async def test_backend_ready_line_resolves_and_output_keeps_draining():
+    launcher = IntegratedEducationalCodexLauncher()
+    script = "print('booting'); print('SIRAJ_BACKEND_READY port=8000', flush=True); print('serving')"
+    launcher.backend_process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script, stdout=asyncio.subprocess.PIPE)
+    ready_line = asyncio.get_running_loop().create_future()
+
+    await launcher._read_backend_output(ready_line)
+    await launcher.backend_process.wait()
+
+    assert ready_line.result() == "SIRAJ_BACKEND_READY port=8000"
+    assert list(launcher.backend_output) == ["booting", "SIRAJ_BACKEND_READY port=8000", "serving"]
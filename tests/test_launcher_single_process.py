@@ -0,0 +1,102 @@
+"""
+SIRAJ Educational AI - Launcher Single-Process Tests
+===================================================
+
+With the backend app loaded in-process, backend paths are dispatched to it
+directly (no proxy hop), its lifespan runs inside the launcher's, and the
+frontend build is still served for everything else.
+"""
+
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+import uvicorn
+import websockets
+from fastapi import FastAPI, Request, WebSocket
+
+from launcher import IntegratedEducationalCodexLauncher, is_backend_path
+
+INDEX = b"<!doctype html><html><body><div id='root'></div></body></html>"
+
+
+@asynccontextmanager
+async def serving(app: FastAPI):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="on"))
+    task = asyncio.ensure_future(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield sock.getsockname()[1]
+    finally:
+        server.should_exit = True
+        await task
+        sock.close()
+
+
+def stub_backend(events: list) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "mode": "in-process"}
+
+    @app.post("/api/echo")
+    async def echo(request: Request):
+        return {"echo": (await request.body()).decode()}
+
+    @app.websocket("/ws/council/{session_id}")
+    async def council_ws(websocket: WebSocket, session_id: str):
+        await websocket.accept()
+        await websocket.send_text(f"{session_id}:{await websocket.receive_text()}")
+        await websocket.close()
+
+    return app
+
+
+@pytest.fixture
+def launcher(tmp_path):
+    (tmp_path / "index.html").write_bytes(INDEX)
+    launcher = IntegratedEducationalCodexLauncher()
+    launcher.frontend_build_dir = tmp_path
+    return launcher
+
+
+@pytest.mark.asyncio
+async def test_backend_paths_reach_the_in_process_app(launcher):
+    events = []
+    launcher.backend_app = stub_backend(events)
+
+    async with serving(launcher.create_integrated_frontend_app()) as port:
+        assert events == ["startup"]
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            health = (await client.get("/health")).json()
+            echoed = (await client.post("/api/echo", content="tides")).json()
+            page = await client.get("/learn/volcanoes")
+        async with websockets.connect(f"ws://127.0.0.1:{port}/ws/council/s1") as ws:
+            await ws.send("hello")
+            reply = await ws.recv()
+
+    assert health["mode"] == "in-process"
+    assert echoed["echo"] == "tides"
+    assert page.content == INDEX
+    assert reply == "s1:hello"
+    assert events == ["startup", "shutdown"]
+
+
+def test_backend_path_matching():
+    assert is_backend_path("/health") and is_backend_path("/api/education/query")
+    assert is_backend_path("/council/status") and is_backend_path("/ws/council/s1")
+    assert is_backend_path("/metrics")
+    assert not is_backend_path("/healthz") and not is_backend_path("/static/js/main.js")
+    assert not is_backend_path("/apiary") and not is_backend_path("/")
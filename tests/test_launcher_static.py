@@ -0,0 +1,111 @@
+"""
+SIRAJ Educational AI - Launcher Static Asset Tests
+=================================================
+
+The launcher's in-memory frontend manifest: encoding negotiation, immutable
+caching of hashed bundles, strong ETags with 304s, and the SPA fallback.
+"""
+
+import gzip
+import json
+import socket
+
+import httpx
+import pytest
+
+from launcher import IntegratedEducationalCodexLauncher, negotiate_encoding
+
+brotli = pytest.importorskip("brotli")
+
+BUNDLE = b"export const council = ['socratic', 'mentor'];\n" * 200
+INDEX = b"<!doctype html><html><body><div id='root'></div></body></html>"
+
+
+@pytest.fixture
+def frontend_app(tmp_path):
+    (tmp_path / "static" / "js").mkdir(parents=True)
+    (tmp_path / "static" / "js" / "main.1a2b3c4d.js").write_bytes(BUNDLE)
+    (tmp_path / "index.html").write_bytes(INDEX)
+    (tmp_path / "favicon.ico").write_bytes(bytes(range(256)))
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        dead_port = sock.getsockname()[1]
+
+    launcher = IntegratedEducationalCodexLauncher()
+    launcher.frontend_build_dir = tmp_path
+    launcher.backend_url = f"http://127.0.0.1:{dead_port}"
+    return launcher.create_integrated_frontend_app()
+
+
+async def fetch(app, path, **headers):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://launcher.test") as client:
+            # Leave the body encoded so the test sees exactly what was sent
+            request = client.build_request("GET", path, headers={"accept-encoding": "identity", **headers})
+            response = await client.send(request, stream=True)
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+            return response, body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept, encoding, decode", [
+    ("gzip, deflate, br", "br", brotli.decompress),
+    ("gzip;q=1.0, br;q=0", "gzip", gzip.decompress),
+    ("identity", None, bytes),
+])
+async def test_hashed_bundle_served_in_negotiated_encoding(frontend_app, accept, encoding, decode):
+    response, body = await fetch(frontend_app, "/static/js/main.1a2b3c4d.js", **{"accept-encoding": accept})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert decode(body) == BUNDLE
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["content-type"].startswith("text/javascript")
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_returns_304_per_encoding(frontend_app):
+    br, _ = await fetch(frontend_app, "/static/js/main.1a2b3c4d.js", **{"accept-encoding": "br"})
+    plain, _ = await fetch(frontend_app, "/static/js/main.1a2b3c4d.js")
+
+    assert br.headers["etag"] != plain.headers["etag"]
+    revalidated, body = await fetch(frontend_app, "/static/js/main.1a2b3c4d.js",
+                              **{"accept-encoding": "br", "if-none-match": br.headers["etag"]})
+    stale, _ = await fetch(frontend_app, "/static/js/main.1a2b3c4d.js",
+                        **{"accept-encoding": "br", "if-none-match": plain.headers["etag"]})
+
+    assert revalidated.status_code == 304 and body == b""
+    assert stale.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_spa_fallback_and_missing_bundles(frontend_app, tmp_path):
+    (tmp_path / "index.html").write_bytes(b"changed on disk after startup")
+
+    route, route_body = await fetch(frontend_app, "/learn/volcanoes/session/42")
+    _, root_body = await fetch(frontend_app, "/")
+    missing, _ = await fetch(frontend_app, "/static/js/main.deadbeef.js")
+    icon, _ = await fetch(frontend_app, "/favicon.ico", **{"accept-encoding": "gzip"})
+
+    assert route_body == root_body == INDEX
+    assert route.headers["cache-control"] == "no-cache"
+    assert missing.status_code == 404
+    assert "content-encoding" not in icon.headers
+    assert "Accept-Encoding" not in icon.headers.get("vary", "")
+
+
+@pytest.mark.asyncio
+async def test_proxy_routes_are_not_shadowed_by_the_frontend(frontend_app):
+    _, body = await fetch(frontend_app, "/health")
+
+    assert json.loads(body)["mode"] == "demo"
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("br;q=0.5, gzip", {"br", "gzip"}) == "gzip"
+    assert negotiate_encoding("*", {"gzip"}) == "gzip"
+    assert negotiate_encoding("*, gzip;q=0", {"gzip"}) is None
+    assert negotiate_encoding("", {"br", "gzip"}) is None
@@ -0,0 +1,134 @@
+"""
+SIRAJ Educational AI - Council Metrics Tests
+===========================================
+
+Latency, throughput, cache and fallback instrumentation recorded during
+real council runs against the fake Ollama server, Ollama's per-call timings
+on council responses, the /metrics exposition and the percentiles reported
+by /health.
+"""
+
+import httpx
+import pytest
+
+import backend.main as backend_main
+from backend.main import EducationalQueryRequest
+from backend.metrics import CouncilMetrics, prometheus_export_enabled, tokens_per_second
+from fake_ollama import FakeOllama, make_council
+
+ARCHETYPES = ["socratic", "mentor"]
+
+
+@pytest.mark.asyncio
+async def test_council_run_records_latency_throughput_and_cache_hits():
+    council = make_council(FakeOllama(response_text="one two three four five", eval_rate=25),
+                           metrics=CouncilMetrics(export=True))
+    request = EducationalQueryRequest(topic="Tides", selected_archetypes=ARCHETYPES)
+
+    await council.process_educational_query(request)
+    await council.process_educational_query(request)
+    summary = council.ollama_client.metrics.summary()
+
+    assert set(summary["archetype_response_seconds"]) == set(ARCHETYPES)
+    assert summary["archetype_response_seconds"]["socratic"]["count"] == 1
+    assert summary["synthesis_seconds"]["count"] == 2
+    assert summary["queue_wait_seconds"]["count"] == 4  # two archetypes, two syntheses
+    assert summary["tokens_per_second"]["p50"] == pytest.approx(25, rel=0.01)
+    assert summary["cache_hits"] == 2
+    assert summary["generations_in_flight"] == 0
+
+    exposition = council.ollama_client.metrics.render().decode()
+    assert 'siraj_archetype_generation_seconds_count{archetype="socratic",model="gemma3n:e4b"} 1.0' in exposition
+    assert 'siraj_response_cache_hits_total{archetype="mentor"} 1.0' in exposition
+    assert "siraj_tokens_per_second_bucket" in exposition
+
+
+@pytest.mark.asyncio
+async def test_streamed_archetypes_record_time_to_first_token():
+    council = make_council(FakeOllama(response_text="alpha beta gamma"),
+                           metrics=CouncilMetrics(export=True))
+    request = EducationalQueryRequest(topic="Volcanoes", selected_archetypes=ARCHETYPES)
+
+    [event async for event in council.stream_educational_query(request)]
+    summary = council.ollama_client.metrics.summary()
+
+    assert summary["time_to_first_token_seconds"]["count"] == 2
+    assert summary["tokens_per_second"]["count"] == 3  # two archetypes and the synthesis
+
+
+@pytest.mark.asyncio
+async def test_ollama_timings_attached_per_archetype_and_summed():
+    council = make_council(FakeOllama(response_text="one two three four", eval_rate=8),
+                           metrics=CouncilMetrics(export=True))
+    request = EducationalQueryRequest(topic="Erosion", selected_archetypes=ARCHETYPES)
+
+    response = await council.process_educational_query(request)
+    cached = await council.process_educational_query(request)
+
+    socratic = response.council_responses["socratic"].timings
+    assert socratic.eval_count == 4 and socratic.eval_duration == 500_000_000
+    assert socratic.prompt_eval_count > 0 and socratic.generations == 1
+    assert response.timings.generations == 2
+    assert response.timings.eval_count == 8 and response.timings.eval_duration == 1_000_000_000
+    assert cached.council_responses["socratic"].timings is None and cached.timings is None
+    assert council.ollama_client.metrics.summary()["ollama_phase_seconds"]["eval"]["p50"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_streamed_council_carries_timings():
+    council = make_council(FakeOllama(response_text="alpha beta"),
+                           metrics=CouncilMetrics(export=True))
+    request = EducationalQueryRequest(topic="Volcanoes", selected_archetypes=ARCHETYPES)
+
+    events = [event async for event in council.stream_educational_query(request)]
+    completed = [e["response"] for e in events if e["type"] == "archetype_complete"]
+    session = events[-1]["response"]
+
+    assert all(r["timings"]["eval_count"] == 2 for r in completed)
+    assert all(r["response"] == "alpha beta" for r in completed)
+    assert session["timings"]["generations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fallbacks_are_counted_by_reason():
+    council = make_council(FakeOllama(),
+                           metrics=CouncilMetrics(export=True))
+    council.ollama_client.ollama_available = False
+
+    await council.process_educational_query(EducationalQueryRequest(topic="Fractions", selected_archetypes=ARCHETYPES))
+
+    assert council.ollama_client.metrics.summary()["fallbacks"] == {"ollama_unavailable": 3}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_and_health_percentiles(monkeypatch):
+    council = make_council(FakeOllama(),
+                           metrics=CouncilMetrics(export=True))
+    monkeypatch.setattr(backend_main, "educational_council", council)
+    await council.process_educational_query(EducationalQueryRequest(topic="Tides", selected_archetypes=ARCHETYPES))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=backend_main.app), base_url="http://test") as client:
+        exposition = await client.get("/metrics")
+        health = (await client.get("/health")).json()
+        council.ollama_client.metrics = CouncilMetrics(export=False)
+        disabled = await client.get("/metrics")
+
+    assert exposition.status_code == 200 and exposition.headers["content-type"].startswith("text/plain")
+    assert "siraj_sessions 1.0" in exposition.text
+    assert health["metrics"]["archetype_response_seconds"]["mentor"]["count"] == 1
+    assert health["metrics"]["synthesis_seconds"]["p90"] > 0
+    assert disabled.status_code == 404
+
+
+def test_export_follows_multi_instance_conf(tmp_path):
+    conf = tmp_path / "multi-instance.conf"
+    # export_prometheus is the router's own server on metrics_port, not the backend's /metrics
+    conf.write_text("[monitoring]\nenable_metrics = true\nexport_prometheus = false\n")
+    assert prometheus_export_enabled(str(conf))
+
+    conf.write_text("[monitoring]\nenable_metrics = false\n")
+    assert not prometheus_export_enabled(str(conf))
+    assert prometheus_export_enabled(str(tmp_path / "missing.conf"))
+    assert not CouncilMetrics(export=False).enabled
+    assert tokens_per_second({"eval_count": 40, "eval_duration": 2_000_000_000}) == 20
+    assert tokens_per_second({"eval_count": 0}) is None
@@ -0,0 +1,77 @@
+"""
+SIRAJ Educational AI - Model Tiering Tests
+=========================================
+
+Cheap archetypes and loaded periods use the lightweight model, synthesis
+stays on the primary model, and primary-model timeouts fall back.
+"""
+
+import pytest
+
+from backend.main import EducationalQueryRequest
+from backend.model_router import ModelRouter
+from backend.scheduler import OllamaScheduler
+from fake_ollama import FakeOllama, make_council
+
+PRIMARY, LIGHT = "gemma3n:e4b", "gemma3n:e2b"
+
+
+def test_cheap_archetypes_use_lightweight_model_until_load():
+    scheduler = OllamaScheduler()
+    router = ModelRouter(PRIMARY, LIGHT, scheduler, lightweight_archetypes={"mentor"},
+                         queue_threshold=3, p95_threshold=2.0)
+
+    assert router.archetype_model("mentor") == LIGHT
+    assert router.archetype_model("socratic") == PRIMARY
+    assert router.synthesis_model() == PRIMARY
+
+    for _ in range(10):
+        router.record_latency(PRIMARY, 2.5)
+    assert router.under_load()
+    assert router.archetype_model("socratic") == LIGHT
+    assert router.synthesis_model() == PRIMARY
+
+
+def test_queue_depth_triggers_tiering():
+    scheduler = OllamaScheduler()
+    router = ModelRouter(PRIMARY, LIGHT, scheduler, lightweight_archetypes=set(), queue_threshold=2)
+    scheduler._slots_for(PRIMARY).queued = 2
+
+    assert router.archetype_model("analyst") == LIGHT
+
+
+def test_tiering_disabled_when_models_match():
+    router = ModelRouter(PRIMARY, PRIMARY, OllamaScheduler(), lightweight_archetypes={"mentor"})
+
+    assert router.archetype_model("mentor") == PRIMARY
+    assert router.timeout_for(PRIMARY) is None
+
+
+@pytest.mark.asyncio
+async def test_council_routes_archetypes_and_keeps_synthesis_on_primary():
+    fake = FakeOllama()
+    council = make_council(fake, router_options={"lightweight_archetypes": {"mentor", "storyteller"}})
+
+    await council.process_educational_query(EducationalQueryRequest(
+        topic="Fractions", selected_archetypes=["socratic", "mentor"]))
+
+    archetype_models = {r["model"] for r in fake.requests[:2]}
+    assert archetype_models == {PRIMARY, LIGHT}
+    assert fake.requests[-1]["model"] == PRIMARY
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming", [False, True])
+async def test_primary_timeout_falls_back_to_lightweight(streaming):
+    fake = FakeOllama(response_text="quick answer", model_delays={PRIMARY: 1.0})
+    council = make_council(fake, router_options={"lightweight_archetypes": set(), "primary_timeout": 0.1})
+    client = council.ollama_client
+
+    if streaming:
+        text = "".join([t async for t in client.stream_archetype_response("analyst", "Fractions")])
+    else:
+        text = await client.generate_archetype_response("analyst", "Fractions")
+
+    assert text == "quick answer"
+    assert [r["model"] for r in fake.requests] == [PRIMARY, LIGHT]
+    assert client.router.stats()["timeout_fallbacks"] == 1
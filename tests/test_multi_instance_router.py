@@ -0,0 +1,122 @@
+"""
+SIRAJ Educational AI - Multi-Instance Router Tests
+=================================================
+
+The port-5000 router against fake Ollama instances served on localhost:
+archetype mapping, round robin, failover, response caching and metrics.
+"""
+
+import socket
+
+import httpx
+import pytest
+
+from backend.multi_instance_router import MultiInstanceRouter, RouterSettings, create_app
+from fake_ollama import FakeOllama
+
+CONF = """
+[instances]
+instance_a_port = {port_a}
+instance_a_name = Gemma_Instance_A
+instance_a_archetypes = socratic,constructivist,storyteller
+instance_b_port = {port_b}
+instance_b_name = Gemma_Instance_B
+instance_b_archetypes = synthesizer,challenger,mentor,analyst
+
+[router]
+health_check_interval = 0
+
+[performance]
+cache_responses = {cache}
+
+[failover]
+failover_timeout = 1
+max_retry_attempts = 2
+"""
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def router_client(port_a, port_b, cache=False):
+    settings = RouterSettings.from_string(CONF.format(port_a=port_a, port_b=port_b, cache=str(cache).lower()))
+    router = MultiInstanceRouter(settings)
+    transport = httpx.ASGITransport(app=create_app(router, serve_metrics=False))
+    return router, httpx.AsyncClient(transport=transport, base_url="http://router.test")
+
+
+def test_default_conf_parses():
+    settings = RouterSettings.load()
+
+    assert [(i.name, i.url) for i in settings.instances] == [
+        ("Gemma_Instance_A", "http://127.0.0.1:11434"),
+        ("Gemma_Instance_B", "http://127.0.0.1:11435"),
+    ]
+    assert settings.port == 5000 and settings.metrics_port == 9090
+    assert settings.max_retry_attempts == 2 and settings.cache_responses is False
+
+
+@pytest.mark.asyncio
+async def test_archetypes_follow_mapping_and_unmapped_queries_rotate():
+    fake_a, fake_b = FakeOllama(response_text="from A"), FakeOllama(response_text="from B")
+    async with fake_a.serve() as port_a, fake_b.serve() as port_b:
+        router, client = router_client(port_a, port_b)
+        async with client:
+            socratic = (await client.post("/api/query", json={"prompt": "Q", "archetype": "socratic"})).json()
+            mentor = (await client.post("/api/query", json={"prompt": "Q", "archetype": "mentor"})).json()
+            rotated = [(await client.post("/api/query", json={"prompt": f"Q{i}"})).json()["instance"]
+                       for i in range(4)]
+        await router.stop()
+
+    assert (socratic["instance"], socratic["response"]) == ("Gemma_Instance_A", "from A")
+    assert (mentor["instance"], mentor["response"]) == ("Gemma_Instance_B", "from B")
+    assert sorted(rotated) == ["Gemma_Instance_A"] * 2 + ["Gemma_Instance_B"] * 2
+
+
+@pytest.mark.asyncio
+async def test_dead_instance_fails_over_and_reports_degraded_health():
+    fake_b = FakeOllama(response_text="from B")
+    async with fake_b.serve() as port_b:
+        router, client = router_client(free_port(), port_b)
+        async with client:
+            result = (await client.post("/api/query", json={"prompt": "Q", "archetype": "socratic"})).json()
+            await router.probe()
+            health = (await client.get("/api/health")).json()
+            status = (await client.get("/api/status")).json()
+        await router.stop()
+
+    assert result["instance"] == "Gemma_Instance_B" and result["attempts"] == 2
+    assert health["status"] == "degraded"
+    assert health["instances"]["Gemma_Instance_A"]["healthy"] is False
+    assert status["failovers"] == 1
+    assert b'siraj_router_failovers_total 1.0' in router.metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_all_instances_down_returns_503():
+    router, client = router_client(free_port(), free_port())
+    async with client:
+        response = await client.post("/api/query", json={"prompt": "Q", "archetype": "mentor"})
+    await router.stop()
+
+    assert response.status_code == 503
+    assert len(response.json()["detail"]["attempts"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_responses_serves_repeats_without_ollama():
+    fake_a, fake_b = FakeOllama(), FakeOllama()
+    async with fake_a.serve() as port_a, fake_b.serve() as port_b:
+        router, client = router_client(port_a, port_b, cache=True)
+        async with client:
+            payload = {"prompt": "Explain photosynthesis", "archetype": "socratic"}
+            first = (await client.post("/api/query", json=payload)).json()
+            second = (await client.post("/api/query", json=payload)).json()
+        await router.stop()
+
+    assert first["cached"] is False and second["cached"] is True
+    assert len(fake_a.requests) == 1
+    assert b"siraj_router_cache_hits_total 1.0" in router.metrics.render()
@@ -0,0 +1,69 @@
+"""
+SIRAJ Educational AI - Async Ollama Client Tests
+===============================================
+
+Exercises the pooled async Ollama client against the in-process fake server.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.ollama_http import OllamaHTTPError
+from fake_ollama import FakeOllama
+
+
+@pytest.mark.asyncio
+async def test_generate_returns_full_body():
+    fake = FakeOllama(response_text="Photosynthesis turns light into sugar.")
+    client = fake.client()
+
+    data = await client.generate(model="gemma3n:e4b", prompt="Explain", system="You are a mentor",
+                                 options={"temperature": 0.7})
+
+    assert data["response"] == "Photosynthesis turns light into sugar."
+    assert fake.requests[0]["stream"] is False
+    assert fake.requests[0]["system"] == "You are a mentor"
+    assert fake.requests[0]["options"] == {"temperature": 0.7}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_yields_tokens_until_done():
+    fake = FakeOllama(response_text="one two three")
+    client = fake.client()
+
+    chunks = [chunk async for chunk in client.generate_stream(model="gemma3n:e4b", prompt="Count")]
+
+    assert "".join(c["response"] for c in chunks) == "one two three"
+    assert chunks[-1]["done"] is True
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises_ollama_error():
+    client = FakeOllama(fail_with=500).client()
+
+    with pytest.raises(OllamaHTTPError):
+        await client.generate(model="gemma3n:e4b", prompt="Explain")
+    with pytest.raises(OllamaHTTPError):
+        async for _ in client.generate_stream(model="gemma3n:e4b", prompt="Explain"):
+            pass
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generations_share_one_pool():
+    fake = FakeOllama(token_delay=0.01)
+    client = fake.client()
+
+    results = await asyncio.gather(*[
+        client.generate(model="gemma3n:e4b", prompt=f"Question {i}") for i in range(7)
+    ])
+
+    assert len(results) == 7
+    assert fake.max_in_flight == 7
+    pool_client = client.http
+    await client.generate(model="gemma3n:e4b", prompt="Again")
+    assert client.http is pool_client
+    await client.aclose()
@@ -0,0 +1,66 @@
+"""
+SIRAJ Educational AI - Prompt Prefix Reuse Tests
+===============================================
+
+Archetype prompts keep a byte-stable prefix so Ollama's KV cache is reused.
+The fake Ollama server models prompt evaluation per uncached token, which
+makes the saving measurable without a real model.
+"""
+
+import pytest
+
+from backend.main import EDUCATIONAL_ARCHETYPES
+from backend.prompt_assembly import ArchetypePromptBuilder
+from fake_ollama import FakeOllama
+
+TOPICS = ["Photosynthesis", "Fractions", "Plate tectonics", "The water cycle", "Newton's laws"]
+
+
+def legacy_messages(config, prompt, context):
+    """Archetype prompt layout before prefix reuse (variable context first)"""
+    return [
+        {"role": "system", "content": config["system_prompt"]},
+        {"role": "user", "content": f"""Context: {context}
+
+Student Question/Topic: {prompt}
+
+Please respond as the {config['name']} archetype, following your role as {config['role']}.
+
+Your approach: {config['approach']}
+
+Provide a helpful educational response that embodies your teaching personality."""},
+    ]
+
+
+async def prompt_eval_tokens(fake, build_messages):
+    client = fake.client()
+    config = EDUCATIONAL_ARCHETYPES["socratic"]
+    total = 0
+    for topic in TOPICS:
+        context = f"Grade level: middle\nTopic: {topic}"
+        response = await client.chat(model="gemma3n:e4b", messages=build_messages(config, topic, context))
+        total += response["prompt_eval_count"]
+    await client.aclose()
+    return total
+
+
+def test_prefix_is_byte_stable_and_variable_parts_come_last():
+    builder = ArchetypePromptBuilder()
+    config = EDUCATIONAL_ARCHETYPES["mentor"]
+
+    first = builder.messages(config, "Fractions", "Grade level: middle")
+    second = builder.messages(config, "Tides", "Grade level: high")
+
+    assert first[0] == second[0]
+    assert builder.system(config) is builder.system(config)
+    assert first[-1]["content"].endswith("Context: Grade level: middle")
+
+
+@pytest.mark.asyncio
+async def test_stable_prefix_reduces_prompt_evaluation():
+    builder = ArchetypePromptBuilder()
+
+    legacy = await prompt_eval_tokens(FakeOllama(), legacy_messages)
+    assembled = await prompt_eval_tokens(FakeOllama(), builder.messages)
+
+    assert assembled < legacy * 0.6
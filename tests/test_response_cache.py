@@ -0,0 +1,115 @@
+"""
+SIRAJ Educational AI - Response Cache Tests
+==========================================
+
+Exact and near-duplicate lookups, eviction, and the council skipping Ollama
+for repeated classroom questions.
+"""
+
+import pytest
+
+from backend.main import EducationalQueryRequest
+from backend.response_cache import ResponseCache, generation_key
+from fake_ollama import FakeOllama, make_council
+
+OPTIONS = {"temperature": 0.7}
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    cache = ResponseCache()
+    cache.put("socratic", "gemma3n:e4b", "Explain photosynthesis", "cached", "Grade Level: middle", OPTIONS)
+
+    assert cache.get("socratic", "gemma3n:e4b", "explain   PHOTOSYNTHESIS", "Grade Level: middle", OPTIONS) == "cached"
+    assert cache.stats()["exact_hits"] == 1
+
+
+@pytest.mark.parametrize("cached_topic, asked_topic", [
+    ("What is 2+2?", "What is 2-2?"),
+    ("What is 2+2?", "What is 2*2?"),
+    ("x^2 + 1", "x 2 - 1"),
+    ("Teach me C++", "Teach me C#"),
+])
+@pytest.mark.parametrize("similarity_threshold", [0, 0.5])
+def test_topics_differing_only_by_an_operator_never_share_an_answer(cached_topic, asked_topic, similarity_threshold):
+    cache = ResponseCache(similarity_threshold=similarity_threshold)
+    cache.put("analyst", "m", cached_topic, "cached")
+
+    assert cache.get("analyst", "m", asked_topic) is None
+    assert generation_key("analyst", "m", cached_topic) != generation_key("analyst", "m", asked_topic)
+
+
+def test_near_duplicate_topic_hits_above_threshold():
+    cache = ResponseCache(similarity_threshold=0.8)
+    cache.put("mentor", "m", "explain photosynthesis", "cached", "Grade Level: middle")
+
+    assert cache.get("mentor", "m", "Can you please explain photosynthesis", "Grade Level: middle") == "cached"
+    assert cache.get("mentor", "m", "photosynthesis in algae", "Grade Level: middle") is None
+    assert cache.stats()["near_hits"] == 1 and cache.stats()["misses"] == 1
+
+
+@pytest.mark.parametrize("cached_topic, asked_topic", [
+    ("causes of World War 1", "causes of World War 2"),
+    ("What is 12 x 13?", "What is 12 x 14?"),
+    ("history of France", "history of Frances"),
+])
+def test_near_duplicate_requires_the_same_words_and_numbers(cached_topic, asked_topic):
+    cache = ResponseCache(similarity_threshold=0.5)
+    cache.put("mentor", "m", cached_topic, "cached", "Grade Level: middle")
+
+    assert cache.get("mentor", "m", asked_topic, "Grade Level: middle") is None
+    assert cache.stats()["near_hits"] == 0
+
+
+def test_near_duplicate_matching_off_by_default():
+    cache = ResponseCache()
+    cache.put("mentor", "m", "explain photosynthesis", "cached")
+
+    assert cache.get("mentor", "m", "Can you please explain photosynthesis") is None
+    assert cache.get("mentor", "m", "Explain photosynthesis!") is None
+    assert cache.get("mentor", "m", "EXPLAIN  photosynthesis") == "cached"
+
+
+def test_partition_must_match_exactly():
+    cache = ResponseCache()
+    cache.put("mentor", "m", "volcanoes", "cached", "Grade Level: middle", OPTIONS)
+
+    assert cache.get("analyst", "m", "volcanoes", "Grade Level: middle", OPTIONS) is None
+    assert cache.get("mentor", "other-model", "volcanoes", "Grade Level: middle", OPTIONS) is None
+    assert cache.get("mentor", "m", "volcanoes", "Grade Level: high", OPTIONS) is None
+    assert cache.get("mentor", "m", "volcanoes", "Grade Level: middle", {"temperature": 0.1}) is None
+
+
+def test_lru_and_ttl_eviction():
+    now = [0.0]
+    cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.put("mentor", "m", "tides", "1")
+    cache.put("mentor", "m", "volcanoes", "2")
+    cache.get("mentor", "m", "tides")
+    cache.put("mentor", "m", "fractions", "3")
+
+    assert cache.get("mentor", "m", "volcanoes") is None
+    assert cache.stats()["evictions"] == 1
+    now[0] = 11
+    assert cache.get("mentor", "m", "tides") is None
+    assert cache.get("mentor", "m", "fractions") is None
+
+
+@pytest.mark.asyncio
+async def test_council_answers_repeat_questions_from_cache():
+    fake = FakeOllama(response_text="Plants turn light into sugar.")
+    council = make_council(fake, response_cache=ResponseCache(similarity_threshold=0.8))
+
+    def ask(topic, bypass=False):
+        return council.process_educational_query(EducationalQueryRequest(
+            topic=topic, selected_archetypes=["socratic", "mentor"], bypass_cache=bypass))
+
+    await ask("Explain photosynthesis")
+    assert len(fake.requests) == 3  # two archetypes + synthesis
+
+    repeat = await ask("explain photosynthesis please!")
+    assert len(fake.requests) == 4  # synthesis only
+    assert repeat.council_responses["mentor"].response == "Plants turn light into sugar."
+
+    await ask("Explain photosynthesis", bypass=True)
+    assert len(fake.requests) == 7
+    assert council.ollama_client.response_cache.stats()["bypasses"] == 2
@@ -0,0 +1,129 @@
+"""
+SIRAJ Educational AI - Scheduler Tests
+=====================================
+
+Per-model slot limits, priority ordering, queue shedding and the 429/503
+responses built on top of them.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import backend.main as backend_main
+from backend.main import EducationalCouncil, OllamaEducationalClient
+from backend.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    OllamaScheduler,
+    RollingPercentiles,
+    SchedulerOverloaded,
+)
+from fake_ollama import FakeOllama
+
+
+@pytest.mark.asyncio
+async def test_slots_are_limited_per_model():
+    scheduler = OllamaScheduler(num_parallel=2, max_queue=10)
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    async def generate(model):
+        async with scheduler.slot(model):
+            active[model] += 1
+            peak[model] = max(peak[model], active[model])
+            await asyncio.sleep(0.01)
+            active[model] -= 1
+
+    await asyncio.gather(*(generate(m) for m in ["a"] * 5 + ["b"] * 5))
+
+    assert peak == {"a": 2, "b": 2}
+    assert scheduler.stats()["admitted"] == 10
+    assert scheduler.stats()["queue_wait_seconds"]["interactive"]["count"] == 10
+
+
+@pytest.mark.asyncio
+async def test_interactive_work_is_served_before_background():
+    scheduler = OllamaScheduler(num_parallel=1, max_queue=10)
+    order = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("m"):
+            await release.wait()
+
+    async def generate(name, priority):
+        async with scheduler.slot("m", priority):
+            order.append(name)
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiting = [asyncio.ensure_future(generate("curriculum", PRIORITY_BACKGROUND)),
+               asyncio.ensure_future(generate("student-1", PRIORITY_INTERACTIVE)),
+               asyncio.ensure_future(generate("student-2", PRIORITY_INTERACTIVE))]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *waiting)
+
+    assert order == ["student-1", "student-2", "curriculum"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_and_long_waits_are_shed():
+    scheduler = OllamaScheduler(num_parallel=1, max_queue=1, max_queue_wait=0.05)
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("m"):
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(scheduler.slot("m").__aenter__())
+    await asyncio.sleep(0)
+
+    with pytest.raises(SchedulerOverloaded) as shed:
+        async with scheduler.slot("m"):
+            pass
+    assert shed.value.retry_after >= 1
+
+    with pytest.raises(SchedulerOverloaded):
+        await queued
+    assert scheduler.stats()["rejected"] == 1 and scheduler.stats()["timeouts"] == 1
+    release.set()
+    await holder
+    assert scheduler.stats()["models"]["m"]["active"] == 0
+
+
+def test_rolling_percentiles():
+    percentiles = RollingPercentiles(window=100)
+    for value in range(1, 101):
+        percentiles.add(value / 100)
+
+    assert percentiles.summary() == {"count": 100, "p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+@pytest.mark.asyncio
+async def test_query_endpoint_sheds_with_retry_after(monkeypatch):
+    council = EducationalCouncil()
+    council.ollama_client = OllamaEducationalClient(
+        client=FakeOllama().client(), scheduler=OllamaScheduler(num_parallel=1, max_queue=0)
+    )
+    council.ollama_client.ollama_available = True
+    monkeypatch.setattr(backend_main, "educational_council", council)
+    transport = httpx.ASGITransport(app=backend_main.app)
+    payload = {"topic": "Tides", "selected_archetypes": ["mentor"]}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        council.running_sessions = council.max_sessions
+        at_capacity = await client.post("/api/education/query", json=payload)
+
+        council.running_sessions = 0
+        council.ollama_client.scheduler.queued = 1
+        queue_full = await client.post("/api/education/query/stream", json=payload)
+
+    assert at_capacity.status_code == 429
+    assert int(at_capacity.headers["Retry-After"]) >= 1
+    assert queue_full.status_code == 503
+    assert "retry_after" in queue_full.json()
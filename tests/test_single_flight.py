@@ -0,0 +1,127 @@
+"""
+SIRAJ Educational AI - Single-Flight Coalescing Tests
+====================================================
+
+Identical concurrent council queries share one set of Ollama generations,
+for buffered futures and streamed tokens alike.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.main import EducationalQueryRequest, OllamaEducationalClient
+from backend.response_cache import ResponseCache
+from backend.single_flight import SingleFlight
+from fake_ollama import FakeOllama, make_council
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_future():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert results == ["answer"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "shared": 4}
+
+
+@pytest.mark.asyncio
+async def test_shared_work_survives_until_last_caller_leaves():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    second = asyncio.ensure_future(flight.do("k", work))
+    await started.wait()
+    first.cancel()
+
+    assert await second == "done"
+
+    lonely = asyncio.ensure_future(flight.do("other", work))
+    await asyncio.sleep(0.01)
+    lonely.cancel()
+    await asyncio.sleep(0.01)
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_to_late_subscribers_and_propagates_errors():
+    flight = SingleFlight()
+
+    async def tokens():
+        for token in ["a", "b", "c"]:
+            await asyncio.sleep(0.01)
+            yield token
+        raise RuntimeError("model crashed")
+
+    async def collect():
+        seen = []
+        with pytest.raises(RuntimeError):
+            async for token in flight.stream("k", tokens):
+                seen.append(token)
+        return seen
+
+    early = asyncio.ensure_future(collect())
+    await asyncio.sleep(0.025)
+    late = asyncio.ensure_future(collect())
+
+    assert await early == await late == ["a", "b", "c"]
+    assert flight.stats()["started"] == 1
+
+
+@pytest.mark.asyncio
+async def test_classroom_of_identical_queries_generates_once():
+    fake = FakeOllama(response_text="Plants make food from light", token_delay=0.005)
+    council = make_council(fake)
+    request = EducationalQueryRequest(topic="Photosynthesis", selected_archetypes=["socratic", "mentor"])
+
+    responses = await asyncio.gather(*(council.process_educational_query(request) for _ in range(20)))
+
+    assert len(fake.requests) == 3  # two archetypes + one synthesis
+    assert len({r.session_id for r in responses}) == 20
+    assert all(r.synthesis == "Plants make food from light" for r in responses)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response_cache", [ResponseCache(), None])
+async def test_questions_differing_by_an_operator_are_not_coalesced(response_cache):
+    fake = FakeOllama(token_delay=0.005)
+    client = OllamaEducationalClient(client=fake.client(), response_cache=response_cache)
+    client.ollama_available = True
+
+    await asyncio.gather(*(client.generate_archetype_response("analyst", topic)
+                           for topic in ["What is 2+2?", "What is 2-2?", "What is 2*2?"]))
+
+    assert len(fake.requests) == 3
+    assert client.inflight.stats()["shared"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_share_token_generation():
+    fake = FakeOllama(response_text="Plants make food from light", token_delay=0.005)
+    council = make_council(fake)
+    request = EducationalQueryRequest(topic="Photosynthesis", selected_archetypes=["mentor"])
+
+    async def run():
+        return [event async for event in council.stream_educational_query(request)]
+
+    first, second = await asyncio.gather(run(), run())
+
+    assert len(fake.requests) == 2  # one archetype stream + one synthesis stream
+    for events in (first, second):
+        text = "".join(e["chunk"] for e in events if e["type"] == "archetype_chunk")
+        assert text == "Plants make food from light"
+        assert events[-1]["type"] == "session_complete"
@@ -122,16 +122,16 @@ class TestEducationalArchetypes:
 class TestOllamaEducationalClient:
     """Test Ollama client integration and archetype response generation"""
     
-    @patch('backend.main.ollama.Client')
-    async def test_generate_archetype_response_egolessness(self, mock_ollama_class):
+    @pytest.mark.asyncio
+    async def test_generate_archetype_response_egolessness(self):
         """Test archetype response generation serves learning (QWAN: Egolessness)"""
         # Setup mock
         mock_client = Mock()
-        mock_client.generate = Mock(return_value={"response": "Socratic response: What do you think causes plants to grow?"})
-        mock_ollama_class.return_value = mock_client
+        mock_client.chat = AsyncMock(return_value={"message": {"content": "Socratic response: What do you think causes plants to grow?"}})
         
         from backend.main import OllamaEducationalClient
-        client = OllamaEducationalClient()
+        client = OllamaEducationalClient(client=mock_client)
+        client.ollama_available = True
         
         response = await client.generate_archetype_response(
             "socratic", 
@@ -141,24 +141,25 @@ class TestOllamaEducationalClient:
         
         assert "What do you think" in response
         assert len(response) > 20
-        mock_client.generate.assert_called_once()
+        mock_client.chat.assert_called_once()
     
-    @patch('backend.main.ollama.Client')
-    async def test_archetype_response_error_handling_eternity(self, mock_ollama_class):
+    @pytest.mark.asyncio
+    async def test_archetype_response_error_handling_eternity(self):
         """Test graceful error handling for system longevity (QWAN: Eternity)"""
         # Setup mock to raise exception
         mock_client = Mock()
-        mock_client.generate = Mock(side_effect=Exception("Connection failed"))
-        mock_ollama_class.return_value = mock_client
+        mock_client.chat = AsyncMock(side_effect=Exception("Connection failed"))
         
         from backend.main import OllamaEducationalClient
-        client = OllamaEducationalClient()
+        client = OllamaEducationalClient(client=mock_client)
+        client.ollama_available = True
         
         response = await client.generate_archetype_response("socratic", "Test question", "")
         
-        # Should return graceful error message, not crash
-        assert "having trouble responding" in response
-        assert "try again" in response
+        # Should fall back to the archetype's offline response, not crash
+        assert "Test question" in response
+        assert "demonstration response" in response
+        assert client.metrics.summary()["fallbacks"] == {"generation_failed": 1}
 
 class TestEducationalCouncil:
     """Test the core educational council orchestration"""
@@ -300,8 +301,8 @@ class TestHomeworkSubmissionProcessing:
 class TestCurriculumAlignment:
     """Test curriculum alignment functionality"""
     
-    @patch('backend.extended_endpoints.educational_council.ollama_client.generate_archetype_response')
-    @patch('backend.extended_endpoints.educational_council.ollama_client.client.generate')
+    @patch('backend.extended_endpoints.educational_council.ollama_client.generate_archetype_response', new_callable=AsyncMock)
+    @patch('backend.extended_endpoints.educational_council.ollama_client.client.generate', new_callable=AsyncMock)
     def test_curriculum_alignment_generation(self, mock_generate, mock_archetype, client):
         """Test curriculum alignment generation"""
         # Setup mocks
@@ -551,11 +552,12 @@ class TestErrorHandlingResilience:
             # Should return appropriate error status, not crash
             assert response.status_code in [400, 422, 500]
     
-    @patch('backend.main.ollama.Client')
-    def test_ollama_connection_failure_resilience(self, mock_ollama_class, client):
+    @patch.object(educational_council.ollama_client, 'ollama_available', True)
+    @patch('backend.main.educational_council.ollama_client.client.list_models', new_callable=AsyncMock)
+    def test_ollama_connection_failure_resilience(self, mock_list_models, client):
         """Test system resilience when Ollama connection fails"""
         # Mock Ollama failure
-        mock_ollama_class.side_effect = Exception("Connection refused")
+        mock_list_models.side_effect = Exception("Connection refused")
         
         response = client.get("/health")
         # System should report unhealthy but not crash